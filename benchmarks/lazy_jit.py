@@ -0,0 +1,33 @@
+"""
+Compares the time to the first call of a single function of a large module, compiled eagerly and lazily by `RyonJIT`.
+
+Usage:
+    python -m benchmarks.lazy_jit [functions]
+"""
+
+import sys
+import time
+
+from benchmarks.programs import ProgramGenerator
+from ryon.compiler import CodegenTarget, OptimizationLevel, RyonJIT
+from ryon.parser import RyonParser
+
+
+def time_to_first_call(hlir, lazy: bool) -> float:
+    start = time.perf_counter()
+    functions = RyonJIT(CodegenTarget.host(OptimizationLevel.O2)).compile(hlir, lazy=lazy)
+    functions["function_0"](1, 2, 3, 4)
+    return time.perf_counter() - start
+
+
+def main(functions: int = 2000) -> None:
+    hlir = RyonParser().parse_hlir(ProgramGenerator(functions=functions).module())
+
+    eager = time_to_first_call(hlir, lazy=False)
+    lazy = time_to_first_call(hlir, lazy=True)
+    print(f"{functions} functions, time to first call: eager {eager * 1e3:9.2f} ms  lazy {lazy * 1e3:9.2f} ms")
+    print(f"speedup: {eager / lazy:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
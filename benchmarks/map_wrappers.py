@@ -0,0 +1,46 @@
+"""
+Compares calling a compiled function once per element through ctypes with a single call of its map wrapper.
+
+Usage:
+    python -m benchmarks.map_wrappers [elements]
+"""
+
+import array
+import sys
+import time
+from typing import Any
+
+from ryon.compiler import CodegenTarget, OptimizationLevel, RyonJIT
+from ryon.parser import RyonParser
+
+SOURCE = "fn add(a: I32, b: I32) -> I32:\n    return a + b\n"
+REPEAT = 5
+
+
+def best_of(function) -> float:
+    elapsed = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed)
+
+
+def main(elements: int = 1_000_000) -> None:
+    # A callable with a `map` attribute, see `RyonJIT`.
+    add: Any = RyonJIT(CodegenTarget.host(OptimizationLevel.O2)).compile(RyonParser().parse_hlir(SOURCE))["add"]
+    a = array.array("i", range(elements))
+    b = array.array("i", range(elements))
+    out = array.array("i", bytes(4 * elements))
+    assert add.map(a, b, out=out) == array.array("i", map(add, a, b))
+
+    scalar_time = best_of(lambda: array.array("i", map(add, a, b)))
+    map_time = best_of(lambda: add.map(a, b, out=out))
+    print(
+        f"{elements} elements: per element {scalar_time / elements * 1e9:7.2f} ns/element  "
+        f"map {map_time / elements * 1e9:7.2f} ns/element  speedup {scalar_time / map_time:7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
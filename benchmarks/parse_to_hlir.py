@@ -0,0 +1,48 @@
+"""
+Compares the two-step parse -> transform path with the fused `RyonParser.parse_hlir`.
+
+Usage:
+    python -m benchmarks.parse_to_hlir [functions]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.programs import ProgramGenerator
+from ryon.hlir.hlir import HLIRTransformer
+from ryon.parser import RyonParser
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, int]:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main(functions: int = 5000) -> None:
+    source = ProgramGenerator(functions=functions).module()
+    parser = RyonParser()
+    transformer = HLIRTransformer()
+
+    assert parser.parse_hlir(source) == transformer.transform(parser.parse(source))
+
+    two_step_time, two_step_peak = measure(lambda: transformer.transform(parser.parse(source)))
+    fused_time, fused_peak = measure(lambda: parser.parse_hlir(source))
+
+    print(f"source: {functions} functions, {len(source)} bytes")
+    print(f"two-step: {two_step_time:8.3f} s  peak {two_step_peak / 2**20:8.1f} MiB")
+    print(f"fused:    {fused_time:8.3f} s  peak {fused_peak / 2**20:8.1f} MiB")
+    print(f"speedup:  {two_step_time / fused_time:8.2f}x  memory {two_step_peak / fused_peak:8.2f}x less")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,236 @@
+"""
+Times and memory-profiles each stage of the compile pipeline on a generated module, and stores the results as JSON.
+
+Stages run in order, each on the output of the previous one: `RyonParser.parse`, `HLIRTransformer`, `RyonSymbolizer`,
+`RyonCompiler`, LLVM parsing and verification, the optimization pipeline (skipped at O0) and object code generation.
+Times are the best of `--repeat` runs. Memory is the peak of the Python allocations of each stage over what it
+started with, measured by `tracemalloc` in a separate run; the memory LLVM allocates natively is not traced.
+
+Usage:
+    python -m benchmarks.pipeline [--functions N] [--arity N] [--sum-width N] [--types I32,I64] [--opt-level O2]
+    python -m benchmarks.pipeline --compare results/old.json results/new.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import llvmlite.binding as llvm
+
+from benchmarks.programs import ProgramGenerator
+from benchmarks.visitor_dispatch import collect_nodes
+from ryon.compiler import CodegenTarget, OptimizationLevel, RyonCompiler
+from ryon.compiler.optimizer import optimize
+from ryon.hlir.hlir import HLIRTransformer
+from ryon.parser import RyonParser
+from ryon.symbols.symbols import RyonSymbolizer
+
+RESULTS_FORMAT = 1
+RESULTS_DIR = Path(__file__).parent / "results"
+
+Stage = tuple[str, Callable[[Any], Any]]
+
+
+def stages(opt_level: OptimizationLevel) -> list[Stage]:
+    """Returns the stages of the pipeline, each is called with the output of the previous one."""
+    parser = RyonParser()
+    target = CodegenTarget.host(opt_level)
+    target_machine = target.create_target_machine()
+
+    def symbolize(hlir):
+        RyonSymbolizer().visit(hlir, iterative=True)
+        return hlir
+
+    def verify(ir_text):
+        llvm_module = llvm.parse_assembly(ir_text)
+        llvm_module.verify()
+        return llvm_module
+
+    def optimize_module(llvm_module):
+        optimize(llvm_module, opt_level, target_machine)
+        return llvm_module
+
+    pipeline: list[Stage] = [
+        ("parse", parser.parse),
+        ("transform", HLIRTransformer().transform),
+        ("symbolize", symbolize),
+        ("compile", lambda hlir: RyonCompiler().visit(hlir, iterative=True)),
+        ("verify", verify),
+    ]
+    if opt_level is not OptimizationLevel.O0:
+        pipeline.append(("optimize", optimize_module))
+    pipeline.append(("codegen", target_machine.emit_object))
+    return pipeline
+
+
+def run_timed(pipeline: list[Stage], source: str) -> dict[str, float]:
+    seconds = {}
+    value: Any = source
+    for name, stage in pipeline:
+        start = time.perf_counter()
+        value = stage(value)
+        seconds[name] = time.perf_counter() - start
+    return seconds
+
+
+def run_traced(pipeline: list[Stage], source: str) -> dict[str, int]:
+    peaks = {}
+    value: Any = source
+    tracemalloc.start()
+    try:
+        for name, stage in pipeline:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            value = stage(value)
+            peaks[name] = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def benchmark(generator: ProgramGenerator, opt_level: OptimizationLevel, repeat: int) -> dict[str, Any]:
+    """
+    Runs the pipeline on the module generated by `generator`.
+
+    Returns:
+        dict: The results, see `main` for their layout.
+    """
+    source = generator.module()
+    pipeline = stages(opt_level)
+
+    runs = [run_timed(pipeline, source) for _ in range(repeat)]
+    peaks = run_traced(pipeline, source)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "environment": environment(),
+        "parameters": {
+            "functions": generator.functions,
+            "arity": generator.arity,
+            "sum_width": generator.sum_width,
+            "types": list(generator.types),
+            "seed": generator.seed,
+            "opt_level": opt_level.name,
+            "repeat": repeat,
+        },
+        "program": {
+            "source_bytes": len(source),
+            "hlir_nodes": len(collect_nodes(RyonParser().parse_hlir(source))),
+        },
+        "stages": {
+            name: {
+                "seconds": min(run[name] for run in runs),
+                "runs": [run[name] for run in runs],
+                "peak_bytes": peaks[name],
+            }
+            for name, _ in pipeline
+        },
+    }
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "llvm": ".".join(map(str, llvm.llvm_version_info)),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpu": llvm.get_host_cpu_name(),
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: dict[str, Any]) -> None:
+    parameters, program = results["parameters"], results["program"]
+    print(
+        f"{parameters['functions']} functions, arity {parameters['arity']}, sum width {parameters['sum_width']}, "
+        f"{parameters['opt_level']}: {program['source_bytes']} bytes, {program['hlir_nodes']} HLIR nodes"
+    )
+    total = sum(stage["seconds"] for stage in results["stages"].values())
+    for name, stage in results["stages"].items():
+        print(
+            f"  {name:10} {stage['seconds'] * 1e3:10.2f} ms {stage['seconds'] / total:7.1%}"
+            f"  peak {stage['peak_bytes'] / 2**20:8.2f} MiB"
+        )
+    print(f"  {'total':10} {total * 1e3:10.2f} ms")
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> None:
+    """Prints the time and memory ratios of the stages of two results, below 1 is an improvement."""
+    if old["parameters"] != new["parameters"]:
+        print(f"warning: different parameters {old['parameters']} and {new['parameters']}")
+    print(f"{old['environment']['commit'] or '?':.10} -> {new['environment']['commit'] or '?':.10}")
+    for name, new_stage in new["stages"].items():
+        old_stage = old["stages"].get(name)
+        if old_stage is None:
+            print(f"  {name:10} new")
+            continue
+        print(
+            f"  {name:10} time {old_stage['seconds'] * 1e3:10.2f} -> {new_stage['seconds'] * 1e3:10.2f} ms"
+            f" ({new_stage['seconds'] / old_stage['seconds']:5.2f}x)"
+            f"  peak {old_stage['peak_bytes'] / 2**20:8.2f} -> {new_stage['peak_bytes'] / 2**20:8.2f} MiB"
+            f" ({new_stage['peak_bytes'] / max(old_stage['peak_bytes'], 1):5.2f}x)"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Runs the benchmark and writes its results to `--output`, by default `results/pipeline-<commit>.json` next to this
+    file. The results hold the `environment` of the run (commit, versions, CPU), its `parameters`, the size of the
+    generated `program` and, for each stage, the best time in `seconds`, the times of all the `runs` and the
+    `peak_bytes` of Python memory.
+    """
+    argument_parser = argparse.ArgumentParser(prog="python -m benchmarks.pipeline", description=__doc__.split("\n")[1])
+    argument_parser.add_argument("--functions", type=int, default=1000)
+    argument_parser.add_argument("--arity", type=int, default=4)
+    argument_parser.add_argument("--sum-width", type=int, default=8)
+    argument_parser.add_argument("--types", default="I32", help="comma separated types the functions are drawn from")
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--opt-level", choices=[level.name for level in OptimizationLevel], default="O0")
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--output", type=Path, help="where to write the JSON results")
+    argument_parser.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"), help="compare two results")
+    arguments = argument_parser.parse_args(argv)
+
+    if arguments.compare:
+        old, new = (json.loads(path.read_text()) for path in arguments.compare)
+        compare(old, new)
+        return
+
+    generator = ProgramGenerator(
+        functions=arguments.functions,
+        arity=arguments.arity,
+        sum_width=arguments.sum_width,
+        types=tuple(arguments.types.split(",")),
+        seed=arguments.seed,
+    )
+    results = benchmark(generator, OptimizationLevel[arguments.opt_level], arguments.repeat)
+    print_results(results)
+
+    output = arguments.output
+    if output is None:
+        output = RESULTS_DIR / f"pipeline-{(results['environment']['commit'] or 'unknown')[:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
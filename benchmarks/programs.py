@@ -0,0 +1,89 @@
+"""Synthetic ryon programs for benchmarking the compile pipeline."""
+
+import random
+
+
+class ProgramGenerator:
+    """
+    Generates ryon modules by expanding the rules of `ryon/parser/main.lark`, each method expands the rule it is named
+    after.
+
+    The size of the modules is set by the number of functions, their arity and the width of their summations, the
+    choices left open by the grammar, the types of the functions and whether an addend is a number literal or a
+    variable, are drawn from a seeded random generator, so a configuration always yields the same module.
+
+    Number literals are compiled as `I32`, so they only appear in `I32` functions.
+    """
+
+    def __init__(
+        self,
+        functions: int = 1000,
+        arity: int = 4,
+        sum_width: int = 8,
+        types: tuple[str, ...] = ("I32",),
+        seed: int = 0,
+    ):
+        """
+        Args:
+            functions: Number of function definitions.
+            arity: Number of arguments of each function.
+            sum_width: Number of addends of the returned expressions, a single addend is returned as it is.
+            types: Types the functions are drawn from, all the arguments and the return value of a function share it.
+            seed: Seed of the random choices.
+        """
+        if sum_width < 1:
+            raise ValueError("Summations need at least one addend")
+        if arity == 0 and set(types) != {"I32"}:
+            raise ValueError("Functions without arguments can only return I32 literals")
+        self.functions = functions
+        self.arity = arity
+        self.sum_width = sum_width
+        self.types = types
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    def module(self) -> str:
+        self._random.seed(self.seed)
+        return "\n".join(self.function_definition(index) for index in range(self.functions))
+
+    def function_definition(self, index: int) -> str:
+        type_name = self.simple_type()
+        args = [f"arg_{i}" for i in range(self.arity)]
+        return (
+            f"fn {self.snake_case_name('function', index)}({self.function_arguments(args, type_name)}) -> {type_name}:"
+            f"\n{self.suite(args, type_name)}"
+        )
+
+    def function_arguments(self, args: list[str], type_name: str) -> str:
+        return ", ".join(f"{arg}: {type_name}" for arg in args)
+
+    def suite(self, args: list[str], type_name: str) -> str:
+        return f"    {self.return_statement(args, type_name)}\n"
+
+    def return_statement(self, args: list[str], type_name: str) -> str:
+        return f"return {self.expression(args, type_name)}"
+
+    def expression(self, args: list[str], type_name: str) -> str:
+        return self.summation(args, type_name) if self.sum_width > 1 else self.addend(args, type_name)
+
+    def summation(self, args: list[str], type_name: str) -> str:
+        return " + ".join(self.addend(args, type_name) for _ in range(self.sum_width))
+
+    def addend(self, args: list[str], type_name: str) -> str:
+        if not args or (type_name == "I32" and self._random.random() < 0.5):
+            return self.number_literal()
+        return self.variable_identifier(args)
+
+    def variable_identifier(self, args: list[str]) -> str:
+        return self._random.choice(args)
+
+    def number_literal(self) -> str:
+        return str(self._random.randrange(1000))
+
+    def simple_type(self) -> str:
+        return self._random.choice(self.types)
+
+    @staticmethod
+    def snake_case_name(prefix: str, index: int) -> str:
+        # Digits are only allowed at the end of names.
+        return f"{prefix}_{index}"
@@ -0,0 +1,92 @@
+"""
+Compares linear and balanced pairwise lowering of wide integer summations.
+
+The benchmark calls the generated function in a native loop, feeding each result into the next call, so the time per
+call follows the critical path of the summation: N additions for the linear chain, log2(N) levels for the balanced
+tree.
+
+Usage:
+    python -m benchmarks.summation_reduction [sum_width] [calls]
+"""
+
+import ctypes
+import sys
+import time
+
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+from ryon.compiler import CodegenTarget, OptimizationLevel, RyonCompiler, RyonJIT
+from ryon.compiler.compiler import INTEGER
+from ryon.parser import RyonParser
+
+REPEAT = 5
+
+
+def generate_sum(sum_width: int) -> str:
+    """Generates `wide`, summing its `sum_width` distinct arguments, so LLVM cannot simplify the summation."""
+    args = [f"arg_{i}" for i in range(sum_width)]
+    signature = ", ".join(f"{arg}: I64" for arg in args)
+    return f"fn wide({signature}) -> I64:\n    return {' + '.join(args)}\n"
+
+
+def driver(sum_width: int) -> str:
+    """Builds `bench(n)`, calling `wide` n times with arguments derived from the previous result."""
+    i64 = ir.IntType(64)
+    module = ir.Module(name="driver")
+    wide = ir.Function(module, ir.FunctionType(i64, [i64] * sum_width), name="wide")
+    bench = ir.Function(module, ir.FunctionType(i64, [i64]), name="bench")
+
+    entry = bench.append_basic_block("entry")
+    loop = bench.append_basic_block("loop")
+    done = bench.append_basic_block("done")
+    builder = ir.IRBuilder(entry)
+    builder.branch(loop)
+
+    builder.position_at_end(loop)
+    counter = builder.phi(i64, name="counter")
+    accumulator = builder.phi(i64, name="accumulator")
+    result = builder.call(wide, [builder.add(accumulator, ir.Constant(i64, i)) for i in range(sum_width)])
+    next_counter = builder.add(counter, ir.Constant(i64, 1))
+    counter.add_incoming(ir.Constant(i64, 0), entry)
+    counter.add_incoming(next_counter, loop)
+    accumulator.add_incoming(ir.Constant(i64, 1), entry)
+    accumulator.add_incoming(result, loop)
+    builder.cbranch(builder.icmp_unsigned("<", next_counter, bench.args[0]), loop, done)
+
+    builder.position_at_end(done)
+    builder.ret(result)
+    return str(module)
+
+
+def measure(sum_width: int, compiler: RyonCompiler, opt_level: OptimizationLevel, calls: int) -> tuple[float, int]:
+    jit = RyonJIT(CodegenTarget.host(opt_level=opt_level), compiler=compiler)
+    jit.compile(RyonParser().parse_hlir(generate_sum(sum_width)))
+    jit.engine.add_module(llvm.parse_assembly(driver(sum_width)))
+    jit.engine.finalize_object()
+    bench = ctypes.CFUNCTYPE(ctypes.c_int64, ctypes.c_int64)(jit.engine.get_function_address("bench"))
+
+    # Best of several runs, the loop is short enough to be disturbed by the rest of the system.
+    elapsed = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = bench(calls)
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed), result
+
+
+def main(sum_width: int = 64, calls: int = 2_000_000) -> None:
+    print(f"sum of {sum_width} terms, {calls} dependent calls")
+    for opt_level in (OptimizationLevel.O0, OptimizationLevel.O2):
+        linear_time, linear_result = measure(sum_width, RyonCompiler(), opt_level, calls)
+        balanced_time, balanced_result = measure(sum_width, RyonCompiler(balanced_sums=(INTEGER,)), opt_level, calls)
+        assert linear_result == balanced_result
+
+        print(
+            f"{opt_level.name}: linear {linear_time / calls * 1e9:7.2f} ns/call  "
+            f"balanced {balanced_time / calls * 1e9:7.2f} ns/call  speedup {linear_time / balanced_time:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
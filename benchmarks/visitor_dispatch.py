@@ -0,0 +1,58 @@
+"""
+Measures the per-node cost of resolving visit methods: the former name mangling + `getattr` against the dispatch
+table of `Visitor`.
+
+Usage:
+    python -m benchmarks.visitor_dispatch [functions]
+"""
+
+import sys
+import timeit
+
+from benchmarks.programs import ProgramGenerator
+from ryon.compiler import RyonCompiler
+from ryon.hlir.nodes import HLIRNode
+from ryon.hlir.visitor import Visitor
+from ryon.parser import RyonParser
+
+
+def collect_nodes(node: HLIRNode) -> list[HLIRNode]:
+    nodes = []
+
+    class Collector(Visitor):
+        def __default__(self, node, parent_data, breadcrump):
+            nodes.append(node)
+
+    Collector().visit(node)
+    return nodes
+
+
+def main(functions: int = 2000) -> None:
+    hlir = RyonParser().parse_hlir(ProgramGenerator(functions=functions).module())
+    nodes = collect_nodes(hlir)
+    compiler = RyonCompiler()
+
+    def name_lookup():
+        for node in nodes:
+            getattr(compiler, compiler._camel_to_snake(node.__class__.__name__), compiler.__default__)
+
+    def table_lookup():
+        table = compiler._dispatch_table
+        for node in nodes:
+            method = table.get(node.__class__)
+            if method is None:
+                compiler._resolve_method(node.__class__)
+
+    repeat = 5
+    name_time = min(timeit.repeat(name_lookup, number=1, repeat=repeat)) / len(nodes)
+    table_time = min(timeit.repeat(table_lookup, number=1, repeat=repeat)) / len(nodes)
+    visit_time = min(timeit.repeat(lambda: RyonCompiler().visit(hlir), number=1, repeat=repeat)) / len(nodes)
+
+    print(f"nodes:        {len(nodes)}")
+    print(f"name lookup:  {name_time * 1e9:8.1f} ns/node")
+    print(f"table lookup: {table_time * 1e9:8.1f} ns/node ({name_time / table_time:.1f}x faster)")
+    print(f"compile:      {visit_time * 1e9:8.1f} ns/node")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
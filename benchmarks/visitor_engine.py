@@ -0,0 +1,41 @@
+"""
+Compares the recursive and the iterative traversal engines of `Visitor`.
+
+Usage:
+    python -m benchmarks.visitor_engine [functions]
+"""
+
+import sys
+import timeit
+
+from benchmarks.programs import ProgramGenerator
+from benchmarks.visitor_dispatch import collect_nodes
+from ryon.compiler import RyonCompiler
+from ryon.hlir.visitor import Visitor
+from ryon.parser import RyonParser
+
+
+class FunctionVisitor(Visitor):
+    def fn(self, node, parent_data, breadcrump):
+        children_data = yield node.name
+        yield children_data
+
+
+def main(functions: int = 5000) -> None:
+    hlir = RyonParser().parse_hlir(ProgramGenerator(functions=functions).module())
+    nodes = len(collect_nodes(hlir))
+    print(f"nodes: {nodes}")
+
+    for visitor_class in (FunctionVisitor, RyonCompiler):
+        times = {
+            iterative: min(timeit.repeat(lambda: visitor_class().visit(hlir, iterative=iterative), number=1, repeat=5))
+            for iterative in (False, True)
+        }
+        print(
+            f"{visitor_class.__name__:16} recursive {times[False] / nodes * 1e9:8.1f} ns/node"
+            f"  iterative {times[True] / nodes * 1e9:8.1f} ns/node  ({times[False] / times[True]:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""
+Compares the throughput of the pure Python YAML loaders and dumpers with their libyaml variants.
+
+Usage:
+    python -m benchmarks.yaml_codecs [functions]
+"""
+
+import sys
+import time
+from typing import Any, Callable
+
+import yaml
+
+from benchmarks.programs import ProgramGenerator
+from ryon.hlir.yaml_dumper import CYAMLHLIRDumper, YAMLHLIRDumper, hlir_to_yaml
+from ryon.hlir.yaml_loader import CYAMLHLIRLoader, YAMLHLIRLoader, yaml_to_hlir
+from ryon.parser import RyonParser
+from ryon.parser.yaml_dumper import CYAMLASTDumper, YAMLASTDumper, ast_to_yaml
+from ryon.parser.yaml_loader import CYAMLASTLoader, YAMLASTLoader, yaml_to_ast
+
+
+def measure(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def compare(name: str, size: int, pure: Callable[[], Any], libyaml: Callable[[], Any]) -> None:
+    pure_time = measure(pure)
+    libyaml_time = measure(libyaml)
+    print(
+        f"{name:10} pure {size / pure_time / 2**20:8.2f} MiB/s  "
+        f"libyaml {size / libyaml_time / 2**20:8.2f} MiB/s  speedup {pure_time / libyaml_time:6.2f}x"
+    )
+
+
+def main(functions: int = 500) -> None:
+    source = ProgramGenerator(functions=functions).module()
+    parser = RyonParser()
+    ast = parser.parse(source)
+    hlir = parser.parse_hlir(source)
+
+    ast_yaml = ast_to_yaml(ast, YAMLASTDumper)
+    hlir_yaml = hlir_to_yaml(hlir, YAMLHLIRDumper)
+    assert ast_to_yaml(ast, CYAMLASTDumper) == ast_yaml
+    assert hlir_to_yaml(hlir, CYAMLHLIRDumper) == hlir_yaml
+
+    print(f"libyaml available: {yaml.__with_libyaml__}")
+    print(f"source: {functions} functions, AST {len(ast_yaml)} bytes, HLIR {len(hlir_yaml)} bytes of YAML")
+    compare(
+        "AST dump", len(ast_yaml), lambda: ast_to_yaml(ast, YAMLASTDumper), lambda: ast_to_yaml(ast, CYAMLASTDumper)
+    )
+    compare(
+        "AST load",
+        len(ast_yaml),
+        lambda: yaml_to_ast(ast_yaml, YAMLASTLoader),
+        lambda: yaml_to_ast(ast_yaml, CYAMLASTLoader),
+    )
+    compare(
+        "HLIR dump",
+        len(hlir_yaml),
+        lambda: hlir_to_yaml(hlir, YAMLHLIRDumper),
+        lambda: hlir_to_yaml(hlir, CYAMLHLIRDumper),
+    )
+    compare(
+        "HLIR load",
+        len(hlir_yaml),
+        lambda: yaml_to_hlir(hlir_yaml, YAMLHLIRLoader),
+        lambda: yaml_to_hlir(hlir_yaml, CYAMLHLIRLoader),
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,3 @@
+from ryon.builder.builder import RyonBuilder
+
+__all__ = ["RyonBuilder"]
@@ -0,0 +1,124 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, TextIO
+
+import llvmlite.binding as llvm
+
+from ryon.compiler import RyonCompiler
+from ryon.compiler.optimizer import OptimizationLevel, optimize
+from ryon.hlir.simplifier import simplify
+from ryon.instrumentation.instrumentation import LLVM, phase
+from ryon.parser import RyonParser
+
+SOURCE_SUFFIX = ".ry"
+
+_parser: Optional[RyonParser] = None
+
+
+def discover_sources(root: Path) -> list[Path]:
+    """
+    Finds all ryon source files under the given directory.
+
+    Args:
+        root (Path): Directory to search recursively, or a single source file.
+
+    Returns:
+        list[Path]: Sorted paths of the source files.
+    """
+    if root.is_file():
+        return [root]
+    return sorted(root.rglob(f"*{SOURCE_SUFFIX}"))
+
+
+def compile_source(source: str) -> str:
+    """
+    Runs the frontend, the HLIR simplification and the code generation of a single source.
+
+    The parser is created once per process, so worker processes pay for it only on their first source.
+
+    Args:
+        source (str): The ryon source code.
+
+    Returns:
+        str: The LLVM IR of the source.
+    """
+    global _parser
+    if _parser is None:
+        _parser = RyonParser()
+    return RyonCompiler().visit(simplify(_parser.parse_hlir(source)))
+
+
+def compile_file(path: Path) -> str:
+    return compile_source(path.read_text())
+
+
+class RyonBuilder:
+    """
+    Builds a project of ryon source files into a single LLVM module.
+
+    Ryon modules cannot reference each other, so every source file is compiled independently across a pool of worker
+    processes and the resulting LLVM modules are linked together.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        opt_level: OptimizationLevel = OptimizationLevel.O0,
+        dump_ir: Optional[TextIO] = None,
+    ):
+        """
+        Args:
+            max_workers: Number of worker processes, defaults to the number of CPUs. With 1 the sources are compiled in
+                the current process.
+            opt_level: Optimization level of the linked module.
+            dump_ir: When given, the IR of the linked module is written to it before and after optimization.
+        """
+        self._max_workers = max_workers
+        self._opt_level = opt_level
+        self._dump_ir = dump_ir
+
+    def build(self, sources: Iterable[Path], name: str = "ryon_module") -> llvm.ModuleRef:
+        """
+        Compiles, links and optimizes the source files.
+
+        Args:
+            sources (Iterable[Path]): Paths of the source files, directories are searched for sources.
+            name (str): Name of the linked module.
+
+        Returns:
+            llvm.ModuleRef: The verified, linked and optimized LLVM module.
+        """
+        paths = [path for source in sources for path in discover_sources(Path(source))]
+
+        if self._max_workers == 1 or len(paths) <= 1:
+            llvm_irs = [compile_file(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                llvm_irs = list(executor.map(compile_file, paths))
+
+        linked = self.link(llvm_irs, name)
+        optimize(linked, self._opt_level, dump=self._dump_ir)
+        return linked
+
+    @staticmethod
+    def link(llvm_irs: Iterable[str], name: str = "ryon_module") -> llvm.ModuleRef:
+        """
+        Links LLVM IR modules into one.
+
+        Args:
+            llvm_irs (Iterable[str]): The LLVM IR of the modules.
+            name (str): Name of the linked module.
+
+        Returns:
+            llvm.ModuleRef: The verified, linked LLVM module.
+        """
+        llvm.initialize()
+
+        with phase("link", LLVM):
+            linked = llvm.parse_assembly("")
+            linked.name = name
+            for llvm_ir in llvm_irs:
+                linked.link_in(llvm.parse_assembly(llvm_ir))
+            linked.verify()
+
+        return linked
@@ -1,3 +1,8 @@
+from ryon.compiler.aot import RyonAOTCompiler
+from ryon.compiler.cache import ObjectCache
 from ryon.compiler.compiler import RyonCompiler
+from ryon.compiler.jit import RyonJIT
+from ryon.compiler.optimizer import OptimizationLevel
+from ryon.compiler.target import CodegenTarget
 
-__all__ = ["RyonCompiler"]
+__all__ = ["CodegenTarget", "ObjectCache", "OptimizationLevel", "RyonAOTCompiler", "RyonCompiler", "RyonJIT"]
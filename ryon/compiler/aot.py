@@ -0,0 +1,195 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, TextIO
+
+import llvmlite.binding as llvm
+from llvmlite import ir
+
+from ryon.compiler.compiler import RyonCompiler
+from ryon.compiler.jit import fn_signature
+from ryon.compiler.map_wrappers import map_wrappers_module
+from ryon.compiler.optimizer import optimize
+from ryon.compiler.target import CodegenTarget
+from ryon.hlir.nodes import Module
+from ryon.hlir.simplifier import simplify
+from ryon.instrumentation.instrumentation import LLVM, phase
+from ryon.runtime.signatures import SIGNATURES_SYMBOL, Signature, format_signatures, map_symbol
+
+SHARED_LIBRARY_SUFFIX = ".dylib" if sys.platform == "darwin" else ".so"
+
+# C counterparts of the `RyonCompiler._TYPE_MAPPING` types.
+_C_TYPES = {
+    "I8": "int8_t",
+    "I16": "int16_t",
+    "I32": "int32_t",
+    "I64": "int64_t",
+    "I128": "__int128",
+    "U8": "uint8_t",
+    "U16": "uint16_t",
+    "U32": "uint32_t",
+    "U64": "uint64_t",
+    "U128": "unsigned __int128",
+    "F16": "_Float16",
+    "F32": "float",
+    "F64": "double",
+}
+
+
+class RyonAOTCompiler:
+    """
+    Compiles ryon modules ahead of time into object files and shared libraries.
+
+    Ryon functions follow the C calling convention under their own names. Shared libraries additionally export
+    `RYON_SIGNATURES`, returning the signatures of their functions, which `ryon.runtime.RyonLibrary` binds through
+    ctypes without LLVM. With `map_wrappers`, the map wrapper of every function is exported as well, see
+    `ryon.compiler.map_wrappers`. The wrappers are opt-in: their loops are optimized with the functions, which makes
+    compiling at O2 about an order of magnitude slower.
+
+    Usage:
+        compiler = RyonAOTCompiler(CodegenTarget.host(OptimizationLevel.O3))
+        compiler.emit_shared_library(hlir, Path("libkernels.so"))
+    """
+
+    def __init__(
+        self,
+        target: Optional[CodegenTarget] = None,
+        dump_ir: Optional[TextIO] = None,
+        compiler: Optional[RyonCompiler] = None,
+        map_wrappers: bool = False,
+    ):
+        """
+        Args:
+            target: Target of the code generation, the host CPU without optimizations by default. Its `opt_level`
+                selects the optimization pipeline.
+            dump_ir: When given, the LLVM IR of each compiled module is written to it before and after optimization.
+            compiler: The compiler generating the LLVM IR, configured with its default options by default.
+            map_wrappers: Whether to compile and export the map wrappers of the functions.
+        """
+        self.target = target if target is not None else CodegenTarget.host()
+        # Position independent code can be linked both into executables and into shared libraries.
+        self.target_machine = self.target.create_target_machine(reloc="pic", code_model="default")
+        self._dump_ir = dump_ir
+        self.compiler = compiler if compiler is not None else RyonCompiler()
+        self.map_wrappers = map_wrappers
+
+    def lower(self, hlir: Module) -> llvm.ModuleRef:
+        """
+        Simplifies and compiles the module to verified and optimized LLVM IR for the target, including the signatures
+        function and the map wrappers when enabled.
+
+        Args:
+            hlir (Module): The module to compile.
+
+        Returns:
+            llvm.ModuleRef: The LLVM module.
+        """
+        signatures = [fn_signature(fn) for fn in hlir.module_statements]
+        llvm_ir = self.compiler.visit(simplify(hlir))
+        with phase("verify", LLVM):
+            llvm_module = llvm.parse_assembly(llvm_ir)
+            llvm_module.link_in(llvm.parse_assembly(_signatures_module(signatures)))
+            if self.map_wrappers:
+                llvm_module.link_in(llvm.parse_assembly(map_wrappers_module(signatures)))
+            llvm_module.triple = self.target_machine.triple
+            llvm_module.data_layout = str(self.target_machine.target_data)
+            llvm_module.verify()
+        optimize(llvm_module, self.target.opt_level, self.target_machine, self._dump_ir)
+        return llvm_module
+
+    def emit_object(self, hlir: Module, path: Path) -> Path:
+        """
+        Writes the object file of the module.
+
+        Args:
+            hlir (Module): The module to compile.
+            path (Path): Destination of the object file.
+
+        Returns:
+            Path: The path of the object file.
+        """
+        llvm_module = self.lower(hlir)
+        with phase("codegen", LLVM):
+            path.write_bytes(self.target_machine.emit_object(llvm_module))
+        return path
+
+    def emit_shared_library(self, hlir: Module, path: Path, header: bool = True) -> Path:
+        """
+        Builds a shared library of the module, linked by the system C compiler (`$CC`, `cc` by default).
+
+        Args:
+            hlir (Module): The module to compile.
+            path (Path): Destination of the shared library.
+            header (bool): Whether to write the C header of the library next to it, see `emit_header`.
+
+        Returns:
+            Path: The path of the shared library.
+        """
+        linker = shutil.which(os.environ.get("CC", "cc"))
+        if linker is None:
+            raise RuntimeError("No C compiler found to link the shared library, set the CC environment variable")
+
+        with tempfile.TemporaryDirectory() as directory:
+            object_path = self.emit_object(hlir, Path(directory) / f"{path.stem}.o")
+            shared_flag = "-dynamiclib" if sys.platform == "darwin" else "-shared"
+            subprocess.run([linker, shared_flag, "-o", str(path), str(object_path)], check=True)
+
+        if header:
+            self.emit_header(hlir, path.with_suffix(".h"), self.map_wrappers)
+        return path
+
+    @staticmethod
+    def emit_header(hlir: Module, path: Path, map_wrappers: bool = False) -> Path:
+        """
+        Writes the C header declaring the functions of the module.
+
+        Args:
+            hlir (Module): The module.
+            path (Path): Destination of the header.
+            map_wrappers (bool): Whether to declare the map wrappers of the functions.
+
+        Returns:
+            Path: The path of the header.
+        """
+        guard = re.sub(r"\W", "_", path.name).upper()
+        lines = [
+            f"#ifndef {guard}",
+            f"#define {guard}",
+            "",
+            "#include <stdint.h>",
+            "",
+            "#ifdef __cplusplus",
+            'extern "C" {',
+            "#endif",
+            "",
+            f"const char *{SIGNATURES_SYMBOL}(void);",
+        ]
+        for fn in hlir.module_statements:
+            name, return_type, arg_types = fn_signature(fn)
+            args = ", ".join(f"{_C_TYPES[arg_type]} {arg.name}" for arg_type, arg in zip(arg_types, fn.args))
+            lines.append(f"{_C_TYPES[return_type]} {name}({args or 'void'});")
+            if map_wrappers:
+                buffers = "".join(f", const char *{arg.name}, int64_t {arg.name}_stride" for arg in fn.args)
+                lines.append(f"void {map_symbol(name)}(int64_t length, char *out, int64_t out_stride{buffers});")
+        lines += ["", "#ifdef __cplusplus", "}", "#endif", "", f"#endif /* {guard} */", ""]
+
+        path.write_text("\n".join(lines))
+        return path
+
+
+def _signatures_module(signatures: list[Signature]) -> str:
+    module = ir.Module(name="ryon_signatures")
+    data = bytearray(format_signatures(signatures).encode("utf8") + b"\0")
+    text = ir.GlobalVariable(module, ir.ArrayType(ir.IntType(8), len(data)), name="ryon_signatures_text")
+    text.initializer = ir.Constant(text.type.pointee, data)
+    text.global_constant = True
+    text.linkage = "private"
+
+    function = ir.Function(module, ir.FunctionType(ir.IntType(8).as_pointer(), []), name=SIGNATURES_SYMBOL)
+    builder = ir.IRBuilder(function.append_basic_block(name="entry"))
+    builder.ret(builder.gep(text, [ir.Constant(ir.IntType(32), 0)] * 2, inbounds=True))
+    return str(module)
@@ -0,0 +1,222 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+import llvmlite.binding as llvm
+
+from ryon.compiler.compiler import RyonCompiler
+from ryon.compiler.target import CodegenTarget
+from ryon.hlir.binary import hlir_to_binary
+from ryon.hlir.nodes import Fn, Module
+from ryon.hlir.simplifier import simplify
+from ryon.parser.parser import default_cache_dir
+
+# Part of every cache key, bump it whenever `RyonCompiler` changes the code it generates.
+CODEGEN_VERSION = "2"
+DEFAULT_MAX_SIZE = 256 * 2**20
+OBJECT_SUFFIX = ".o"
+
+
+def fn_fingerprint(fn: Fn) -> str:
+    """
+    Computes a structural fingerprint of a function, stable across processes.
+
+    Args:
+        fn (Fn): The function.
+
+    Returns:
+        str: Hex digest of the binary HLIR of the function.
+    """
+    return hashlib.sha256(hlir_to_binary(Module(module_statements=(fn,)))).hexdigest()
+
+
+class ObjectCache:
+    """
+    Persistent content-addressed store of the object code of single functions.
+
+    Every function is compiled into its own LLVM module named by its cache key, which covers the structure of the
+    function, the code generation target and the versions of the code generator. Entries are files under `directory`,
+    their modification time records their last use, and the least recently used ones are evicted once the cache grows
+    over `max_size` bytes.
+
+    Usage:
+        cache = ObjectCache()
+        target = CodegenTarget.host()
+        engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), target.create_target_machine())
+        cache.attach(engine)
+        cache.add_functions(engine, hlir, target)
+        engine.finalize_object()
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Args:
+            directory: Where the objects are stored, defaults to `objects` under the ryon cache directory.
+            max_size: Size limit of the cache in bytes.
+        """
+        self.directory = Path(directory) if directory is not None else default_cache_dir() / "objects"
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+        # Keys of the modules added to an engine whose objects are to be stored once compiled.
+        self._pending: set[str] = set()
+
+    def key(self, fn: Fn, target: CodegenTarget, options: str = "") -> str:
+        """
+        Computes the cache key of a function compiled for the target.
+
+        Args:
+            fn (Fn): The function.
+            target (CodegenTarget): The code generation target.
+            options (str): Options of the compiler changing the generated code, see `RyonCompiler.options`.
+
+        Returns:
+            str: The key.
+        """
+        digest = hashlib.sha256()
+        for part in (
+            fn_fingerprint(fn),
+            target.triple,
+            target.cpu,
+            target.features,
+            target.opt_level.name,
+            options,
+            CODEGEN_VERSION,
+            ".".join(map(str, llvm.llvm_version_info)),
+        ):
+            digest.update(part.encode("utf8") + b"\0")
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{OBJECT_SUFFIX}"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Reads a stored object, marking it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bytes | None: The object code, None when it is not cached.
+        """
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores an object, evicting the least recently used ones when the cache gets too big.
+
+        Args:
+            key (str): The cache key.
+            data (bytes): The object code.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent readers never see a partial object.
+        fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+
+        self._size = (self.size if self._size is None else self._size) + len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored objects in bytes."""
+        self._size = sum(path.stat().st_size for path in self._entries())
+        return self._size
+
+    def attach(self, engine: llvm.ExecutionEngine) -> None:
+        """
+        Installs the cache as the object cache of an execution engine, see `add_functions`.
+
+        Args:
+            engine (llvm.ExecutionEngine): The MCJIT execution engine.
+        """
+        engine.set_object_cache(self._notify, self._get_buffer)
+
+    def add_functions(
+        self,
+        engine: llvm.ExecutionEngine,
+        hlir: Module,
+        target: CodegenTarget,
+        lower: Optional[Callable[[Module], llvm.ModuleRef]] = None,
+        options: str = "",
+    ) -> None:
+        """
+        Adds the functions of a module to an execution engine, one LLVM module per function.
+
+        Cached functions are loaded from their objects without running `RyonCompiler` at all. The others are lowered
+        to LLVM IR, and their objects are stored by the hook installed by `attach` when the engine generates them.
+
+        Args:
+            engine (llvm.ExecutionEngine): The execution engine, `attach` must have been called on it.
+            hlir (Module): The functions to add.
+            target (CodegenTarget): Target the engine generates code for.
+            lower (Callable[[Module], llvm.ModuleRef], optional): Lowers a module of a single function to an
+                optimized LLVM module, by default the simplified HLIR is compiled without optimizations.
+            options (str): Options of the compiler used by `lower`, see `RyonCompiler.options`.
+        """
+        lower = lower if lower is not None else _lower
+        for fn in hlir.module_statements:
+            key = self.key(fn, target, options)
+            data = self.get(key)
+            if data is not None:
+                self.hits += 1
+                engine.add_object_file(llvm.ObjectFileRef.from_data(data))
+                continue
+
+            self.misses += 1
+            llvm_module = lower(Module(module_statements=(fn,)))
+            llvm_module.name = key
+            self._pending.add(key)
+            engine.add_module(llvm_module)
+
+    def _notify(self, module: llvm.ModuleRef, data: bytes) -> None:
+        if module.name in self._pending:
+            self._pending.discard(module.name)
+            self.put(module.name, data)
+
+    def _get_buffer(self, module: llvm.ModuleRef) -> Optional[bytes]:
+        return self.get(module.name) if module.name in self._pending else None
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob(f"*/*{OBJECT_SUFFIX}"))
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+
+def _lower(hlir: Module) -> llvm.ModuleRef:
+    return llvm.parse_assembly(RyonCompiler().visit(simplify(hlir)))
@@ -1,6 +1,18 @@
+from functools import partial
+from typing import Iterable
+
 from llvmlite import ir
 
 from ryon.hlir.visitor import Visitor
+from ryon.instrumentation.instrumentation import fn_phase
+
+# Type classes of the values, see `RyonCompiler.balanced_sums`.
+INTEGER = "integer"
+FLOAT = "float"
+
+
+class UndefinedVariableError(NameError):
+    """A variable is referenced in a function which does not define it."""
 
 
 class RyonCompiler(Visitor):
@@ -20,8 +32,29 @@ class RyonCompiler(Visitor):
         "F64": ir.DoubleType(),
     }
 
-    def __init__(self):
-        pass
+    def __init__(self, balanced_sums: Iterable[str] = (), reassociate_floats: bool = False):
+        """
+        Args:
+            balanced_sums: Type classes, `INTEGER` and/or `FLOAT`, whose summations are lowered as balanced pairwise
+                reductions of depth log N instead of left to right chains of depth N. The balanced tree exposes
+                instruction-level parallelism, but it adds the terms in a different order.
+            reassociate_floats: Allows reordering floating point additions, which may change their rounding. The
+                additions are marked `reassoc`, so LLVM may reorder them too. Required to balance `FLOAT` summations.
+        """
+        # Arguments of the functions being compiled by name, so that variables are resolved in constant time.
+        self._variables: dict[ir.Function, dict[str, ir.Argument]] = {}
+        self.balanced_sums = frozenset(balanced_sums)
+        self.reassociate_floats = reassociate_floats
+        self._float_flags = ("reassoc",) if reassociate_floats else ()
+        if not self.balanced_sums <= {INTEGER, FLOAT}:
+            raise ValueError(f"Unknown type classes {set(self.balanced_sums - {INTEGER, FLOAT})}")
+        if FLOAT in self.balanced_sums and not reassociate_floats:
+            raise ValueError("Balancing float summations reassociates them, it requires reassociate_floats=True")
+
+    @property
+    def options(self) -> str:
+        """Describes the options which change the generated code, e.g. to tell apart cached objects."""
+        return f"balanced_sums={','.join(sorted(self.balanced_sums))};reassociate_floats={self.reassociate_floats}"
 
     def module(self, node, parent_data, breadcrump):
         module = ir.Module(name="simple_module")
@@ -29,13 +62,20 @@ class RyonCompiler(Visitor):
         yield str(module)
 
     def fn(self, node, module, breadcrump):
-        function_type = ir.FunctionType(
-            self._TYPE_MAPPING[node.type.name], [self._TYPE_MAPPING[node_arg.type.name] for node_arg in node.args]
-        )
-        function = ir.Function(module, function_type, name=node.name)
-        for arg, node_arg in zip(function.args, node.args):
-            arg.name = node_arg.name
-        yield function
+        # The span stays open while the body of the function is compiled.
+        with fn_phase(node.name):
+            function_type = ir.FunctionType(
+                self._TYPE_MAPPING[node.type.name], [self._TYPE_MAPPING[node_arg.type.name] for node_arg in node.args]
+            )
+            function = ir.Function(module, function_type, name=node.name)
+            variables = self._variables[function] = {}
+            for arg, node_arg in zip(function.args, node.args):
+                arg.name = node_arg.name
+                variables.setdefault(node_arg.name, arg)
+            try:
+                yield function
+            finally:
+                del self._variables[function]
 
     def suite(self, node, function, breadcrump):
         block = function.append_basic_block(name="entry")
@@ -53,15 +93,34 @@ class RyonCompiler(Visitor):
         builder, function = parent_data
         child_nodes = yield builder, function
         addends = child_nodes["addends"]
+        type_class = INTEGER if isinstance(addends[0].type, ir.IntType) else FLOAT
+        add = builder.add if type_class == INTEGER else partial(builder.fadd, flags=self._float_flags)
+        if type_class in self.balanced_sums:
+            yield self._balanced_sum(add, list(addends))
+            return
+
         sum_result = addends[0]
         for addend in addends[1:]:
-            sum_result = builder.add(sum_result, addend, name="result")
+            sum_result = add(sum_result, addend, name="result")
         yield sum_result
 
+    @staticmethod
+    def _balanced_sum(add, addends):
+        # Adds neighbouring pairs level by level, an odd last term is carried over to the next level.
+        while len(addends) > 1:
+            paired = [add(left, right, name="result") for left, right in zip(addends[::2], addends[1::2])]
+            if len(addends) % 2:
+                paired.append(addends[-1])
+            addends = paired
+        return addends[0]
+
     def var(self, node, parent_data, breadcrump):
         builder, function = parent_data
         yield
-        yield next(arg for arg in function.args if arg.name == node.name)
+        try:
+            yield self._variables[function][node.name]
+        except KeyError:
+            raise UndefinedVariableError(f"Undefined variable '{node.name}' in function '{function.name}'") from None
 
     def decimal_number(self, node, parent_data, breadcrump):
         builder, _ = parent_data
@@ -0,0 +1,283 @@
+import threading
+from typing import Any, Callable, Optional, TextIO
+
+import llvmlite.binding as llvm
+
+from ryon.compiler.cache import ObjectCache
+from ryon.compiler.compiler import RyonCompiler
+from ryon.compiler.map_wrappers import map_wrappers_module
+from ryon.compiler.optimizer import optimize
+from ryon.compiler.target import CodegenTarget
+from ryon.hlir.nodes import Fn, Module, SimpleType, TypeNode
+from ryon.hlir.simplifier import simplify
+from ryon.instrumentation.instrumentation import LLVM, phase
+from ryon.runtime.buffers import MapFunction
+from ryon.runtime.signatures import Signature, map_symbol, prototype
+
+
+def fn_signature(fn: Fn) -> Signature:
+    """
+    Returns the name, the return type name and the argument type names of a function.
+
+    Raises:
+        TypeError: A type of the function is not a simple type.
+    """
+    return fn.name, _type_name(fn.type), tuple(_type_name(arg.type) for arg in fn.args)
+
+
+def _type_name(type_node: TypeNode) -> str:
+    if not isinstance(type_node, SimpleType):
+        raise TypeError(f"Type {type_node} has no ctypes equivalent")
+    return type_node.name
+
+
+def fn_prototype(fn: Fn) -> Any:
+    """
+    Derives the ctypes prototype of a function from its argument and return types.
+
+    Args:
+        fn (Fn): The function.
+
+    Returns:
+        The `ctypes.CFUNCTYPE` of the function.
+
+    Raises:
+        TypeError: A type of the function cannot be passed through ctypes.
+    """
+    try:
+        _, return_type, arg_types = fn_signature(fn)
+        return prototype(return_type, arg_types)
+    except TypeError as e:
+        raise TypeError(f"Function '{fn.name}' cannot be called from Python: {e}") from None
+
+
+class RyonJIT:
+    """
+    Compiles ryon modules in-process and exposes their functions as Python callables.
+
+    The JIT owns a single target machine and MCJIT execution engine, which every compiled module is added to. The
+    callables keep the JIT alive. With `map_wrappers`, each callable also has a `map` attribute applying the function
+    element-wise over buffers in native code, see `ryon.runtime.buffers.MapFunction`. The map wrapper of a function is
+    compiled on the first call of its `map`, so functions which are never mapped do not pay for it.
+
+    Functions are compiled either eagerly, as a whole module, or lazily on their first call, see `compile`.
+
+    Usage:
+        jit = RyonJIT()
+        add = jit.compile(parser.parse_hlir(source))["add"]
+        add(3, 4)
+        add.map(array.array("i", [1, 2]), 3)
+    """
+
+    def __init__(
+        self,
+        target: Optional[CodegenTarget] = None,
+        cache: Optional[ObjectCache] = None,
+        dump_ir: Optional[TextIO] = None,
+        compiler: Optional[RyonCompiler] = None,
+        map_wrappers: bool = True,
+    ):
+        """
+        Args:
+            target: Target of the code generation, the host CPU without optimizations by default. Its `opt_level`
+                selects the optimization pipeline.
+            cache: When given, the object code of each function is looked up in and stored to the cache.
+            dump_ir: When given, the LLVM IR of each compiled module is written to it before and after optimization.
+            compiler: The compiler generating the LLVM IR, configured with its default options by default.
+            map_wrappers: Whether the functions have a `map` attribute, see `ryon.compiler.map_wrappers`.
+        """
+        self.target = target if target is not None else CodegenTarget.host()
+        self.target_machine = self.target.create_target_machine()
+        self.engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), self.target_machine)
+        self._cache = cache
+        self._dump_ir = dump_ir
+        self.compiler = compiler if compiler is not None else RyonCompiler()
+        self.map_wrappers = map_wrappers
+        if cache is not None:
+            cache.attach(self.engine)
+        self._functions: dict[str, Callable[..., Any]] = {}
+        # Serializes every change of the engine and of the functions, eager and lazy, the engine is not thread-safe.
+        self._lock = threading.Lock()
+
+    def compile(self, hlir: Module, lazy: bool = False) -> dict[str, Callable[..., Any]]:
+        """
+        Compiles the module and returns its functions.
+
+        Args:
+            hlir (Module): The module to compile.
+            lazy (bool): Whether to defer the compilation of every function to its first call, the functions are
+                returned as `LazyFunction` stubs. Ryon functions do not call each other, so each of them is compiled
+                on its own, and the time to the first call does not depend on the size of the module.
+
+        Returns:
+            dict[str, Callable]: Callables of the functions by name.
+
+        Raises:
+            TypeError: A function cannot be called from Python, see `fn_prototype`.
+            ValueError: A function is defined more than once in the module, or was already compiled by this JIT.
+        """
+        names = set()
+        for fn in hlir.module_statements:
+            fn_prototype(fn)
+            if fn.name in names:
+                raise ValueError(f"Function '{fn.name}' is defined more than once")
+            names.add(fn.name)
+
+        with self._lock:
+            for name in names:
+                if name in self._functions:
+                    raise ValueError(f"Function '{name}' is already defined")
+
+            if lazy:
+                functions: dict[str, Callable[..., Any]] = {
+                    fn.name: LazyFunction(self, fn) for fn in hlir.module_statements
+                }
+                self._functions.update(functions)
+                return functions
+
+            self._add_module(hlir)
+            return {fn.name: self._bind(fn) for fn in hlir.module_statements}
+
+    def _add_module(self, hlir: Module) -> None:
+        # Called with `_lock` held, as is `_add_map_wrapper`.
+        if self._cache is not None:
+            self._cache.add_functions(self.engine, hlir, self.target, self.lower, self.compiler.options)
+        else:
+            self.engine.add_module(self.lower(hlir))
+        with phase("codegen", LLVM):
+            self.engine.finalize_object()
+
+    def _bind(self, fn: Fn) -> Callable[..., Any]:
+        # Wraps the machine code of a function added to the engine, replacing its stub if any.
+        function = fn_prototype(fn)(self.engine.get_function_address(fn.name))
+        function._jit = self
+        if self.map_wrappers:
+            function.map = LazyMapFunction(self, fn)
+        self._functions[fn.name] = function
+        return function
+
+    def _add_map_wrapper(self, fn: Fn) -> MapFunction:
+        signature = fn_signature(fn)
+        llvm_ir = self.compiler.visit(simplify(Module(module_statements=(fn,))))
+        with phase("verify", LLVM):
+            llvm_module = llvm.parse_assembly(llvm_ir)
+            llvm_module.link_in(llvm.parse_assembly(map_wrappers_module([signature])))
+            # A private copy of the function, which the wrapper loop can inline, the engine already defines its symbol.
+            llvm_module.get_function(fn.name).linkage = "internal"
+            llvm_module.verify()
+        optimize(llvm_module, self.target.opt_level, self.target_machine, self._dump_ir)
+        self.engine.add_module(llvm_module)
+        with phase("codegen", LLVM):
+            self.engine.finalize_object()
+        return MapFunction(signature, self.engine.get_function_address(map_symbol(fn.name)))
+
+    def lower(self, hlir: Module) -> llvm.ModuleRef:
+        """
+        Simplifies and compiles the module to verified and optimized LLVM IR.
+
+        Args:
+            hlir (Module): The module to compile.
+
+        Returns:
+            llvm.ModuleRef: The LLVM module.
+        """
+        llvm_ir = self.compiler.visit(simplify(hlir))
+        with phase("verify", LLVM):
+            llvm_module = llvm.parse_assembly(llvm_ir)
+            llvm_module.verify()
+        optimize(llvm_module, self.target.opt_level, self.target_machine, self._dump_ir)
+        return llvm_module
+
+    def __getitem__(self, name: str) -> Callable[..., Any]:
+        return self._functions[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._functions
+
+
+class LazyFunction:
+    """
+    Stub of a function of a `RyonJIT`, the function is lowered, optimized and compiled to machine code on its first
+    call, or on the first access to its `map`.
+
+    Once compiled, the JIT returns the compiled callable instead of the stub, the stub keeps forwarding to it.
+    """
+
+    __slots__ = ("fn", "_jit", "_function")
+
+    def __init__(self, jit: RyonJIT, fn: Fn):
+        self.fn = fn
+        self._jit = jit
+        self._function: Optional[Callable[..., Any]] = None
+
+    @property
+    def name(self) -> str:
+        return self.fn.name
+
+    @property
+    def compiled(self) -> bool:
+        return self._function is not None
+
+    def materialize(self) -> Callable[..., Any]:
+        """
+        Compiles the function, unless it is already compiled.
+
+        Returns:
+            Callable: The compiled function.
+        """
+        function = self._function
+        if function is None:
+            with self._jit._lock:
+                function = self._function
+                if function is None:
+                    self._jit._add_module(Module(module_statements=(self.fn,)))
+                    function = self._function = self._jit._bind(self.fn)
+        return function
+
+    def __call__(self, *args: Any) -> Any:
+        function = self._function
+        if function is None:
+            function = self.materialize()
+        return function(*args)
+
+    @property
+    def map(self) -> "LazyMapFunction":
+        return self.materialize().map  # type: ignore[attr-defined]
+
+    def __repr__(self) -> str:
+        return f"<LazyFunction {self.name} {'compiled' if self.compiled else 'pending'}>"
+
+
+class LazyMapFunction:
+    """The `map` of a function of a `RyonJIT`, its map wrapper is compiled on its first call, see `MapFunction`."""
+
+    __slots__ = ("fn", "_jit", "_function")
+
+    def __init__(self, jit: RyonJIT, fn: Fn):
+        self.fn = fn
+        self._jit = jit
+        self._function: Optional[MapFunction] = None
+
+    def materialize(self) -> MapFunction:
+        """
+        Compiles the map wrapper, unless it is already compiled.
+
+        Returns:
+            MapFunction: The compiled map function.
+        """
+        function = self._function
+        if function is None:
+            with self._jit._lock:
+                function = self._function
+                if function is None:
+                    function = self._function = self._jit._add_map_wrapper(self.fn)
+        return function
+
+    def __call__(self, *args: Any, out: Optional[Any] = None) -> Any:
+        function = self._function
+        if function is None:
+            function = self.materialize()
+        return function(*args, out=out)
+
+    def __repr__(self) -> str:
+        return f"<LazyMapFunction {self.fn.name} {'compiled' if self._function is not None else 'pending'}>"
@@ -0,0 +1,73 @@
+from llvmlite import ir
+
+from ryon.compiler.compiler import RyonCompiler
+from ryon.runtime.signatures import Signature, map_symbol
+
+_LENGTH_TYPE = ir.IntType(64)
+_BYTE_POINTER = ir.IntType(8).as_pointer()
+
+
+def map_wrappers_module(signatures: list[Signature]) -> str:
+    """
+    Generates the LLVM IR of the map wrappers of functions, to be linked with the module defining the functions.
+
+    The wrapper of a function applies it element-wise over strided buffers in a native loop, so a single foreign call
+    processes a whole batch:
+
+        void RYON_MAP_add(int64_t length, char *out, int64_t out_stride,
+                          const char *a, int64_t a_stride, const char *b, int64_t b_stride);
+
+    Strides are in bytes, a zero stride repeats the same element. Elements need not be aligned.
+
+    Args:
+        signatures (list[Signature]): Signatures of the functions.
+
+    Returns:
+        str: The LLVM IR of the module.
+    """
+    module = ir.Module(name="ryon_map_wrappers")
+    for name, return_type, arg_types in signatures:
+        _map_wrapper(module, name, return_type, arg_types)
+    return str(module)
+
+
+def _map_wrapper(module: ir.Module, name: str, return_type: str, arg_types: tuple[str, ...]) -> ir.Function:
+    types = RyonCompiler._TYPE_MAPPING
+    function = ir.Function(module, ir.FunctionType(types[return_type], [types[t] for t in arg_types]), name=name)
+
+    buffer_types = [_BYTE_POINTER, _LENGTH_TYPE] * (len(arg_types) + 1)
+    wrapper = ir.Function(module, ir.FunctionType(ir.VoidType(), [_LENGTH_TYPE, *buffer_types]), name=map_symbol(name))
+    length, *buffers = wrapper.args
+    length.name = "length"
+    for index, (pointer, stride) in enumerate(zip(buffers[::2], buffers[1::2])):
+        prefix = "out" if index == 0 else f"arg{index - 1}"
+        pointer.name = prefix
+        stride.name = f"{prefix}_stride"
+
+    entry = wrapper.append_basic_block(name="entry")
+    loop = wrapper.append_basic_block(name="loop")
+    exit_ = wrapper.append_basic_block(name="exit")
+
+    builder = ir.IRBuilder(entry)
+    builder.cbranch(builder.icmp_signed(">", length, ir.Constant(_LENGTH_TYPE, 0)), loop, exit_)
+
+    builder.position_at_end(loop)
+    index = builder.phi(_LENGTH_TYPE, name="index")
+    index.add_incoming(ir.Constant(_LENGTH_TYPE, 0), entry)
+    (out, out_stride), *arg_buffers = zip(buffers[::2], buffers[1::2])
+
+    args = []
+    for (pointer, stride), function_arg in zip(arg_buffers, function.args):
+        element = builder.gep(pointer, [builder.mul(index, stride)])
+        args.append(builder.load(builder.bitcast(element, function_arg.type.as_pointer()), align=1))
+    result = builder.call(function, args)
+    element = builder.gep(out, [builder.mul(index, out_stride)])
+    builder.store(result, builder.bitcast(element, result.type.as_pointer()), align=1)
+
+    next_index = builder.add(index, ir.Constant(_LENGTH_TYPE, 1), name="next_index")
+    index.add_incoming(next_index, loop)
+    builder.cbranch(builder.icmp_signed("==", next_index, length), exit_, loop)
+
+    builder.position_at_end(exit_)
+    builder.ret_void()
+    return wrapper
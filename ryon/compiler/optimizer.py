@@ -0,0 +1,87 @@
+from enum import Enum
+from typing import Optional, TextIO
+
+import llvmlite.binding as llvm
+
+from ryon.instrumentation.instrumentation import LLVM, phase
+
+
+class OptimizationLevel(Enum):
+    """
+    Optimization levels, as in `clang -O<level>`.
+
+    The value of each level is its speed level (0 to 3) and size level (0 to 2) of the LLVM pass manager builder.
+    """
+
+    O0 = (0, 0)
+    O1 = (1, 0)
+    O2 = (2, 0)
+    O3 = (3, 0)
+    Os = (2, 1)
+    Oz = (2, 2)
+
+    @property
+    def speed(self) -> int:
+        return self.value[0]
+
+    @property
+    def size(self) -> int:
+        return self.value[1]
+
+    @property
+    def inlining_threshold(self) -> int:
+        """The inlining threshold LLVM derives from the level."""
+        if self.size:
+            return 75 if self.size == 1 else 25
+        return 250 if self.speed >= 3 else 225
+
+
+def optimize(
+    llvm_module: llvm.ModuleRef,
+    level: OptimizationLevel,
+    target_machine: Optional[llvm.TargetMachine] = None,
+    dump: Optional[TextIO] = None,
+) -> None:
+    """
+    Optimizes the module in place, running the function-level pipeline over each function and then the module-level
+    pipeline.
+
+    `OptimizationLevel.O0` leaves the module untouched.
+
+    Args:
+        llvm_module (llvm.ModuleRef): The module to optimize.
+        level (OptimizationLevel): The optimization level.
+        target_machine (llvm.TargetMachine, optional): When given, the passes use the target cost model, e.g. to pick
+            vector widths.
+        dump (TextIO, optional): When given, the IR is written to it before and after the optimization.
+    """
+    if dump is not None:
+        _dump(dump, f"before optimization ({level.name})", llvm_module)
+
+    if level is not OptimizationLevel.O0:
+        with phase(f"optimize {level.name}", LLVM):
+            builder = llvm.create_pass_manager_builder()
+            builder.opt_level = level.speed
+            builder.size_level = level.size
+            builder.inlining_threshold = level.inlining_threshold
+            builder.loop_vectorize = builder.slp_vectorize = level.speed >= 2 and not level.size
+
+            function_passes = llvm.create_function_pass_manager(llvm_module)
+            module_passes = llvm.create_module_pass_manager()
+            for pass_manager in (function_passes, module_passes):
+                if target_machine is not None:
+                    target_machine.add_analysis_passes(pass_manager)
+                builder.populate(pass_manager)
+
+            function_passes.initialize()
+            for function in llvm_module.functions:
+                function_passes.run(function)
+            function_passes.finalize()
+            module_passes.run(llvm_module)
+
+    if dump is not None:
+        _dump(dump, f"after optimization ({level.name})", llvm_module)
+
+
+def _dump(dump: TextIO, title: str, llvm_module: llvm.ModuleRef) -> None:
+    dump.write(f"; ---- {llvm_module.name}: {title} ----\n{llvm_module}\n")
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+
+import llvmlite.binding as llvm
+
+from ryon.compiler.optimizer import OptimizationLevel
+
+
+def initialize_native() -> None:
+    """Initializes LLVM and its native target, safe to call repeatedly."""
+    llvm.initialize()
+    llvm.initialize_native_target()
+    llvm.initialize_native_asmprinter()
+
+
+@dataclass(frozen=True)
+class CodegenTarget:
+    """
+    Target of the native code generation.
+
+    Attributes:
+        triple: The LLVM target triple.
+        cpu: Name of the target CPU, the generic CPU of the triple when empty.
+        features: Target features, e.g. `+avx2,-sse4a`.
+        opt_level: Optimization level of both the IR and the code generator.
+    """
+
+    triple: str
+    cpu: str = ""
+    features: str = ""
+    opt_level: OptimizationLevel = OptimizationLevel.O0
+
+    @classmethod
+    def host(cls, opt_level: OptimizationLevel = OptimizationLevel.O0) -> "CodegenTarget":
+        """
+        Describes the CPU of the current process.
+
+        Args:
+            opt_level (OptimizationLevel): Optimization level of both the IR and the code generator.
+
+        Returns:
+            CodegenTarget: The host target.
+        """
+        initialize_native()
+        return cls(
+            triple=llvm.get_process_triple(),
+            cpu=llvm.get_host_cpu_name(),
+            features=llvm.get_host_cpu_features().flatten(),
+            opt_level=opt_level,
+        )
+
+    def create_target_machine(self, reloc: str = "default", code_model: str = "jitdefault") -> llvm.TargetMachine:
+        """
+        Creates a target machine generating code for the target.
+
+        Args:
+            reloc (str): The relocation model, `pic` for shared libraries.
+            code_model (str): The code model, use `default` for object files.
+
+        Returns:
+            llvm.TargetMachine: The target machine.
+        """
+        initialize_native()
+        return llvm.Target.from_triple(self.triple).create_target_machine(
+            cpu=self.cpu, features=self.features, opt=self.opt_level.speed, reloc=reloc, codemodel=code_model
+        )
@@ -0,0 +1,271 @@
+from array import array
+from typing import Any, Callable, Iterator
+
+from ryon.hlir.nodes import NODE, NODE_TUPLE, HLIRNode
+
+
+class HLIRArena:
+    """
+    Struct-of-arrays representation of an HLIR tree.
+
+    Instead of one Python object per node, the nodes are stored in typed arrays:
+
+    - `kinds`: index of the node class in `classes` per node.
+    - `offsets`: start of the field slots of each node in `slots`.
+    - `slots`: one reference per field of a node, in the order of the node schema. A tuple field holds an offset into
+      `items`, where the length of the tuple is followed by the references of its items.
+    - `items`: the tuple fields.
+
+    A reference is either the index of a node, or a negative number `~i` referring to `constants[i]`, which holds the
+    scalar payloads such as names and literal values.
+
+    Nodes are stored in post-order, children before their parents, and structurally equal subtrees are stored once.
+
+    `node` returns lightweight views of the stored nodes. A view is an instance of a subclass of the original node
+    class whose fields are read from the arrays, so visitors and passes written for the dataclass tree work on the
+    arena unchanged. There is a single view per stored node, so unchanged children keep their identity, and
+    constructing a view class, e.g. `node.__class__(**fields)` in a rewriting pass, builds a plain dataclass node.
+    `to_tree` converts the arena back to a dataclass tree.
+
+    Usage:
+        arena = HLIRArena.from_tree(hlir)
+        llvm_ir = RyonCompiler().visit(arena.root)
+    """
+
+    def __init__(self):
+        self.classes: list[type[HLIRNode]] = []
+        self.kinds = array("H")
+        self.offsets = array("L")
+        self.slots = array("q")
+        self.items = array("q")
+        self.constants: list[Any] = []
+        self._hashes: dict[int, int] = {}
+        self._views: dict[int, HLIRNode] = {}
+
+    @classmethod
+    def from_tree(cls, root: HLIRNode) -> "HLIRArena":
+        """
+        Stores an HLIR tree into a new arena.
+
+        Args:
+            root (HLIRNode): Root of the tree.
+
+        Returns:
+            HLIRArena: The arena, its last node is the root.
+        """
+        arena = cls()
+        builder = _ArenaBuilder(arena)
+
+        stack: list[tuple[HLIRNode, bool]] = [(root, False)]
+        while stack:
+            node, children_stored = stack.pop()
+            if builder.is_visited(node):
+                continue
+            if children_stored:
+                builder.append(node)
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(list(_child_nodes(node))))
+
+        return arena
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the arrays in bytes."""
+        return sum(a.itemsize * len(a) for a in (self.kinds, self.offsets, self.slots, self.items))
+
+    @property
+    def root(self) -> HLIRNode:
+        return self.node(len(self.kinds) - 1)
+
+    def node(self, index: int) -> HLIRNode:
+        """
+        Returns a view of a stored node.
+
+        Args:
+            index (int): Index of the node.
+
+        Returns:
+            HLIRNode: The view, an instance of a subclass of the stored node class, the same object for every call.
+        """
+        view = self._views.get(index)
+        if view is None:
+            view = object.__new__(_view_class(self.classes[self.kinds[index]]))
+            object.__setattr__(view, "_arena", self)
+            object.__setattr__(view, "_index", index)
+            self._views[index] = view
+        return view
+
+    def value(self, ref: int) -> Any:
+        """Resolves a reference stored in the slots or items."""
+        return self.node(ref) if ref >= 0 else self.constants[~ref]
+
+    def tuple_value(self, offset: int) -> tuple[Any, ...]:
+        """Resolves a tuple stored in the items."""
+        length = self.items[offset]
+        return tuple(self.value(ref) for ref in self.items[offset + 1 : offset + 1 + length])
+
+    def to_tree(self) -> HLIRNode:
+        """
+        Converts the arena back to a dataclass tree, structurally equal subtrees are shared.
+
+        Returns:
+            HLIRNode: The root of the tree.
+        """
+        nodes: list[HLIRNode] = []
+
+        def value(ref: int) -> Any:
+            return nodes[ref] if ref >= 0 else self.constants[~ref]
+
+        for index, kind in enumerate(self.kinds):
+            node_class = self.classes[kind]
+            offset = self.offsets[index]
+            fields = {}
+            for position, (name, field_kind) in enumerate(node_class.schema().fields):
+                slot = self.slots[offset + position]
+                if field_kind == NODE_TUPLE:
+                    length = self.items[slot]
+                    fields[name] = tuple(value(ref) for ref in self.items[slot + 1 : slot + 1 + length])
+                else:
+                    fields[name] = value(slot)
+            nodes.append(node_class(**fields))
+
+        return nodes[-1]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The cached views refer back to the arena, they are recreated on demand.
+        return {**self.__dict__, "_views": {}}
+
+    def hash_of(self, view: "_ArenaView") -> int:
+        """Returns the hash of a view, equal to the hash of the node it represents."""
+        value = self._hashes.get(view._index)
+        if value is None:
+            node_class = view._node_class
+            value = self._hashes[view._index] = hash((node_class, node_class.schema().values(view)))
+        return value
+
+
+class _ArenaBuilder:
+    """Appends nodes to an arena, the children of a node must be appended before the node."""
+
+    def __init__(self, arena: HLIRArena):
+        self._arena = arena
+        self._class_kinds: dict[type[HLIRNode], int] = {}
+        self._constant_refs: dict[tuple[type, Any], int] = {}
+        # Index of the appended nodes by identity, and by structure.
+        self._visited: dict[int, int] = {}
+        self._stored: dict[HLIRNode, int] = {}
+
+    def is_visited(self, node: HLIRNode) -> bool:
+        return id(node) in self._visited
+
+    def append(self, node: HLIRNode) -> None:
+        index = self._stored.get(node)
+        if index is None:
+            index = self._stored[node] = self._append(node)
+        self._visited[id(node)] = index
+
+    def _append(self, node: HLIRNode) -> int:
+        arena = self._arena
+        node_class = node.__class__
+        kind = self._class_kinds.get(node_class)
+        if kind is None:
+            kind = self._class_kinds[node_class] = len(arena.classes)
+            arena.classes.append(node_class)
+
+        arena.kinds.append(kind)
+        arena.offsets.append(len(arena.slots))
+        for name, field_kind in node.schema().fields:
+            value = getattr(node, name)
+            if field_kind == NODE_TUPLE:
+                arena.slots.append(len(arena.items))
+                arena.items.append(len(value))
+                arena.items.extend(self._ref(item) for item in value)
+            else:
+                arena.slots.append(self._ref(value))
+
+        return len(arena.kinds) - 1
+
+    def _ref(self, value: Any) -> int:
+        if isinstance(value, HLIRNode):
+            return self._visited[id(value)]
+
+        key = (value.__class__, value)
+        ref = self._constant_refs.get(key)
+        if ref is None:
+            ref = self._constant_refs[key] = ~len(self._arena.constants)
+            self._arena.constants.append(value)
+        return ref
+
+
+def _child_nodes(node: HLIRNode) -> Iterator[HLIRNode]:
+    for name, kind in node.schema().fields:
+        value = getattr(node, name)
+        if kind == NODE and isinstance(value, HLIRNode):
+            yield value
+        elif kind == NODE_TUPLE:
+            yield from (item for item in value if isinstance(item, HLIRNode))
+
+
+class _ArenaView:
+    """Behaviour of the views of arena nodes, mixed into a subclass of each node class by `_view_class`."""
+
+    __slots__ = ()
+
+    _arena: HLIRArena
+    _index: int
+    _node_class: type[HLIRNode]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        # Views are only created by `HLIRArena.node`, constructing a view class builds the plain node, which is not an
+        # instance of the view class, so `__init__` is not called again.
+        return cls._node_class(*args, **kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _ArenaView) and other._arena is self._arena:
+            return self._index == other._index
+        if not isinstance(other, self._node_class):
+            return NotImplemented
+        values = self._node_class.schema().values
+        return values(self) == values(other)
+
+    def __hash__(self) -> int:
+        return self._arena.hash_of(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self._arena.node, (self._index,)
+
+
+_view_classes: dict[type[HLIRNode], type[HLIRNode]] = {}
+
+
+def _view_class(node_class: type[HLIRNode]) -> type[HLIRNode]:
+    view_class = _view_classes.get(node_class)
+    if view_class is not None:
+        return view_class
+
+    namespace: dict[str, Any] = {
+        "__slots__": ("_arena", "_index"),
+        "__qualname__": node_class.__qualname__,
+        "__module__": node_class.__module__,
+        "_node_class": node_class,
+    }
+    for position, (name, kind) in enumerate(node_class.schema().fields):
+        namespace[name] = property(_field_getter(position, kind == NODE_TUPLE))
+
+    metaclass: Any = type(node_class)
+    view_class = metaclass(node_class.__name__, (_ArenaView, node_class), namespace)
+    _view_classes[node_class] = view_class
+    return view_class
+
+
+def _field_getter(position: int, is_tuple: bool) -> Callable[[Any], Any]:
+    def get(view: Any) -> Any:
+        arena = view._arena
+        slot = arena.slots[arena.offsets[view._index] + position]
+        return arena.tuple_value(slot) if is_tuple else arena.value(slot)
+
+    return get
@@ -0,0 +1,325 @@
+"""
+Compact binary serialization of HLIR modules.
+
+Layout of the format (little-endian):
+
+- Header: magic `RYHL`, version (u16), flags (u16), number of statements (u32), and the offsets (u64) of the string
+  table, of the class table and of the index.
+- Records: one per module statement, each a postfix program rebuilding the statement on a stack. Children are encoded
+  before their parents, so decoding needs no recursion whatever the depth of the tree.
+- String table: number of strings (u32), then the length (u32) and the UTF-8 bytes of each string.
+- Class table: number of classes (u32), then the name (string id, u32) and the number of fields (u16) of each class.
+- Index: per statement, its name (string id, u32, `NO_NAME` if it has none), offset (u64) and size (u64) of its
+  record.
+
+Readers only decode the header, the tables and the index up front, records are decoded on demand.
+"""
+
+import mmap
+import struct
+from os import PathLike
+from typing import Any, Iterator, Optional, Union
+
+from ryon.hlir import nodes
+from ryon.hlir.nodes import ContextNode, HLIRNode, Module
+
+MAGIC = b"RYHL"
+VERSION = 1
+NO_NAME = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHIQQQ")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_CLASS = struct.Struct("<IH")
+_INDEX_ENTRY = struct.Struct("<IQQ")
+
+# Opcodes of the records.
+_NONE = 0
+_STR = 1
+_INT = 2
+_BIG_INT = 3
+_TUPLE = 4
+_NODE = 5
+
+
+def hlir_to_binary(module: Module) -> bytes:
+    """
+    Serializes an HLIR module to the binary format.
+
+    Args:
+        module (Module): The module to serialize.
+
+    Returns:
+        bytes: The serialized module.
+    """
+    encoder = _Encoder()
+    body = bytearray()
+    index = []
+    for statement in module.module_statements:
+        offset = _HEADER.size + len(body)
+        record = encoder.encode(statement)
+        name = encoder.string(statement.get_context_name()) if isinstance(statement, ContextNode) else NO_NAME
+        index.append(_INDEX_ENTRY.pack(name, offset, len(record)))
+        body += record
+
+    classes = bytearray(_U32.pack(len(encoder.classes)))
+    for node_class in encoder.classes:
+        classes += _CLASS.pack(encoder.string(node_class.__name__), len(node_class.schema().fields))
+
+    strings = bytearray(_U32.pack(len(encoder.strings)))
+    for string in encoder.strings:
+        data = string.encode("utf8")
+        strings += _U32.pack(len(data)) + data
+
+    strings_offset = _HEADER.size + len(body)
+    classes_offset = strings_offset + len(strings)
+    index_offset = classes_offset + len(classes)
+    header = _HEADER.pack(MAGIC, VERSION, 0, len(index), strings_offset, classes_offset, index_offset)
+
+    return b"".join((header, body, strings, classes, *index))
+
+
+def binary_to_hlir(data: bytes) -> Module:
+    """
+    Deserializes a whole HLIR module from the binary format.
+
+    Args:
+        data (bytes): The serialized module.
+
+    Returns:
+        Module: The deserialized module.
+    """
+    return BinaryHLIRReader(data).load_module()
+
+
+class BinaryHLIRReader:
+    """
+    Lazy reader of binary HLIR, see `open` to read a file through `mmap`.
+
+    Usage:
+        with BinaryHLIRReader.open("module.hlir") as reader:
+            fn = reader.load_fn("add")
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        self._buffer = buffer
+        self._mmap: Optional[mmap.mmap] = None
+
+        magic, version, _, count, strings_offset, classes_offset, index_offset = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a binary HLIR")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary HLIR version {version}, expected {VERSION}")
+
+        self._strings = self._read_strings(strings_offset)
+        self._classes = self._read_classes(classes_offset)
+        self._index = [_INDEX_ENTRY.unpack_from(buffer, index_offset + i * _INDEX_ENTRY.size) for i in range(count)]
+        self._positions: dict[str, int] = {}
+        for position, (name, _, _) in enumerate(self._index):
+            if name != NO_NAME:
+                self._positions.setdefault(self._strings[name], position)
+
+    @classmethod
+    def open(cls, path: Union[str, PathLike]) -> "BinaryHLIRReader":
+        """
+        Maps a binary HLIR file into memory.
+
+        Args:
+            path (str | PathLike): Path of the file.
+
+        Returns:
+            BinaryHLIRReader: The reader, to be closed after use.
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = cls(buffer)
+        reader._mmap = buffer
+        return reader
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "BinaryHLIRReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def function_names(self) -> list[str]:
+        """Names of the functions in the module, in the order of the module statements."""
+        return [self._strings[name] for name, _, _ in self._index if name != NO_NAME]
+
+    def load_fn(self, name: str) -> nodes.Fn:
+        """
+        Deserializes a single function.
+
+        Args:
+            name (str): Name of the function.
+
+        Returns:
+            Fn: The deserialized function.
+        """
+        try:
+            position = self._positions[name]
+        except KeyError:
+            raise KeyError(f"Function '{name}' not found") from None
+        return self.load_statement(position)
+
+    def load_statement(self, position: int) -> Any:
+        """
+        Deserializes a single module statement.
+
+        Args:
+            position (int): Position of the statement in the module.
+
+        Returns:
+            The deserialized statement.
+        """
+        _, offset, size = self._index[position]
+        return self._decode(offset, offset + size)
+
+    def iter_statements(self) -> Iterator[Any]:
+        """Deserializes the module statements one by one."""
+        for position in range(len(self._index)):
+            yield self.load_statement(position)
+
+    def load_module(self) -> Module:
+        return Module(module_statements=tuple(self.iter_statements()))
+
+    def _read_strings(self, offset: int) -> list[str]:
+        buffer = self._buffer
+        (count,) = _U32.unpack_from(buffer, offset)
+        offset += _U32.size
+        strings = []
+        for _ in range(count):
+            (size,) = _U32.unpack_from(buffer, offset)
+            offset += _U32.size
+            strings.append(bytes(buffer[offset : offset + size]).decode("utf8"))
+            offset += size
+        return strings
+
+    def _read_classes(self, offset: int) -> list[type[HLIRNode]]:
+        (count,) = _U32.unpack_from(self._buffer, offset)
+        classes = []
+        for i in range(count):
+            name, field_count = _CLASS.unpack_from(self._buffer, offset + _U32.size + i * _CLASS.size)
+            node_class = getattr(nodes, self._strings[name], None)
+            if not (isinstance(node_class, type) and issubclass(node_class, HLIRNode)):
+                raise ValueError(f"Unknown HLIR node class '{self._strings[name]}'")
+            if len(node_class.schema().fields) != field_count:
+                raise ValueError(f"HLIR node class '{node_class.__name__}' does not match the serialized one")
+            classes.append(node_class)
+        return classes
+
+    def _decode(self, offset: int, end: int) -> Any:
+        buffer, strings, classes = self._buffer, self._strings, self._classes
+        stack: list[Any] = []
+        while offset < end:
+            opcode = buffer[offset]
+            offset += 1
+            if opcode == _NODE:
+                (class_index,) = _U16.unpack_from(buffer, offset)
+                offset += _U16.size
+                node_class = classes[class_index]
+                count = len(node_class.schema().fields)
+                values = stack[len(stack) - count :]
+                del stack[len(stack) - count :]
+                stack.append(node_class(*values))
+            elif opcode == _STR:
+                (string,) = _U32.unpack_from(buffer, offset)
+                offset += _U32.size
+                stack.append(strings[string])
+            elif opcode == _INT:
+                (value,) = _I64.unpack_from(buffer, offset)
+                offset += _I64.size
+                stack.append(value)
+            elif opcode == _TUPLE:
+                (count,) = _U32.unpack_from(buffer, offset)
+                offset += _U32.size
+                items = tuple(stack[len(stack) - count :])
+                del stack[len(stack) - count :]
+                stack.append(items)
+            elif opcode == _NONE:
+                stack.append(None)
+            elif opcode == _BIG_INT:
+                (size,) = _U32.unpack_from(buffer, offset)
+                offset += _U32.size
+                stack.append(int.from_bytes(buffer[offset : offset + size], "little", signed=True))
+                offset += size
+            else:
+                raise ValueError(f"Corrupted binary HLIR, unknown opcode {opcode}")
+
+        (value,) = stack
+        return value
+
+
+class _Encoder:
+    """Encodes HLIR nodes into postfix records, collecting the strings and the node classes they use."""
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.classes: list[type[HLIRNode]] = []
+        self._string_ids: dict[str, int] = {}
+        self._class_ids: dict[type[HLIRNode], int] = {}
+
+    def string(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def _class(self, node_class: type[HLIRNode]) -> int:
+        class_id = self._class_ids.get(node_class)
+        if class_id is None:
+            class_id = self._class_ids[node_class] = len(self.classes)
+            self.classes.append(node_class)
+        return class_id
+
+    def encode(self, root: HLIRNode) -> bytes:
+        record = bytearray()
+        # Values to encode, or opcodes with their argument to emit once the children are encoded.
+        stack: list[Any] = [root]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, _Emit):
+                record.append(value.opcode)
+                record += value.argument
+            elif isinstance(value, HLIRNode):
+                node_class = value.__class__
+                stack.append(_Emit(_NODE, _U16.pack(self._class(node_class))))
+                stack.extend(getattr(value, name) for name, _ in reversed(node_class.schema().fields))
+            elif isinstance(value, tuple):
+                stack.append(_Emit(_TUPLE, _U32.pack(len(value))))
+                stack.extend(reversed(value))
+            elif isinstance(value, str):
+                record.append(_STR)
+                record += _U32.pack(self.string(value))
+            elif value is None:
+                record.append(_NONE)
+            elif isinstance(value, int) and not isinstance(value, bool):
+                if -(2**63) <= value < 2**63:
+                    record.append(_INT)
+                    record += _I64.pack(value)
+                else:
+                    data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+                    record.append(_BIG_INT)
+                    record += _U32.pack(len(data)) + data
+            else:
+                raise TypeError(f"Cannot serialize {value!r} to binary HLIR")
+        return bytes(record)
+
+
+class _Emit:
+    __slots__ = ("opcode", "argument")
+
+    def __init__(self, opcode: int, argument: bytes):
+        self.opcode = opcode
+        self.argument = argument
@@ -0,0 +1,123 @@
+from typing import Any, Iterator, Optional
+
+from ryon.hlir.nodes import ContextNode, HLIRNode
+
+
+class Context:
+    """
+    Persistent chain of the names of the context nodes enclosing a node, innermost last.
+
+    Contexts are shared by all the nodes they enclose and compare by identity, so they can key per-context tables.
+    """
+
+    __slots__ = ("name", "parent", "_path")
+
+    def __init__(self, name: str, parent: Optional["Context"] = None):
+        self.name = name
+        self.parent = parent
+        self._path: Optional[tuple[str, ...]] = None
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        """Names of the contexts from the outermost one, computed once per context."""
+        if self._path is None:
+            names = []
+            context: Optional[Context] = self
+            while context is not None:
+                names.append(context.name)
+                context = context.parent
+            self._path = tuple(reversed(names))
+        return self._path
+
+    def __repr__(self) -> str:
+        return f"Context({self.path!r})"
+
+
+class Breadcrumb:
+    """
+    Persistent path from the root of a tree to a visited node.
+
+    Pushing a node creates a single cell linked to the path of its parent, so it is O(1) whatever the depth, and
+    sibling paths share their common prefix. The path behaves as a tuple of the nodes from the root: it supports `len`,
+    iteration and indexing, and compares equal to the tuple of its nodes. Indexing walks from the last node, so
+    `breadcrumb[-k]` is O(k). The tuple of the nodes is built once per path, on the first iteration or slicing.
+
+    Attributes:
+        node: The last node of the path, None for the empty path.
+        parent: The path without its last node.
+        context: The context of the last node, see `Context`.
+    """
+
+    __slots__ = ("node", "parent", "context", "_length", "_nodes")
+
+    def __init__(
+        self,
+        node: Optional[HLIRNode] = None,
+        parent: Optional["Breadcrumb"] = None,
+        context: Optional[Context] = None,
+    ):
+        self.node = node
+        self.parent = parent
+        self.context = context
+        self._length: int = 0 if parent is None else len(parent) + 1
+        self._nodes: Optional[tuple[HLIRNode, ...]] = None
+
+    def push(self, node: HLIRNode) -> "Breadcrumb":
+        """
+        Extends the path by a node.
+
+        Args:
+            node (HLIRNode): The child of the last node.
+
+        Returns:
+            Breadcrumb: The extended path, the path itself is unchanged.
+        """
+        context = self.context
+        if isinstance(node, ContextNode):
+            context = Context(node.get_context_name(), context)
+        return Breadcrumb(node, self, context)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __reversed__(self) -> Iterator[HLIRNode]:
+        breadcrumb: Optional[Breadcrumb] = self
+        while breadcrumb is not None and breadcrumb.parent is not None:
+            yield breadcrumb.node  # type: ignore[misc]
+            breadcrumb = breadcrumb.parent
+
+    def __iter__(self) -> Iterator[HLIRNode]:
+        return iter(self._tuple())
+
+    def __getitem__(self, index: Any) -> Any:
+        if not isinstance(index, int):
+            return self._tuple()[index]
+
+        steps = -index - 1 if index < 0 else self._length - index - 1
+        if not 0 <= steps < self._length:
+            raise IndexError("breadcrumb index out of range")
+        breadcrumb = self
+        for _ in range(steps):
+            breadcrumb = breadcrumb.parent  # type: ignore[assignment]
+        return breadcrumb.node
+
+    def _tuple(self) -> tuple[HLIRNode, ...]:
+        if self._nodes is None:
+            self._nodes = tuple(reversed(tuple(reversed(self))))
+        return self._nodes
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Breadcrumb):
+            other = other._tuple()
+        if isinstance(other, tuple):
+            return len(self) == len(other) and self._tuple() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._tuple())
+
+    def __repr__(self) -> str:
+        return f"Breadcrumb({self._tuple()!r})"
+
+
+EMPTY_BREADCRUMB = Breadcrumb()
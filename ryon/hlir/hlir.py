@@ -1,46 +1,70 @@
-from lark import Transformer
+from typing import Optional, TypeVar
 
-from ryon.hlir.nodes import Fn, SimpleType, Arg, Suite, Return, DecimalNumber, Summation, Module, Var
+from lark import Transformer, Tree
+
+from ryon.hlir.interner import HLIRInterner
+from ryon.hlir.nodes import Fn, HLIRNode, SimpleType, Arg, Suite, Return, DecimalNumber, Summation, Module, Var
+from ryon.instrumentation.instrumentation import HLIR, phase
+
+N = TypeVar("N", bound=HLIRNode)
 
 
 class HLIRTransformer(Transformer):
-    def __init__(self):
-        pass
+    def __init__(self, interner: Optional[HLIRInterner] = None):
+        """
+        Args:
+            interner: When given, every created node is interned, so equal subtrees of the HLIR are shared.
+        """
+        self._interner = interner
+
+    def transform(self, tree: Tree) -> HLIRNode:
+        with phase("transform", HLIR) as span:
+            hlir = super().transform(tree)
+            span.nodes(hlir)
+        return hlir
+
+    def _node(self, node: N) -> N:
+        return node if self._interner is None else self._interner(node)
 
     def module(self, node):
-        return Module(module_statements=tuple(node))
+        return self._node(Module(module_statements=tuple(node)))
 
     def function_definition(self, node):
         function_name, arguments, return_type, suite = node
+        if arguments is None:
+            arguments = ()
+        elif isinstance(arguments, Arg):
+            # `?function_arguments` inlines a single argument
+            arguments = (arguments,)
 
-        return Fn(name=function_name, type=return_type, args=arguments if arguments is not None else (), body=suite)
+        return self._node(Fn(name=function_name, type=return_type, args=arguments, body=suite))
 
     def suite(self, node):
-        return Suite(statements=tuple(node))
+        return self._node(Suite(statements=tuple(node)))
 
     def return_statement(self, node):
-        return Return(expression=node[0])
+        return self._node(Return(expression=node[0]))
 
     def summation(self, node):
-        return Summation(addends=tuple(node))
+        return self._node(Summation(addends=tuple(node)))
 
     def DECIMAL_NUMBER(self, node):
-        return DecimalNumber(value=int(node.value))
+        return self._node(DecimalNumber(value=int(node.value)))
 
     def function_argument(self, node):
-        return Arg(name=node[0], type=node[1])
+        return self._node(Arg(name=node[0], type=node[1]))
 
     def function_arguments(self, node):
         return tuple(node)
 
     def simple_type(self, node):
-        return SimpleType(name=node[0])
+        return self._node(SimpleType(name=node[0]))
 
     def UPPER_CAMEL_CASE_NAME(self, node):
         return node.value
 
     def variable_identifier(self, node):
-        return Var(name=node[0], type=None)
+        return self._node(Var(name=node[0], type=None))
 
     def SNAKE_CASE_NAME(self, node):
         return node.value
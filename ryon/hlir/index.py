@@ -0,0 +1,208 @@
+from bisect import bisect_left
+from heapq import merge
+from typing import Optional, TypeVar, Union
+
+from ryon.hlir.nodes import NODE, NODE_TUPLE, ContextNode, Fn, HLIRNode
+
+N = TypeVar("N", bound=HLIRNode)
+
+NodeRef = Union[HLIRNode, int]
+"""A node of the indexed tree, or its preorder position."""
+
+
+class HLIRIndex:
+    """
+    Index of an HLIR tree: nodes grouped by type, parent and enclosing context links, and preorder positions.
+
+    The index is built on the first query, by a single walk of the tree. Every node of a subtree has a preorder
+    position between the position of its root and the end of the subtree, so the nodes of a type within a subtree are
+    found by bisecting the sorted positions of that type, in O(log N + result).
+
+    Subtrees shared by `HLIRInterner` occur at several positions. Queries taking a node resolve it to its first
+    occurrence, so the results of `of_type` lose which occurrence they were found at. Pass positions instead, as
+    returned by `type_positions` or `positions`, to query a specific occurrence.
+
+    Usage:
+        index = HLIRIndex(module)
+        summations = index.of_type(Summation, within=index.fn("add"))
+        enclosing_fns = [index.context(position) for position in index.type_positions(Summation)]
+    """
+
+    def __init__(self, root: HLIRNode):
+        self.root = root
+        self._nodes: Optional[list[HLIRNode]] = None
+        self._parents: list[int] = []
+        self._ends: list[int] = []
+        self._contexts: list[int] = []
+        # Positions of the nodes by their exact class, and by queried class including subclasses.
+        self._by_type: dict[type, list[int]] = {}
+        self._by_queried_type: dict[type, list[int]] = {}
+        self._positions: dict[int, list[int]] = {}
+        self._fns: Optional[dict[str, int]] = None
+
+    def _build(self) -> list[HLIRNode]:
+        nodes: list[HLIRNode] = []
+        parents, ends, contexts = self._parents, self._ends, self._contexts
+        by_type, positions = self._by_type, self._positions
+
+        # Entries are (node, parent position, context position), or the position of a node whose subtree is done.
+        stack: list = [(self.root, -1, -1)]
+        while stack:
+            task = stack.pop()
+            if isinstance(task, int):
+                ends[task] = len(nodes)
+                continue
+
+            node, parent, context = task
+            position = len(nodes)
+            nodes.append(node)
+            parents.append(parent)
+            ends.append(-1)
+            contexts.append(context)
+            by_type.setdefault(node.__class__, []).append(position)
+            positions.setdefault(id(node), []).append(position)
+
+            child_context = position if isinstance(node, ContextNode) else context
+            children = []
+            for name, kind in node.schema().fields:
+                value = getattr(node, name)
+                if kind == NODE:
+                    if value is not None:
+                        children.append(value)
+                elif kind == NODE_TUPLE:
+                    children.extend(item for item in value if isinstance(item, HLIRNode))
+
+            stack.append(position)
+            stack.extend((child, position, child_context) for child in reversed(children))
+
+        self._nodes = nodes
+        return nodes
+
+    @property
+    def nodes(self) -> list[HLIRNode]:
+        """The nodes in preorder, shared subtrees appear at each of their occurrences."""
+        return self._nodes if self._nodes is not None else self._build()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, position: int) -> HLIRNode:
+        return self.nodes[position]
+
+    def positions(self, node: HLIRNode) -> list[int]:
+        """
+        Returns the preorder positions of the occurrences of a node, compared by identity.
+
+        Raises:
+            KeyError: The node is not in the tree.
+        """
+        self._ensure_built()
+        try:
+            return self._positions[id(node)]
+        except KeyError:
+            raise KeyError(f"{node!r} is not in the indexed tree") from None
+
+    def position(self, node: NodeRef) -> int:
+        """
+        Returns the preorder position of the first occurrence of a node, positions are returned as they are.
+
+        Raises:
+            KeyError: The node is not in the tree.
+            IndexError: The position is out of the tree.
+        """
+        if isinstance(node, int):
+            if not 0 <= node < len(self):
+                raise IndexError(f"Position {node} is out of the indexed tree of {len(self)} nodes")
+            return node
+        return self.positions(node)[0]
+
+    def parent(self, node: NodeRef) -> Optional[HLIRNode]:
+        """Returns the parent of a node, None for the root."""
+        parent = self._parents[self.position(node)]
+        return self.nodes[parent] if parent >= 0 else None
+
+    def ancestors(self, node: NodeRef) -> list[HLIRNode]:
+        """Returns the ancestors of a node, the parent first."""
+        ancestors = []
+        parent = self._parents[self.position(node)]
+        while parent >= 0:
+            ancestors.append(self.nodes[parent])
+            parent = self._parents[parent]
+        return ancestors
+
+    def context(self, node: NodeRef) -> Optional[ContextNode]:
+        """Returns the innermost context node strictly enclosing a node, e.g. the `Fn` of a statement."""
+        context = self._contexts[self.position(node)]
+        return self.nodes[context] if context >= 0 else None  # type: ignore[return-value]
+
+    def descendants(self, node: NodeRef) -> list[HLIRNode]:
+        """Returns the descendants of a node in preorder, excluding the node itself."""
+        position = self.position(node)
+        return self.nodes[position + 1 : self._ends[position]]
+
+    def of_type(self, node_type: type[N], within: Optional[NodeRef] = None) -> list[N]:
+        """
+        Returns the nodes of a type, subclasses included, in preorder.
+
+        Args:
+            node_type (type[N]): The node class.
+            within (HLIRNode | int, optional): Restricts the result to the subtree of this node, the node included.
+
+        Returns:
+            list[N]: The nodes, a shared subtree appears at each of its occurrences.
+        """
+        nodes = self.nodes
+        return [nodes[position] for position in self._select(node_type, within)]  # type: ignore[misc]
+
+    def type_positions(self, node_type: type, within: Optional[NodeRef] = None) -> list[int]:
+        """
+        Returns the preorder positions of the nodes of a type, subclasses included, see `of_type`.
+
+        The positions identify the occurrences of shared subtrees, unlike the nodes returned by `of_type`, so they can
+        be passed back to the other queries.
+
+        Args:
+            node_type (type): The node class.
+            within (HLIRNode | int, optional): Restricts the result to the subtree of this node, the node included.
+
+        Returns:
+            list[int]: The sorted positions.
+        """
+        return list(self._select(node_type, within))
+
+    def _select(self, node_type: type, within: Optional[NodeRef]) -> list[int]:
+        # The positions of all the nodes of the type are cached, they must not be modified.
+        positions = self._type_positions(node_type)
+        if within is None:
+            return positions
+        start = self.position(within)
+        return positions[bisect_left(positions, start) : bisect_left(positions, self._ends[start])]
+
+    def fn(self, name: str) -> Fn:
+        """
+        Returns the first function of the name.
+
+        Raises:
+            KeyError: No function has the name.
+        """
+        if self._fns is None:
+            self._fns = {}
+            for position in self._type_positions(Fn):
+                self._fns.setdefault(self.nodes[position].name, position)  # type: ignore[attr-defined]
+        return self.nodes[self._fns[name]]  # type: ignore[return-value]
+
+    def _ensure_built(self) -> None:
+        if self._nodes is None:
+            self._build()
+
+    def _type_positions(self, node_type: type) -> list[int]:
+        self._ensure_built()
+        positions = self._by_queried_type.get(node_type)
+        if positions is None:
+            matching = [
+                class_positions for class_, class_positions in self._by_type.items() if issubclass(class_, node_type)
+            ]
+            # Base classes merge the sorted positions of their subclasses, once per queried class.
+            positions = matching[0] if len(matching) == 1 else list(merge(*matching))
+            self._by_queried_type[node_type] = positions
+        return positions
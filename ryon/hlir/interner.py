@@ -0,0 +1,62 @@
+from typing import Any, TypeVar
+
+from ryon.hlir.nodes import HLIRNode
+from ryon.hlir.visitor import Visitor
+
+N = TypeVar("N", bound=HLIRNode)
+
+
+class HLIRInterner:
+    """
+    Hash-consing factory of HLIR nodes.
+
+    Structurally equal nodes are replaced by a single shared instance, so repeated subtrees such as
+    `SimpleType(name="I32")` are stored once and comparing trees built by the same interner is O(1) for their shared
+    subtrees.
+
+    Usage:
+        interner = HLIRInterner()
+        i32 = interner(SimpleType(name="I32"))
+        assert interner(SimpleType(name="I32")) is i32
+
+        module = interner.intern_tree(module)
+    """
+
+    def __init__(self):
+        self._nodes: dict[HLIRNode, HLIRNode] = {}
+
+    def __call__(self, node: N) -> N:
+        """
+        Returns the shared instance equal to the node, the children of the node are expected to be interned already.
+
+        Args:
+            node (N): The node to intern.
+
+        Returns:
+            N: The shared instance, the node itself when it is the first one of its kind.
+        """
+        return self._nodes.setdefault(node, node)  # type: ignore[return-value]
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def intern_tree(self, node: N) -> N:
+        """
+        Interns a whole tree bottom-up.
+
+        Args:
+            node (N): Root of the tree.
+
+        Returns:
+            N: The shared instance of the tree.
+        """
+        return _InternVisitor(self).visit(node, iterative=True)
+
+
+class _InternVisitor(Visitor):
+    def __init__(self, interner: HLIRInterner):
+        self._interner = interner
+
+    def __default__(self, node: HLIRNode, parent_data: Any, breadcrump: Any) -> Any:
+        children_data = yield
+        yield self._interner(node.__class__(**children_data))
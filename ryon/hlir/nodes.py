@@ -1,78 +1,186 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Any, Callable, Optional, cast, get_args, get_origin
+
+# Kinds of fields of HLIR nodes, see `NodeSchema`.
+NODE = "node"
+NODE_TUPLE = "node_tuple"
+SCALAR = "scalar"
 
 
 @dataclass(frozen=True)
-class HLIRNode:
-    pass
+class NodeSchema:
+    """
+    Public fields of an HLIR node class split by what they hold.
+
+    Attributes:
+        fields: Pairs of field name and its kind (`NODE`, `NODE_TUPLE` or `SCALAR`) in declaration order.
+        nodes: Fields holding a child node, or None.
+        node_tuples: Fields holding a tuple of child nodes.
+        scalars: Fields holding a plain value.
+    """
+
+    fields: tuple[tuple[str, str], ...]
+    nodes: tuple[str, ...]
+    node_tuples: tuple[str, ...]
+    scalars: tuple[str, ...]
+    # Returns the values of the fields of a node, the value itself when there is a single field.
+    values: Callable[[Any], Any] = field(compare=False, repr=False)
+
+    @classmethod
+    def of(cls, node_class: type["HLIRNode"]) -> "NodeSchema":
+        kinds = tuple(
+            (field.name, _field_kind(field.type))
+            for field in fields(cast(Any, node_class))
+            if not field.name.startswith("_")
+        )
+        return cls(
+            fields=kinds,
+            nodes=tuple(name for name, kind in kinds if kind == NODE),
+            node_tuples=tuple(name for name, kind in kinds if kind == NODE_TUPLE),
+            scalars=tuple(name for name, kind in kinds if kind == SCALAR),
+            values=attrgetter(*(name for name, _ in kinds)) if kinds else _no_values,
+        )
+
+
+def _no_values(node: "HLIRNode") -> tuple[()]:
+    return ()
+
+
+def _holds_node(annotation: Any) -> bool:
+    if isinstance(annotation, type):
+        return issubclass(annotation, HLIRNode)
+    return any(_holds_node(arg) for arg in get_args(annotation))
+
+
+def _field_kind(annotation: Any) -> str:
+    if not _holds_node(annotation):
+        return SCALAR
+    if get_origin(annotation) is tuple:
+        return NODE_TUPLE
+    return NODE
+
+
+# Schemas of the HLIR node classes, see `HLIRNode.schema`.
+_schemas: dict[type["HLIRNode"], NodeSchema] = {}
 
 
-@dataclass(frozen=True)
+class HLIRNode:
+    """
+    Base of the HLIR nodes.
+
+    Nodes are immutable slotted dataclasses, declared with `eq=False` so that they inherit the equality and hashing
+    defined here. The hash of a node is computed on first use and stored in the node. A node is always equal to itself
+    and nodes with different stored hashes are never equal, so comparing trees sharing their subtrees (see
+    `HLIRInterner`) does not walk the shared subtrees.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: Optional[int]
+
+    @classmethod
+    def schema(cls) -> NodeSchema:
+        """
+        Returns the schema of the node class, it is computed on the first call.
+        """
+        try:
+            return _schemas[cls]
+        except KeyError:
+            schema = _schemas[cls] = NodeSchema.of(cls)
+            return schema
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", None)
+
+    def __hash__(self) -> int:
+        value = self._hash
+        if value is None:
+            values = (_schemas.get(self.__class__) or self.schema()).values
+            value = hash((self.__class__, values(self)))
+            object.__setattr__(self, "_hash", value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:  # type: ignore[attr-defined]
+            return False
+        values = (_schemas.get(self.__class__) or self.schema()).values
+        return values(self) == values(other)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, tuple(getattr(self, name) for name, _ in self.schema().fields)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class ContextNode(ABC, HLIRNode):
     @abstractmethod
     def get_context_name(self):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TypeNode(HLIRNode):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class SimpleType(TypeNode):
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Arg(HLIRNode):
     name: str
     type: TypeNode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Var(HLIRNode):
     name: str
     type: Optional[TypeNode]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class LiteralNode(HLIRNode):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class DecimalNumber(LiteralNode):
     value: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ExpressionNode(HLIRNode):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Summation(ExpressionNode):
     addends: tuple[ExpressionNode | LiteralNode | Var, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class StatementNode(HLIRNode):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Return(StatementNode):
     expression: ExpressionNode | LiteralNode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Suite(HLIRNode):
     statements: tuple[StatementNode, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Fn(ContextNode):
     name: str
     type: TypeNode
@@ -83,6 +191,6 @@ class Fn(ContextNode):
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Module(HLIRNode):
     module_statements: tuple[Fn, ...]
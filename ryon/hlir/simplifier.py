@@ -0,0 +1,95 @@
+from typing import Any, TypeVar
+
+from ryon.hlir.nodes import DecimalNumber, Fn, HLIRNode, Summation
+from ryon.hlir.visitor import Visitor
+
+N = TypeVar("N", bound=HLIRNode)
+
+INTEGER_TYPES = frozenset({"I8", "I16", "I32", "I64", "I128", "U8", "U16", "U32", "U64", "U128"})
+# Range of the folded constants, `RyonCompiler` emits decimal numbers as i32.
+_CONSTANT_MIN, _CONSTANT_MAX = -(2**31), 2**31 - 1
+
+
+def simplify(node: N) -> N:
+    """
+    Simplifies an HLIR tree before code generation, see `HLIRSimplifier`.
+
+    Args:
+        node (N): Root of the tree.
+
+    Returns:
+        N: The simplified tree, subtrees which did not change are kept by identity.
+    """
+    return HLIRSimplifier().visit(node, iterative=True)
+
+
+class HLIRSimplifier(Visitor):
+    """
+    Rewrites HLIR into a simpler equivalent, bottom-up. In the summations of functions whose arguments and result are
+    all integers:
+
+    - Nested `Summation`s are flattened into their parent.
+    - The constant addends of a `Summation` are combined into a single trailing `DecimalNumber`, which is dropped when
+      it is zero. Constants whose sum does not fit an i32 are kept as they are.
+    - A `Summation` left with a single addend is replaced by the addend, so all-constant sums fold into a
+      `DecimalNumber`.
+
+    Integer addition wraps around, so it is associative and reordering the terms does not change the result. Floating
+    point summations, and summations outside of a function, are kept in their order, reassociating them is left to
+    `RyonCompiler(reassociate_floats=True)`.
+    """
+
+    def fn(self, node: Fn, parent_data: Any, breadcrump: Any) -> Any:
+        # Whether the summations of the function are integer ones, passed down to them as the parent data.
+        types = (node.type, *(arg.type for arg in node.args))
+        children_data = yield all(getattr(type_, "name", None) in INTEGER_TYPES for type_ in types)
+        yield _rebuild(node, children_data)
+
+    def summation(self, node: Summation, integer: Any, breadcrump: Any) -> Any:
+        children_data = yield integer
+        if not integer:
+            yield _rebuild(node, children_data)
+            return
+
+        addends: list[Any] = []
+        constants: list[DecimalNumber] = []
+        for addend in children_data["addends"]:
+            for item in addend.addends if isinstance(addend, Summation) else (addend,):
+                if isinstance(item, DecimalNumber):
+                    constants.append(item)
+                else:
+                    addends.append(item)
+
+        total = sum(constant.value for constant in constants)
+        if len(constants) > 1 and _CONSTANT_MIN <= total <= _CONSTANT_MAX:
+            addends.append(DecimalNumber(value=total))
+        else:
+            addends.extend(constants)
+        if len(addends) > 1 and addends[-1] == DecimalNumber(value=0):
+            addends.pop()
+
+        if len(addends) == 1:
+            yield addends[0]
+        elif _same(addends, node.addends):
+            yield node
+        else:
+            yield Summation(addends=tuple(addends))
+
+    def __default__(self, node: HLIRNode, parent_data: Any, breadcrump: Any) -> Any:
+        children_data = yield parent_data
+        yield _rebuild(node, children_data)
+
+
+def _rebuild(node: N, children_data: dict[str, Any]) -> N:
+    """Returns the node with its simplified children, the node itself when none of them changed."""
+    if all(_same(value, getattr(node, name)) for name, value in children_data.items()):
+        return node
+    return node.__class__(**children_data)
+
+
+def _same(value: Any, original: Any) -> bool:
+    if isinstance(original, tuple):
+        return len(value) == len(original) and all(
+            item is item_original for item, item_original in zip(value, original)
+        )
+    return value is original
@@ -1,10 +1,12 @@
 import inspect
 import keyword
 import re
-from dataclasses import fields
-from typing import Any, Dict, Optional
+from types import GeneratorType
+from typing import Any, Callable, Dict, Optional
 
-from ryon.hlir.nodes import HLIRNode
+from ryon.hlir.breadcrumb import EMPTY_BREADCRUMB, Breadcrumb
+from ryon.hlir.nodes import NODE, NODE_TUPLE, HLIRNode
+from ryon.instrumentation.instrumentation import VISITOR, phase
 
 
 class Visitor:
@@ -14,7 +16,8 @@ class Visitor:
     This class manages the recursive visiting of each node in the high-level intermediate representation (HLIR)
     tree of the 'ryon' language. The traversal process involves:
 
-    1. Identifying the corresponding visit method based on the node's type, which is named in snake_case.
+    1. Identifying the corresponding visit method based on the node's type, which is named in snake_case. The method
+       is resolved once per visitor class and node class.
     2. Invoking the visit method with the node as an argument.
     3. Utilizing generator functions in visit methods to facilitate both top-down and bottom-up traversal.
        This allows initial processing before and further actions after the traversal of child nodes,
@@ -66,7 +69,15 @@ class Visitor:
         result = custom_visitor.visit(hlir)
     """
 
-    def visit(self, node: HLIRNode) -> Any:
+    # Visit methods resolved per node class, as found in the class dictionaries, every visitor class has its own
+    # table (see `__init_subclass__`). They are bound once per node class and `visit` call, see `_bound_method`.
+    _dispatch_table: Dict[type, Any] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_table = {}
+
+    def visit(self, node: HLIRNode, iterative: bool = False) -> Any:
         """
         Visits an HLIRNode recursively, handling child node processing.
 
@@ -76,21 +87,35 @@ class Visitor:
 
         Args:
             node: Root node to visit.
+            iterative: Traverse the tree using an explicit stack instead of recursion. The visit methods are called in
+                the same order with the same arguments, but the depth of the tree is not limited by the recursion limit
+                and fewer objects are allocated per node.
 
         Returns:
             The result of visiting the node, potentially transformed.
         """
-        generator = self._visit(node)
-        try:
-            result = next(generator)
-            while True:
-                next(generator)
-        except StopIteration:
-            pass
+        with phase(type(self).__name__, VISITOR) as span:
+            span.nodes(node)
+            if iterative:
+                return self._visit_iterative(node)
+
+            generator = self._visit(node, handlers={})
+            try:
+                result = next(generator)
+                while True:
+                    next(generator)
+            except StopIteration:
+                pass
 
-        return result
+            return result
 
-    def _visit(self, node: HLIRNode, parent_data: Optional[Any] = None, breadcrump: tuple[HLIRNode, ...] = ()) -> Any:
+    def _visit(
+        self,
+        node: HLIRNode,
+        parent_data: Optional[Any] = None,
+        breadcrump: Breadcrumb = EMPTY_BREADCRUMB,
+        handlers: Optional[Dict[type, Callable[..., Any]]] = None,
+    ) -> Any:
         """
         Recursively visits an HLIRNode, handling child node processing.
 
@@ -99,31 +124,29 @@ class Visitor:
 
         Args:
             node: Node to visit.
+            handlers: Bound visit methods by node class, shared by the whole traversal.
 
         Yields:
             The result of visiting the node, potentially transformed.
         """
 
-        children_nodes = self._get_children_nodes(node)
-
-        method_name = self._camel_to_snake(node.__class__.__name__)
-        method = getattr(self, method_name, self.__default__)
+        if handlers is None:
+            handlers = {}
+        method = handlers.get(node.__class__)
+        if method is None:
+            method = handlers[node.__class__] = self._bound_method(node.__class__)
         visitor_gen = method(node, parent_data, self._transform_breadcrump(breadcrump))
 
-        if inspect.isgenerator(visitor_gen):
+        is_generator = inspect.isgenerator(visitor_gen)
+        if is_generator:
             node_data = next(visitor_gen)
         else:
             node_data = visitor_gen
 
-        children_generators = {
-            child_name: self._children_generator(child, node_data, breadcrump + (node,))
-            for child_name, child in children_nodes.items()
-        }
-
-        children_data = {child_name: self._next(child_gen) for child_name, child_gen in children_generators.items()}
+        children_data = self._visit_children(node, node_data, breadcrump.push(node), handlers)
 
         final_data = None
-        if inspect.isgenerator(visitor_gen):
+        if is_generator:
             try:
                 final_data = visitor_gen.send(children_data)
             except StopIteration:
@@ -133,85 +156,181 @@ class Visitor:
 
         yield final_data
 
-    def __default__(self, node: HLIRNode, children_data: Any, breadcrump: Any) -> Any:
+    def _visit_children(
+        self,
+        node: HLIRNode,
+        node_data: Any,
+        breadcrump: Breadcrumb,
+        handlers: Optional[Dict[type, Callable[..., Any]]] = None,
+    ) -> Dict[str, Any]:
         """
-        The default method called if no specific visitor method exists for a node type.
+        Visits the children of a node as described by the schema of its class.
 
-        This method can be overridden in subclasses to provide default behavior for unhandled node types.
+        Child nodes and tuples of child nodes are visited recursively, other field values are passed unchanged.
 
         Args:
-           node: The node being visited.
-           children_data: The data of the node's children.
+            node: The node whose children are visited.
+            node_data: Data of the node passed to its children.
+            breadcrump: Path from the root to the node, including the node.
+            handlers: Bound visit methods by node class, see `_visit`.
 
         Returns:
-           The node itself, typically unchanged.
+            A dictionary mapping field names to the visited children, tuples of visited children, or other field
+            values.
         """
-        return node
-
-    def _transform_breadcrump(self, breadcrump: tuple[HLIRNode, ...]) -> Any:
-        return breadcrump
-
-    def _get_children_nodes(self, node: HLIRNode) -> Dict[str, Any]:
+        children_data = {}
+        for name, kind in node.schema().fields:
+            child = getattr(node, name)
+            if kind == NODE:
+                if isinstance(child, HLIRNode):
+                    child = next(self._visit(child, node_data, breadcrump, handlers))
+            elif kind == NODE_TUPLE:
+                child = tuple(
+                    next(self._visit(item, node_data, breadcrump, handlers)) if isinstance(item, HLIRNode) else item
+                    for item in child
+                )
+            children_data[name] = child
+        return children_data
+
+    def _visit_iterative(self, root: HLIRNode) -> Any:
         """
-        Retrieves the children of a given HLIRNode.
+        Visits the tree depth-first using an explicit stack of pending work instead of recursion.
 
-        This method collects all child nodes of the given node, ignoring private attributes.
+        Entering a node calls its visit method up to the first yield and pushes a task to finish the node, followed by
+        tasks to enter its children. The children data are collected into containers shared with the finishing task,
+        which sends them to the suspended visit method.
 
         Args:
-            node: The node whose children are to be retrieved.
+            root: Root node to visit.
 
         Returns:
-            A dictionary mapping field names to their corresponding child nodes, tuples of child nodes, or other field
-            values.
+            The result of visiting the root.
         """
-        children = {}
-        for field in fields(node):
-            if field.name.startswith("_"):
+        result: list[Any] = [None]
+        transform_breadcrump = self._transform_breadcrump
+        # Visit method, fields and tuple fields by node class.
+        node_classes: Dict[type, tuple[Callable[..., Any], tuple[tuple[str, str], ...], tuple[str, ...]]] = {}
+        # Entering tasks are (node, parent_data, breadcrump, target, key), finishing tasks are
+        # (None, visitor_gen, node_data, children_data, tuple_fields, target, key). The result of a node is stored
+        # into `target[key]`.
+        stack: list[tuple] = [(root, None, EMPTY_BREADCRUMB, result, 0)]
+        pop, push, extend = stack.pop, stack.append, stack.extend
+        while stack:
+            task = pop()
+            node = task[0]
+
+            if node is None:
+                _, visitor_gen, node_data, finished_data, tuple_fields, target, key = task
+                for name in tuple_fields:
+                    finished_data[name] = tuple(finished_data[name])
+                if visitor_gen is None:
+                    target[key] = node_data
+                else:
+                    try:
+                        target[key] = visitor_gen.send(finished_data)
+                    except StopIteration:
+                        target[key] = None
                 continue
-            child = getattr(node, field.name)
-            children[field.name] = child
-        return children
 
-    def _children_generator(self, child: Any, parent_data, breadcrump: tuple[HLIRNode, ...]) -> Any:
+            _, parent_data, breadcrump, target, key = task
+            node_class = node.__class__
+            try:
+                method, fields, tuple_fields = node_classes[node_class]
+            except KeyError:
+                method = self._bound_method(node_class)
+                schema = node_class.schema()
+                fields, tuple_fields = schema.fields, schema.node_tuples
+                node_classes[node_class] = method, fields, tuple_fields
+
+            visitor_gen = method(node, parent_data, transform_breadcrump(breadcrump))
+            if isinstance(visitor_gen, GeneratorType):
+                node_data = next(visitor_gen)
+            else:
+                node_data, visitor_gen = visitor_gen, None
+
+            children_data: Dict[str, Any] = {}
+            push((None, visitor_gen, node_data, children_data, tuple_fields, target, key))
+
+            breadcrump = breadcrump.push(node)
+            children: list[tuple] = []
+            for name, kind in fields:
+                child = getattr(node, name)
+                if kind == NODE and isinstance(child, HLIRNode):
+                    children_data[name] = None
+                    children.append((child, node_data, breadcrump, children_data, name))
+                elif kind == NODE_TUPLE:
+                    values = list(child)
+                    children_data[name] = values
+                    for index, item in enumerate(values):
+                        if isinstance(item, HLIRNode):
+                            children.append((item, node_data, breadcrump, values, index))
+                else:
+                    children_data[name] = child
+            extend(reversed(children))
+
+        return result[0]
+
+    def _bound_method(self, node_class: type) -> Callable[..., Any]:
         """
-        Creates a generator for visiting a child node or processing a tuple of child nodes.
+        Returns the visit method of a node class bound to the visitor, as `getattr(self, name)` would.
 
-        This method handles recursion for each child node appropriately. Tuples containing `HLIRNode`
-        instances are processed recursively, while other values are returned unchanged.
+        Visit methods set on the instance take precedence over the dispatch table. Methods of the class are bound
+        through their descriptors, so static and class methods receive the arguments they declare.
+        """
+        name = self._camel_to_snake(node_class.__name__)
+        instance_methods = getattr(self, "__dict__", {})
+        if name in instance_methods:
+            return instance_methods[name]
+
+        method = self._dispatch_table.get(node_class)
+        if method is None:
+            method = self._resolve_method(node_class)
+        if "__default__" in instance_methods and self._lookup(name) is None:
+            return instance_methods["__default__"]
+        return method.__get__(self, type(self))
+
+    @classmethod
+    def _resolve_method(cls, node_class: type) -> Any:
+        """
+        Finds the visit method of a node class and stores it in the dispatch table of the visitor class.
 
         Args:
-            child: The child node, tuple of child nodes, or other value to visit or process.
+            node_class: The class of the visited node.
 
         Returns:
-            A generator for the visited child node, a tuple of visited child nodes, or the unchanged value.
-        """
-        if isinstance(child, HLIRNode):
-            return self._visit(child, parent_data, breadcrump)
-        elif isinstance(child, tuple):
-            # Only process tuples containing HLIRNodes
-            if any(isinstance(c, HLIRNode) for c in child):
-                return tuple(self._visit(c, parent_data, breadcrump) if isinstance(c, HLIRNode) else c for c in child)
-            else:
-                return child
-        else:
-            return child
+            The visit method as found in the class dictionary, e.g. a function or a `staticmethod`, the `__default__`
+            method if the visitor does not implement one.
+        """
+        method = cls._lookup(cls._camel_to_snake(node_class.__name__))
+        if method is None:
+            method = cls._lookup("__default__")
+        cls._dispatch_table[node_class] = method
+        return method
+
+    @classmethod
+    def _lookup(cls, name: str) -> Any:
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                return klass.__dict__[name]
+        return None
 
-    def _next(self, child_gen):
+    def __default__(self, node: HLIRNode, children_data: Any, breadcrump: Any) -> Any:
         """
-        Advances the generator to the next yield point or retrieves the value for tuples and other types.
+        The default method called if no specific visitor method exists for a node type.
+
+        This method can be overridden in subclasses to provide default behavior for unhandled node types.
 
         Args:
-            child_gen: The generator or value to advance or process.
+           node: The node being visited.
+           children_data: The data of the node's children.
 
         Returns:
-            The next yielded value from the generator, a tuple of values, or the original value.
+           The node itself, typically unchanged.
         """
-        if inspect.isgenerator(child_gen):
-            return next(child_gen)
-        elif isinstance(child_gen, tuple):
-            return tuple(self._next(item) for item in child_gen)
-        else:
-            return child_gen
+        return node
+
+    def _transform_breadcrump(self, breadcrump: Breadcrumb) -> Any:
+        return breadcrump
 
     @staticmethod
     def _camel_to_snake(camel: str) -> str:
@@ -1,25 +1,73 @@
+from typing import IO, Optional
+
 import yaml
-from ryon.hlir.nodes import HLIRNode
+from ryon.hlir.nodes import HLIRNode, Module
+
+try:
+    from yaml import CDumper
+except ImportError:  # PyYAML built without libyaml
+    CDumper = yaml.Dumper  # type: ignore[misc, assignment]
+
+
+def _ignore_aliases(dumper: yaml.representer.BaseRepresenter, data: object) -> bool:
+    # HLIR is immutable, subtrees shared by `HLIRInterner` or by arena views are written out in full, as anchors would
+    # make the dump depend on how the tree is stored.
+    return isinstance(data, (HLIRNode, tuple)) or yaml.representer.SafeRepresenter.ignore_aliases(dumper, data)
 
 
 class YAMLHLIRDumper(yaml.Dumper):
     """Custom YAML dumper for handling HLIR."""
 
-    pass
+    ignore_aliases = _ignore_aliases
+
+
+class CYAMLHLIRDumper(CDumper):
+    """Variant of `YAMLHLIRDumper` emitting through libyaml, falls back to the pure Python emitter without libyaml."""
+
+    ignore_aliases = _ignore_aliases
 
 
 def hlir_node_representer(dumper: YAMLHLIRDumper, data: HLIRNode) -> yaml.nodes.MappingNode:
-    return dumper.represent_mapping(f"!node.{data.__class__.__name__}", data.__dict__)
+    fields = {name: getattr(data, name) for name, _ in data.schema().fields}
+    return dumper.represent_mapping(f"!node.{data.__class__.__name__}", fields)
 
 
 def hlir_tuple_representer(dumper: YAMLHLIRDumper, data: tuple) -> yaml.nodes.SequenceNode:
     return dumper.represent_list(data)
 
 
-# Register custom representers to the custom YAML dumper
-YAMLHLIRDumper.add_multi_representer(HLIRNode, hlir_node_representer)
-YAMLHLIRDumper.add_representer(tuple, hlir_tuple_representer)
+# Register custom representers to the custom YAML dumpers
+for _dumper in (YAMLHLIRDumper, CYAMLHLIRDumper):
+    _dumper.add_multi_representer(HLIRNode, hlir_node_representer)
+    _dumper.add_representer(tuple, hlir_tuple_representer)
+
+
+def hlir_to_yaml(node: HLIRNode, dumper: type = CYAMLHLIRDumper) -> str:
+    return yaml.dump(node, Dumper=dumper, indent=4, width=80, sort_keys=False)
+
+
+def hlir_to_yaml_stream(
+    module: Module, stream: Optional[IO[str]] = None, dumper: type = CYAMLHLIRDumper
+) -> Optional[str]:
+    """
+    Dumps each statement of the module as a separate YAML document, see `yaml_stream_to_hlir`.
+
+    Documents are written one after another, so only one function is represented in memory at a time.
 
+    Args:
+        module (Module): The module to dump.
+        stream (IO[str], optional): Where to write the documents, they are returned as a string when omitted.
+        dumper (type): The dumper class, `CYAMLHLIRDumper` or `YAMLHLIRDumper`.
 
-def hlir_to_yaml(node: HLIRNode) -> str:
-    return yaml.dump(node, Dumper=YAMLHLIRDumper, indent=4, width=80, sort_keys=False)
+    Returns:
+        str | None: The documents if no stream was given.
+    """
+    return yaml.dump_all(
+        iter(module.module_statements),
+        stream,
+        Dumper=dumper,
+        indent=4,
+        width=80,
+        sort_keys=False,
+        explicit_start=True,
+    )
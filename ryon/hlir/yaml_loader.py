@@ -1,14 +1,23 @@
 import yaml
-from typing import Any
+from typing import IO, Any, Iterator
 from ryon.hlir import nodes
 
 from ryon.hlir.nodes import HLIRNode
 
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    CSafeLoader = yaml.SafeLoader  # type: ignore[misc, assignment]
+
 
 class YAMLHLIRLoader(yaml.SafeLoader):
     """Custom YAML loader to deserialize HLIR."""
 
 
+class CYAMLHLIRLoader(CSafeLoader):
+    """Variant of `YAMLHLIRLoader` parsing through libyaml, falls back to the pure Python parser without libyaml."""
+
+
 def hlir_node_constructor(loader: YAMLHLIRLoader, node_class_name, node: yaml.nodes.MappingNode) -> HLIRNode:
     fields: dict[str, Any] = loader.construct_mapping(node)
     cls = getattr(nodes, node_class_name)
@@ -20,10 +29,25 @@ def construct_yaml_tuple(loader: YAMLHLIRLoader, node: yaml.nodes.SequenceNode)
     return tuple(init_list)
 
 
-# Register custom constructors to the loader
-YAMLHLIRLoader.add_multi_constructor("!node.", hlir_node_constructor)
-YAMLHLIRLoader.add_constructor("tag:yaml.org,2002:seq", construct_yaml_tuple)
+# Register custom constructors to the loaders
+for _loader in (YAMLHLIRLoader, CYAMLHLIRLoader):
+    _loader.add_multi_constructor("!node.", hlir_node_constructor)
+    _loader.add_constructor("tag:yaml.org,2002:seq", construct_yaml_tuple)
+
+
+def yaml_to_hlir(yaml_data: str, loader: type = CYAMLHLIRLoader) -> HLIRNode:
+    return yaml.load(yaml_data, Loader=loader)
+
+
+def yaml_stream_to_hlir(stream: str | IO[str], loader: type = CYAMLHLIRLoader) -> Iterator[HLIRNode]:
+    """
+    Lazily loads the module statements written by `hlir_to_yaml_stream`, one document at a time.
 
+    Args:
+        stream (str | IO[str]): The documents, or a file to read them from.
+        loader (type): The loader class, `CYAMLHLIRLoader` or `YAMLHLIRLoader`.
 
-def yaml_to_hlir(yaml_data: str) -> HLIRNode:
-    return yaml.load(yaml_data, Loader=YAMLHLIRLoader)
+    Returns:
+        Iterator[HLIRNode]: The module statements.
+    """
+    return yaml.load_all(stream, Loader=loader)
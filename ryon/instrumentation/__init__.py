@@ -0,0 +1,3 @@
+from ryon.instrumentation.instrumentation import Instrumentation, phase
+
+__all__ = ["Instrumentation", "phase"]
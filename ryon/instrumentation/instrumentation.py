@@ -0,0 +1,285 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Optional
+
+from ryon.hlir.nodes import HLIRNode
+
+# Categories of the recorded spans.
+PARSER = "parser"
+HLIR = "hlir"
+VISITOR = "visitor"
+FN = "fn"
+LLVM = "llvm"
+
+# The instrumentation spans are recorded to, None when disabled, see `Instrumentation.__enter__`.
+_active: Optional["Instrumentation"] = None
+# The entered instrumentations, innermost last, `_active` is the last one. Instrumentations may be entered and exited
+# from several threads, out of order, so the stack and `_active` are only updated under `_active_lock`.
+_entered: list["Instrumentation"] = []
+_active_lock = threading.Lock()
+
+
+@dataclass
+class Event:
+    """
+    A completed span of the instrumented code.
+
+    Attributes:
+        name: Name of the phase, or of the function for `FN` spans.
+        category: Category of the phase, e.g. `PARSER` or `LLVM`.
+        start: Start of the span in nanoseconds since the instrumentation was created.
+        duration: Duration of the span in nanoseconds.
+        thread: Native id of the thread the span ran in.
+        args: Measurements of the span, `nodes` and `memory_peak` in bytes when enabled.
+    """
+
+    name: str
+    category: str
+    start: int
+    duration: int
+    thread: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Span:
+    """Context manager recording a single `Event`, returned by `phase` while an instrumentation is active."""
+
+    __slots__ = ("_instrumentation", "_name", "_category", "_start", "_root", "_memory")
+
+    def __init__(self, instrumentation: "Instrumentation", name: str, category: str):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._category = category
+        self._root: Optional[HLIRNode] = None
+
+    def nodes(self, root: HLIRNode) -> None:
+        """Sets the HLIR tree the span processes, its nodes are counted when the instrumentation counts nodes."""
+        self._root = root
+
+    def __enter__(self) -> "Span":
+        if self._instrumentation.trace_memory:
+            self._memory = self._instrumentation._enter_memory()
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end = time.perf_counter_ns()
+        instrumentation = self._instrumentation
+        args = {}
+        if instrumentation.trace_memory:
+            args["memory_peak"] = instrumentation._exit_memory(self._memory)
+        if instrumentation.count_nodes and self._root is not None:
+            args["nodes"] = count_nodes(self._root)
+        instrumentation.events.append(
+            Event(
+                self._name,
+                self._category,
+                self._start - instrumentation.origin,
+                end - self._start,
+                threading.get_native_id(),
+                args,
+            )
+        )
+
+
+class _DisabledSpan:
+    __slots__ = ()
+
+    def nodes(self, root: HLIRNode) -> None:
+        pass
+
+    def __enter__(self) -> "_DisabledSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+# Returned by `phase` while no instrumentation is active, so disabled instrumentation only costs a global lookup.
+_DISABLED = _DisabledSpan()
+
+
+def phase(name: str, category: str) -> ContextManager[Any]:
+    """
+    Records a span of the active instrumentation.
+
+    Args:
+        name (str): Name of the phase.
+        category (str): Category of the phase.
+
+    Returns:
+        A context manager measuring its block, it enters as an object whose `nodes(root)` sets the processed tree.
+
+    Usage:
+        with phase("parse_hlir", PARSER) as span:
+            hlir = parser.parse_hlir(source)
+            span.nodes(hlir)
+    """
+    instrumentation = _active
+    if instrumentation is None:
+        return _DISABLED
+    return Span(instrumentation, name, category)
+
+
+def fn_phase(name: str) -> ContextManager[Any]:
+    """Records a `FN` span of a function, when the active instrumentation records functions, see `phase`."""
+    instrumentation = _active
+    if instrumentation is None or not instrumentation.per_fn:
+        return _DISABLED
+    return Span(instrumentation, name, FN)
+
+
+def count_nodes(root: HLIRNode) -> int:
+    """Counts the nodes of an HLIR tree, shared subtrees are counted at each of their occurrences."""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        schema = node.schema()
+        for name in schema.nodes:
+            child = getattr(node, name)
+            if child is not None:
+                stack.append(child)
+        for name in schema.node_tuples:
+            stack.extend(child for child in getattr(node, name) if isinstance(child, HLIRNode))
+    return count
+
+
+class Instrumentation:
+    """
+    Records the time spent in the phases of the compile pipeline: parsing, the HLIR transformation, every visitor, the
+    code generation of each function and the LLVM passes.
+
+    Instrumentation is enabled while the instance is used as a context manager, spans from all threads are recorded.
+    Worker processes, e.g. of `RyonBuilder`, are not instrumented.
+
+    Usage:
+        with Instrumentation(per_fn=True, count_nodes=True) as instrumentation:
+            jit.compile(parser.parse_hlir(source))
+        print(instrumentation.summary())
+        instrumentation.write_chrome_trace(Path("trace.json"))
+    """
+
+    def __init__(self, per_fn: bool = False, count_nodes: bool = False, trace_memory: bool = False):
+        """
+        Args:
+            per_fn: Whether to record a span for the code generation of every function.
+            count_nodes: Whether to count the nodes of the HLIR trees processed by the phases.
+            trace_memory: Whether to record the peak of the Python memory allocated during each phase, through
+                `tracemalloc`. The peaks are process-wide, concurrent phases share them.
+        """
+        self.per_fn = per_fn
+        self.count_nodes = count_nodes
+        self.trace_memory = trace_memory
+        self.events: list[Event] = []
+        self.origin = time.perf_counter_ns()
+        self._started_tracemalloc = False
+        # Baselines and peaks of the open spans, innermost last. The spans of all threads share it, as tracemalloc
+        # keeps a single process-wide peak, so it is only accessed under `_memory_lock`.
+        self._memory_stack: list[list[int]] = []
+        self._memory_lock = threading.Lock()
+
+    def __enter__(self) -> "Instrumentation":
+        global _active
+        with _active_lock:
+            if self.trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            _entered.append(self)
+            _active = self
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        global _active
+        with _active_lock:
+            # The instrumentations entered after this one, by other threads, may still be active.
+            _entered.remove(self)
+            _active = _entered[-1] if _entered else None
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def _enter_memory(self) -> list[int]:
+        # tracemalloc keeps a single peak, it is folded into the open spans before being reset for the new one.
+        with self._memory_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            for frame in self._memory_stack:
+                frame[1] = max(frame[1], peak)
+            tracemalloc.reset_peak()
+            frame = [current, current]
+            self._memory_stack.append(frame)
+        return frame
+
+    def _exit_memory(self, frame: list[int]) -> int:
+        with self._memory_lock:
+            peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+            # Compared by identity, spans of concurrent threads may close out of order.
+            self._memory_stack = [open_frame for open_frame in self._memory_stack if open_frame is not frame]
+            for parent in self._memory_stack:
+                parent[1] = max(parent[1], peak)
+        return peak - frame[0]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        Exports the events in the Chrome trace event format, viewable in `chrome://tracing` or Perfetto.
+
+        Returns:
+            dict: The JSON object of the trace.
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    "ts": event.start / 1e3,
+                    "dur": event.duration / 1e3,
+                    "pid": pid,
+                    "tid": event.thread,
+                    "args": event.args,
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.chrome_trace()))
+        return path
+
+    def summary(self, limit: Optional[int] = None) -> str:
+        """
+        Tabulates the events by category and name, the slowest first.
+
+        Args:
+            limit (int, optional): Maximum number of rows.
+
+        Returns:
+            str: The table.
+        """
+        groups: dict[tuple[str, str], list[Event]] = {}
+        for event in self.events:
+            groups.setdefault((event.category, event.name), []).append(event)
+        rows = sorted(groups.items(), key=lambda item: -sum(event.duration for event in item[1]))[:limit]
+
+        lines = [
+            f"{'category':10} {'name':32} {'calls':>7} {'total ms':>11} {'mean ms':>10} {'max ms':>10}"
+            f" {'nodes':>10} {'peak MiB':>9}"
+        ]
+        for (category, name), events in rows:
+            durations = [event.duration / 1e6 for event in events]
+            total = sum(durations)
+            nodes = sum(event.args.get("nodes", 0) for event in events)
+            peak = max(event.args.get("memory_peak", 0) for event in events) / 2**20
+            lines.append(
+                f"{category:10} {name[:32]:32} {len(events):7} {total:11.3f} {total / len(events):10.3f}"
+                f" {max(durations):10.3f} {nodes or '':>10} {f'{peak:.2f}' if self.trace_memory else '':>9}"
+            )
+        return "\n".join(lines)
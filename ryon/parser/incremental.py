@@ -0,0 +1,121 @@
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import chain
+from typing import Callable
+
+from ryon.hlir.nodes import Fn, Module
+
+# Top-level statements are the only lines starting at column 0 with the `fn` keyword.
+_STATEMENT_START = re.compile(r"^fn\b", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """Replacement of `source[start:end]` by `text`."""
+
+    start: int
+    end: int
+    text: str
+
+    def apply(self, source: str) -> str:
+        return source[: self.start] + self.text + source[self.end :]
+
+
+@dataclass(frozen=True)
+class IncrementalParse:
+    """
+    Parsed source split into top-level segments, each holding one module statement with its trailing blank lines.
+
+    Attributes:
+        source: The parsed source code.
+        starts: Offset of each segment in `source`.
+        statements: HLIR of each segment.
+        hlir: HLIR of the whole source.
+    """
+
+    source: str
+    starts: tuple[int, ...]
+    statements: tuple[tuple[Fn, ...], ...]
+    hlir: Module
+
+
+def parse_incremental(source: str, parse_hlir: Callable[[str], Module]) -> IncrementalParse:
+    """
+    Parses the source segment by segment, so that it can later be updated by `reparse`.
+
+    Args:
+        source (str): The ryon source code.
+        parse_hlir (Callable[[str], Module]): Parses a source code into HLIR.
+
+    Returns:
+        IncrementalParse: The parsed source.
+    """
+    starts = _split(source, 0, len(source))
+    statements = tuple(_parse_segments(source, starts, len(source), {}, parse_hlir))
+    return _make(source, tuple(starts), statements)
+
+
+def reparse(previous: IncrementalParse, edit: TextEdit, parse_hlir: Callable[[str], Module]) -> IncrementalParse:
+    """
+    Applies the edit and re-parses only the segments it touches.
+
+    Segments adjacent to the edited range are re-parsed too, as the edit may merge them or split them. Unchanged
+    segments keep their `Fn` nodes by identity.
+
+    Args:
+        previous (IncrementalParse): The source before the edit.
+        edit (TextEdit): The edit to apply.
+        parse_hlir (Callable[[str], Module]): Parses a source code into HLIR.
+
+    Returns:
+        IncrementalParse: The edited source.
+    """
+    source = edit.apply(previous.source)
+    delta = len(edit.text) - (edit.end - edit.start)
+
+    old_starts = previous.starts
+    old_ends = old_starts[1:] + (len(previous.source),)
+    first = bisect_left(old_ends, edit.start)
+    last = bisect_right(old_starts, edit.end) - 1
+    if first > last:
+        return parse_incremental(source, parse_hlir)
+
+    reusable = {previous.source[old_starts[i] : old_ends[i]]: previous.statements[i] for i in range(first, last + 1)}
+    region_end = old_ends[last] + delta
+    starts = _split(source, old_starts[first], region_end)
+    statements = _parse_segments(source, starts, region_end, reusable, parse_hlir)
+
+    return _make(
+        source,
+        old_starts[:first] + tuple(starts) + tuple(start + delta for start in old_starts[last + 1 :]),
+        previous.statements[:first] + tuple(statements) + previous.statements[last + 1 :],
+    )
+
+
+def _make(source: str, starts: tuple[int, ...], statements: tuple[tuple[Fn, ...], ...]) -> IncrementalParse:
+    hlir = Module(module_statements=tuple(chain.from_iterable(statements)))
+    return IncrementalParse(source=source, starts=starts, statements=statements, hlir=hlir)
+
+
+def _split(source: str, start: int, end: int) -> list[int]:
+    if start == end:
+        return []
+    return [start] + [match.start() for match in _STATEMENT_START.finditer(source, start + 1, end)]
+
+
+def _parse_segments(
+    source: str,
+    starts: list[int],
+    end: int,
+    reusable: dict[str, tuple[Fn, ...]],
+    parse_hlir: Callable[[str], Module],
+) -> list[tuple[Fn, ...]]:
+    statements = []
+    for start, segment_end in zip(starts, starts[1:] + [end]):
+        segment = source[start:segment_end]
+        if segment in reusable:
+            statements.append(reusable[segment])
+        else:
+            statements.append(parse_hlir(segment).module_statements)
+    return statements
@@ -1,13 +1,201 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, cast
+
+import lark
 from lark import Lark, Tree
 from lark.indenter import PythonIndenter
-from pathlib import Path
+
+from ryon.hlir.hlir import HLIRTransformer
+from ryon.hlir.nodes import Module
+from ryon.instrumentation.instrumentation import PARSER, phase
+from ryon.parser import incremental
+from ryon.parser.incremental import IncrementalParse, TextEdit
+
+GRAMMAR_PATH = Path(__file__).parent / "main.lark"
+PREBUILT_TABLES_PATH = Path(__file__).parent / "main.lark.tables"
+
+
+def grammar_fingerprint() -> str:
+    """
+    Computes the cache key of the parse tables.
+
+    The key changes whenever either the grammar or the installed Lark version changes, so stale tables are never
+    picked up.
+
+    Returns:
+        str: Hex digest of the grammar source and the Lark version.
+    """
+    digest = hashlib.sha256(GRAMMAR_PATH.read_bytes())
+    digest.update(lark.__version__.encode("utf8"))
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """
+    Returns the directory where the parse tables are cached between processes.
+
+    Honours `RYON_CACHE_DIR`, then `XDG_CACHE_HOME`, and falls back to `~/.cache/ryon`.
+    """
+    if "RYON_CACHE_DIR" in os.environ:
+        return Path(os.environ["RYON_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ryon"
+
+
+def build_parser_tables(path: Path = PREBUILT_TABLES_PATH) -> Path:
+    """
+    Pre-generates the LALR tables into a file that ships inside the package.
+
+    The file is keyed by `grammar_fingerprint` alone, so it stays valid wherever it is copied or installed.
+    `RyonParser` loads it instead of analysing the grammar while the fingerprint matches.
+
+    Args:
+        path (Path): Destination of the tables, the packaged location by default.
+
+    Returns:
+        Path: The path the tables were written to.
+    """
+    _save_tables(_open_grammar(), path)
+    return path
+
+
+# Options of the parsers which are not part of the saved tables, they are passed again on load.
+_RUNTIME_OPTIONS = ("postlex", "transformer")
+
+
+def _open_grammar(transformer: Optional[HLIRTransformer] = None) -> Lark:
+    return Lark.open(
+        str(GRAMMAR_PATH),
+        parser="lalr",
+        postlex=PythonIndenter(),
+        start="module",
+        transformer=transformer,
+    )
+
+
+def _save_tables(parser: Lark, path: Path) -> None:
+    # Written aside and renamed, so concurrent processes never load a partial file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(f"{path.name}.{os.getpid()}.partial")
+    try:
+        with partial_path.open("wb") as f:
+            f.write(grammar_fingerprint().encode("ascii") + b"\n")
+            parser.save(f, exclude_options=_RUNTIME_OPTIONS)
+        os.replace(partial_path, path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_tables(path: Path, transformer: Optional[HLIRTransformer] = None) -> Optional[Lark]:
+    """
+    Loads tables saved by `_save_tables`, None when the file is missing, unreadable, malformed or of another
+    fingerprint, so that the tables are rebuilt instead.
+    """
+    try:
+        with path.open("rb") as f:
+            if f.readline().rstrip(b"\n") != grammar_fingerprint().encode("ascii"):
+                return None
+            data = pickle.load(f)
+        # What `Lark.load` does, with the runtime options, the same way Lark loads its own cache.
+        return Lark.__new__(Lark)._load(data, postlex=PythonIndenter(), transformer=transformer)
+    except Exception:
+        return None
 
 
 class RyonParser:
-    def __init__(self):
-        self._parser = Lark.open(
-            Path(__file__).parent / "main.lark", parser="lalr", postlex=PythonIndenter(), start="module"
-        )
+    """
+    LALR parser of the ryon language.
+
+    Building the LALR tables is the most expensive part of creating a parser, so they are cached:
+
+    - `cache=True` (default) loads the tables pre-generated into the package by `build_parser_tables`. When they are
+      missing or were generated for another grammar or Lark version, it uses a persistent per-user cache file keyed by
+      `grammar_fingerprint` instead. The package directory is never written to.
+    - `cache=<path>` uses the given cache file instead, it is rewritten when it does not match the grammar.
+    - `cache=False` always builds the tables from scratch.
+    """
+
+    def __init__(self, cache: bool | str | Path = True):
+        self._prebuilt = cache is True
+        self._cache = self._cache_path(cache)
+        self._parser = self._open(None)
+        self._hlir_parser: Optional[Lark] = None
 
     def parse(self, data: str) -> Tree:
-        return self._parser.parse(data)
+        with phase("parse", PARSER):
+            return self._parser.parse(data)
+
+    def parse_hlir(self, data: str) -> Module:
+        """
+        Parses the source directly into HLIR.
+
+        The `HLIRTransformer` callbacks run during the LALR reductions, so no intermediate `lark.Tree` is built. The
+        result is identical to `HLIRTransformer().transform(parser.parse(data))`.
+
+        Args:
+            data (str): The ryon source code.
+
+        Returns:
+            Module: The HLIR of the source.
+        """
+        if self._hlir_parser is None:
+            self._hlir_parser = self._open(HLIRTransformer())
+        with phase("parse_hlir", PARSER) as span:
+            hlir = cast(Module, self._hlir_parser.parse(data))
+            span.nodes(hlir)
+        return hlir
+
+    def parse_incremental(self, data: str) -> IncrementalParse:
+        """
+        Parses the source into HLIR keeping track of its top-level statements, so it can be updated by `reparse`.
+
+        Args:
+            data (str): The ryon source code.
+
+        Returns:
+            IncrementalParse: The parsed source, its HLIR is in the `hlir` attribute.
+        """
+        return incremental.parse_incremental(data, self.parse_hlir)
+
+    def reparse(self, previous: IncrementalParse, edit: TextEdit) -> IncrementalParse:
+        """
+        Applies a text edit to a previously parsed source, re-parsing only the top-level statements it touches.
+
+        Untouched `Fn` nodes are reused by identity.
+
+        Args:
+            previous (IncrementalParse): Result of `parse_incremental` or of a previous `reparse`.
+            edit (TextEdit): The edit of `previous.source`.
+
+        Returns:
+            IncrementalParse: The edited source.
+        """
+        return incremental.reparse(previous, edit, self.parse_hlir)
+
+    def _open(self, transformer: Optional[HLIRTransformer]) -> Lark:
+        if self._prebuilt:
+            parser = _load_tables(PREBUILT_TABLES_PATH, transformer)
+            if parser is not None:
+                return parser
+        if self._cache is None:
+            return _open_grammar(transformer)
+
+        parser = _load_tables(self._cache, transformer)
+        if parser is None:
+            parser = _open_grammar(transformer)
+            try:
+                _save_tables(parser, self._cache)
+            except OSError:
+                pass
+        return parser
+
+    @staticmethod
+    def _cache_path(cache: bool | str | Path) -> Optional[Path]:
+        if cache is False:
+            return None
+        if cache is not True:
+            return Path(cache)
+        return default_cache_dir() / f"main-{grammar_fingerprint()}.lark-cache"
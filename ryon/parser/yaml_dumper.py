@@ -1,6 +1,11 @@
 import yaml
 from lark import Tree, Token
 
+try:
+    from yaml import CDumper
+except ImportError:  # PyYAML built without libyaml
+    CDumper = yaml.Dumper  # type: ignore[misc, assignment]
+
 
 class YAMLASTDumper(yaml.Dumper):
     """Custom YAML dumper for handling Lark Tree and Token objects."""
@@ -8,6 +13,12 @@ class YAMLASTDumper(yaml.Dumper):
     pass
 
 
+class CYAMLASTDumper(CDumper):
+    """Variant of `YAMLASTDumper` emitting through libyaml, falls back to the pure Python emitter without libyaml."""
+
+    pass
+
+
 def tree_representer(dumper: YAMLASTDumper, data: Tree) -> yaml.nodes.MappingNode:
     """
     Convert a Lark Tree object to a YAML mapping node.
@@ -36,22 +47,25 @@ def token_representer(dumper: YAMLASTDumper, data: Token) -> yaml.nodes.ScalarNo
     Returns:
         yaml.nodes.ScalarNode: A YAML node representing the Token.
     """
-    return dumper.represent_scalar("!Token", f"{data.type} {data.value}")
+    # libyaml would emit tagged scalars in plain style, quoting keeps the output of both emitters identical.
+    return dumper.represent_scalar("!Token", f"{data.type} {data.value}", style="'")
 
 
-# Register custom representers to the custom YAML dumper
-YAMLASTDumper.add_representer(Tree, tree_representer)
-YAMLASTDumper.add_representer(Token, token_representer)
+# Register custom representers to the custom YAML dumpers
+for _dumper in (YAMLASTDumper, CYAMLASTDumper):
+    _dumper.add_representer(Tree, tree_representer)
+    _dumper.add_representer(Token, token_representer)
 
 
-def ast_to_yaml(ast: Tree) -> str:
+def ast_to_yaml(ast: Tree, dumper: type = CYAMLASTDumper) -> str:
     """
     Serialize a Lark parse tree to a YAML formatted string using custom YAML dumper.
 
     Args:
         ast (Tree): The Lark parse tree to serialize.
+        dumper (type): The dumper class, `CYAMLASTDumper` or `YAMLASTDumper`.
 
     Returns:
         str: A YAML formatted string representing the parse tree.
     """
-    return yaml.dump(ast, Dumper=YAMLASTDumper, indent=4, width=80)
+    return yaml.dump(ast, Dumper=dumper, indent=4, width=80)
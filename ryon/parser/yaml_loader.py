@@ -2,11 +2,20 @@ import yaml
 from typing import Any
 from lark import Tree, Token
 
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    CSafeLoader = yaml.SafeLoader  # type: ignore[misc, assignment]
+
 
 class YAMLASTLoader(yaml.SafeLoader):
     """Custom YAML loader to deserialize Lark Tree and Token objects."""
 
 
+class CYAMLASTLoader(CSafeLoader):
+    """Variant of `YAMLASTLoader` parsing through libyaml, falls back to the pure Python parser without libyaml."""
+
+
 def tree_constructor(loader: YAMLASTLoader, node: yaml.nodes.MappingNode) -> Tree:
     """
     Reconstruct a Lark Tree object from a YAML node.
@@ -40,19 +49,21 @@ def token_constructor(loader: YAMLASTLoader, node: yaml.nodes.ScalarNode) -> Tok
     return Token(typ, val)
 
 
-# Register custom constructors to the loader
-YAMLASTLoader.add_constructor("!Tree", tree_constructor)
-YAMLASTLoader.add_constructor("!Token", token_constructor)
+# Register custom constructors to the loaders
+for _loader in (YAMLASTLoader, CYAMLASTLoader):
+    _loader.add_constructor("!Tree", tree_constructor)
+    _loader.add_constructor("!Token", token_constructor)
 
 
-def yaml_to_ast(yaml_data: str) -> Tree:
+def yaml_to_ast(yaml_data: str, loader: type = CYAMLASTLoader) -> Tree:
     """
     Deserialize YAML string back into a Lark parse tree.
 
     Args:
         yaml_data (str): YAML formatted string representing a Lark parse tree.
+        loader (type): The loader class, `CYAMLASTLoader` or `YAMLASTLoader`.
 
     Returns:
         Tree: The deserialized Lark parse tree.
     """
-    return yaml.load(yaml_data, Loader=YAMLASTLoader)
+    return yaml.load(yaml_data, Loader=loader)
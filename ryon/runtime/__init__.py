@@ -0,0 +1,5 @@
+"""Runtime support of compiled ryon code, it does not depend on LLVM."""
+
+from ryon.runtime.library import RyonLibrary
+
+__all__ = ["RyonLibrary"]
@@ -0,0 +1,202 @@
+import array
+import ctypes
+import struct
+import sys
+from functools import lru_cache
+from typing import Any, Optional
+
+from ryon.runtime.signatures import Signature
+
+# struct format characters of the ryon types which buffers can hold, they double as `array` type codes except for F16.
+_FORMATS = {
+    "I8": "b",
+    "I16": "h",
+    "I32": "i",
+    "I64": "q",
+    "U8": "B",
+    "U16": "H",
+    "U32": "I",
+    "U64": "Q",
+    "F16": "e",
+    "F32": "f",
+    "F64": "d",
+}
+# Buffer format characters by kind, the first letter of the ryon type names.
+_KINDS = {"I": "bhilqn", "U": "BHILQN", "F": "efd"}
+_NATIVE_BYTE_ORDERS = ("", "@", "=", "<" if sys.byteorder == "little" else ">")
+
+# Flags of `PyObject_GetBuffer`, see the buffer protocol of the Python C API.
+_PyBUF_WRITABLE = 0x0001
+_PyBUF_FORMAT = 0x0004
+_PyBUF_STRIDES = 0x0018
+_PyBUF_RECORDS_RO = _PyBUF_STRIDES | _PyBUF_FORMAT
+
+
+class _PyBuffer(ctypes.Structure):
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("strides", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("suboffsets", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+_get_buffer.argtypes = (ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int)
+_get_buffer.restype = ctypes.c_int
+_release_buffer = ctypes.pythonapi.PyBuffer_Release
+_release_buffer.argtypes = (ctypes.POINTER(_PyBuffer),)
+_release_buffer.restype = None
+_is_contiguous = ctypes.pythonapi.PyBuffer_IsContiguous
+_is_contiguous.argtypes = (ctypes.POINTER(_PyBuffer), ctypes.c_char)
+_is_contiguous.restype = ctypes.c_int
+
+
+@lru_cache(maxsize=None)
+def map_prototype(arg_count: int) -> Any:
+    """Returns the `ctypes.CFUNCTYPE` of the map wrappers of functions with `arg_count` arguments."""
+    buffer_types = (ctypes.c_void_p, ctypes.c_int64) * (arg_count + 1)
+    return ctypes.CFUNCTYPE(None, ctypes.c_int64, *buffer_types)
+
+
+def buffer_format(type_name: str) -> str:
+    """
+    Returns the struct format character of the elements of buffers holding a ryon type.
+
+    Raises:
+        TypeError: The type has no buffer format.
+    """
+    try:
+        return _FORMATS[type_name]
+    except KeyError:
+        raise TypeError(f"Type '{type_name}' has no buffer format") from None
+
+
+class MapFunction:
+    """
+    Applies a compiled function element-wise over buffers, through its native map wrapper.
+
+    Arguments are objects supporting the buffer protocol, e.g. `array.array`, `memoryview` or NumPy arrays, which are
+    accessed in place without copies, or numbers, which are repeated for every element. Buffers must be
+    one-dimensional or C-contiguous, their elements must have the kind and size of the ryon types, and all of them
+    must have the same length.
+
+    Usage:
+        add = jit.compile(hlir)["add"]
+        add.map(array.array("i", [1, 2]), array.array("i", [3, 4]))  # array('i', [4, 6])
+    """
+
+    def __init__(self, signature: Signature, pointer: Any):
+        """
+        Args:
+            signature: Signature of the mapped function.
+            pointer: Address of the map wrapper, or a `(symbol, library)` pair, see `ctypes.CFUNCTYPE`.
+
+        Raises:
+            TypeError: A type of the function has no buffer format.
+        """
+        self.name, self.return_type, self.arg_types = signature
+        self._formats = tuple(buffer_format(type_name) for type_name in (self.return_type, *self.arg_types))
+        self._wrapper = map_prototype(len(self.arg_types))(pointer)
+
+    def __call__(self, *args: Any, out: Optional[Any] = None) -> Any:
+        """
+        Applies the function to the elements of the arguments.
+
+        Args:
+            *args: Buffers or numbers, one per argument of the function.
+            out: Writable buffer receiving the results, allocated as an `array.array` when not given.
+
+        Returns:
+            The buffer of the results.
+
+        Raises:
+            TypeError: The number of arguments is wrong, or a buffer holds elements of the wrong type.
+            ValueError: The buffers have different lengths or are not contiguous.
+        """
+        if len(args) != len(self.arg_types):
+            raise TypeError(f"{self.name}.map() takes {len(self.arg_types)} arguments but {len(args)} were given")
+
+        views: list[_PyBuffer] = []
+        # Numbers are passed as single elements with a zero stride.
+        scalars = []
+        try:
+            operands = []
+            length: Optional[int] = None
+            for index, (arg, type_name) in enumerate(zip(args, self.arg_types)):
+                if isinstance(arg, (int, float)):
+                    scalar = self._scalar(arg, index)
+                    operands.append((ctypes.addressof(scalar), 0))
+                    scalars.append(scalar)
+                    continue
+                view = _acquire(arg, _PyBUF_RECORDS_RO)
+                views.append(view)
+                operand_length, stride = _layout(view, type_name, f"argument {index}")
+                length = _same_length(length, operand_length)
+                operands.append((view.buf, stride))
+
+            if out is None:
+                if length is None:
+                    raise ValueError(f"{self.name}.map() needs at least one buffer argument or out")
+                if self.return_type == "F16":
+                    raise TypeError("Results of type 'F16' need an out buffer")
+                out = array.array(self._formats[0], bytes(length * struct.calcsize(self._formats[0])))
+            view = _acquire(out, _PyBUF_RECORDS_RO | _PyBUF_WRITABLE)
+            views.append(view)
+            out_length, out_stride = _layout(view, self.return_type, "out")
+            length = _same_length(length, out_length)
+
+            flat_operands = [value for operand in operands for value in operand]
+            self._wrapper(length, view.buf, out_stride, *flat_operands)
+        finally:
+            for view in views:
+                _release_buffer(ctypes.byref(view))
+        return out
+
+    def _scalar(self, value: Any, index: int) -> Any:
+        try:
+            data = struct.pack(self._formats[index + 1], value)
+        except struct.error as e:
+            raise ValueError(f"Argument {index} of {self.name}.map() is not a {self.arg_types[index]}: {e}") from None
+        return (ctypes.c_char * len(data)).from_buffer_copy(data)
+
+    def __repr__(self) -> str:
+        return f"<MapFunction {self.name}({', '.join(self.arg_types)}) -> {self.return_type}>"
+
+
+def _acquire(obj: Any, flags: int) -> _PyBuffer:
+    # ctypes.pythonapi raises the Python exception set by a failing call, e.g. TypeError for non buffers.
+    view = _PyBuffer()
+    _get_buffer(obj, ctypes.byref(view), flags)
+    return view
+
+
+def _layout(view: _PyBuffer, type_name: str, role: str) -> tuple[int, int]:
+    """Returns the number of elements and the stride in bytes of a buffer, checking its element type."""
+    format_ = (view.format or b"B").decode("ascii")
+    byte_order, code = format_[:-1], format_[-1:]
+    if (
+        byte_order not in _NATIVE_BYTE_ORDERS
+        or code not in _KINDS[type_name[0]]
+        or view.itemsize != struct.calcsize(_FORMATS[type_name])
+    ):
+        raise TypeError(f"Buffer of format '{format_}' cannot hold {role} of type '{type_name}'")
+
+    if view.ndim == 1:
+        return view.shape[0], view.strides[0]
+    if view.ndim == 0 or _is_contiguous(ctypes.byref(view), b"C"):
+        return view.len // view.itemsize, view.itemsize
+    raise ValueError(f"Buffer of {role} is neither one-dimensional nor C-contiguous")
+
+
+def _same_length(length: Optional[int], other: int) -> int:
+    if length is not None and length != other:
+        raise ValueError(f"Buffers have different lengths {length} and {other}")
+    return other
@@ -0,0 +1,58 @@
+import ctypes
+from os import PathLike
+from typing import Any, Callable, Union
+
+from ryon.runtime.buffers import MapFunction
+from ryon.runtime.signatures import SIGNATURES_SYMBOL, Signature, map_symbol, parse_signatures, prototype
+
+
+class RyonLibrary:
+    """
+    Functions of a shared library built by `RyonAOTCompiler`, bound through ctypes.
+
+    The signatures of the functions are read from the library itself, so neither LLVM nor the ryon sources are needed.
+    When the library exports the map wrappers of the functions, they are bound as the `map` attribute of the functions,
+    see `ryon.runtime.buffers.MapFunction`.
+
+    Usage:
+        library = RyonLibrary("libkernels.so")
+        library["add"](3, 4)
+        library["add"].map(array.array("i", [1, 2]), 3)
+    """
+
+    def __init__(self, path: Union[str, PathLike]):
+        self.path = path
+        self._library = ctypes.CDLL(str(path))
+
+        signatures_function = getattr(self._library, SIGNATURES_SYMBOL)
+        signatures_function.restype = ctypes.c_char_p
+        signatures_function.argtypes = ()
+        self.signatures: dict[str, Signature] = {
+            signature[0]: signature for signature in parse_signatures(signatures_function().decode("utf8"))
+        }
+
+        self._functions: dict[str, Callable[..., Any]] = {}
+        for signature in self.signatures.values():
+            name, return_type, arg_types = signature
+            try:
+                function_prototype = prototype(return_type, arg_types)
+            except TypeError:
+                # Still callable from C, but not through ctypes.
+                continue
+            function = function_prototype((name, self._library))
+            function._library = self
+            if hasattr(self._library, map_symbol(name)):
+                function.map = MapFunction(signature, (map_symbol(name), self._library))
+            self._functions[name] = function
+
+    def __getitem__(self, name: str) -> Callable[..., Any]:
+        return self._functions[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._functions
+
+    def __iter__(self):
+        return iter(self._functions)
+
+    def __len__(self) -> int:
+        return len(self._functions)
@@ -0,0 +1,88 @@
+import ctypes
+from functools import lru_cache
+from typing import Any, Iterable
+
+# Symbol of the exported function returning the signatures of a ryon shared library, ryon names have no upper case.
+SIGNATURES_SYMBOL = "RYON_SIGNATURES"
+SIGNATURES_HEADER = "ryon-signatures 1"
+# Prefix of the symbols of the map wrappers of ryon functions, see `ryon.compiler.map_wrappers`.
+MAP_SYMBOL_PREFIX = "RYON_MAP_"
+
+# ctypes counterparts of the `RyonCompiler._TYPE_MAPPING` types, ctypes has no 128-bit integers nor half floats.
+_CTYPES_MAPPING: dict[str, Any] = {
+    "I8": ctypes.c_int8,
+    "I16": ctypes.c_int16,
+    "I32": ctypes.c_int32,
+    "I64": ctypes.c_int64,
+    "U8": ctypes.c_uint8,
+    "U16": ctypes.c_uint16,
+    "U32": ctypes.c_uint32,
+    "U64": ctypes.c_uint64,
+    "F32": ctypes.c_float,
+    "F64": ctypes.c_double,
+}
+
+Signature = tuple[str, str, tuple[str, ...]]
+"""Name, return type and argument types of a function."""
+
+
+def ctypes_type(type_name: str) -> Any:
+    """
+    Returns the ctypes type of a ryon type.
+
+    Args:
+        type_name (str): Name of the ryon type.
+
+    Returns:
+        The ctypes type.
+
+    Raises:
+        TypeError: The type cannot be passed through ctypes.
+    """
+    try:
+        return _CTYPES_MAPPING[type_name]
+    except KeyError:
+        raise TypeError(f"Type '{type_name}' has no ctypes equivalent") from None
+
+
+@lru_cache(maxsize=None)
+def prototype(return_type: str, arg_types: tuple[str, ...]) -> Any:
+    """
+    Returns the `ctypes.CFUNCTYPE` of a function signature, prototypes are shared between equal signatures.
+
+    Args:
+        return_type (str): Name of the ryon return type.
+        arg_types (tuple[str, ...]): Names of the ryon argument types.
+
+    Returns:
+        The ctypes prototype.
+
+    Raises:
+        TypeError: A type cannot be passed through ctypes.
+    """
+    return ctypes.CFUNCTYPE(ctypes_type(return_type), *map(ctypes_type, arg_types))
+
+
+def map_symbol(name: str) -> str:
+    """Returns the symbol of the map wrapper of a function."""
+    return MAP_SYMBOL_PREFIX + name
+
+
+def format_signatures(signatures: Iterable[Signature]) -> str:
+    """Serializes signatures to the text embedded in shared libraries, one `name return_type arg_types...` per line."""
+    lines = [SIGNATURES_HEADER] + [
+        " ".join((name, return_type, *arg_types)) for name, return_type, arg_types in signatures
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def parse_signatures(text: str) -> list[Signature]:
+    """Deserializes the text written by `format_signatures`."""
+    header, *lines = text.splitlines()
+    if header != SIGNATURES_HEADER:
+        raise ValueError(f"Unsupported signatures format '{header}'")
+    signatures = []
+    for line in lines:
+        name, return_type, *arg_types = line.split()
+        signatures.append((name, return_type, tuple(arg_types)))
+    return signatures
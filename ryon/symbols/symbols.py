@@ -1,8 +1,9 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+from typing import Any, Iterator, Mapping, Optional
 
-from ryon.hlir.nodes import HLIRNode, ContextNode, TypeNode
+from ryon.hlir.breadcrumb import Breadcrumb, Context
+from ryon.hlir.nodes import TypeNode
 from ryon.hlir.visitor import Visitor
 
 
@@ -12,23 +13,127 @@ class Symbol:
 
 
 class SymbolTable(defaultdict[tuple[str, ...], Symbol]):
+    """Flat view of the symbols, keyed by the names of their enclosing contexts followed by their own name."""
+
     def __init__(self, initial_items: Optional[Mapping[tuple[str, ...], Symbol]] = None):
         if initial_items is not None:
             super().__init__(Symbol, initial_items)
         else:
             super().__init__(Symbol)
 
+    @classmethod
+    def from_scope(cls, scope: "Scope") -> "SymbolTable":
+        """Flattens a scope and its nested scopes."""
+        return cls(
+            {nested.path + (name,): symbol for nested in scope.walk() for name, symbol in nested.symbols.items()}
+        )
+
+
+class Scope:
+    """
+    Symbols defined directly in a context, linked to the scope of the enclosing context.
+
+    Attributes:
+        name: Name of the context, None for the module scope.
+        parent: Scope of the enclosing context.
+        symbols: Symbols defined in the scope by name.
+        children: Scopes of the nested contexts by name.
+        path: Names of the contexts from the module scope, the keys of `SymbolTable` without the symbol name.
+    """
+
+    __slots__ = ("name", "parent", "symbols", "children", "path")
+
+    def __init__(self, name: Optional[str] = None, parent: Optional["Scope"] = None):
+        self.name = name
+        self.parent = parent
+        self.symbols: dict[str, Symbol] = {}
+        self.children: dict[str, Scope] = {}
+        self.path: tuple[str, ...] = () if parent is None else parent.path + (name,)  # type: ignore[operator]
+
+    def child(self, name: str) -> "Scope":
+        """Returns the scope of a nested context, creating it on first use."""
+        scope = self.children.get(name)
+        if scope is None:
+            scope = self.children[name] = Scope(name, self)
+        return scope
+
+    def define(self, name: str) -> Symbol:
+        """Returns the symbol defined in this scope under the name, creating it on first use."""
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            symbol = self.symbols[name] = Symbol()
+        return symbol
+
+    def lookup(self, name: str) -> Optional[Symbol]:
+        """
+        Resolves a name from this scope, the innermost definition wins.
+
+        Args:
+            name (str): The name of the symbol.
+
+        Returns:
+            Symbol | None: The symbol, None when the name is not defined in this scope nor in any enclosing one.
+        """
+        scope: Optional[Scope] = self
+        while scope is not None:
+            symbol = scope.symbols.get(name)
+            if symbol is not None:
+                return symbol
+            scope = scope.parent
+        return None
+
+    def find(self, path: tuple[str, ...]) -> Optional["Scope"]:
+        """Returns the nested scope at the path relative to this scope, None when it does not exist."""
+        scope: Optional[Scope] = self
+        for name in path:
+            if scope is None:
+                return None
+            scope = scope.children.get(name)
+        return scope
+
+    def walk(self) -> Iterator["Scope"]:
+        """Iterates over this scope and all the nested scopes, depth first."""
+        stack = [self]
+        while stack:
+            scope = stack.pop()
+            yield scope
+            stack.extend(reversed(scope.children.values()))
+
+    def __repr__(self) -> str:
+        return f"Scope({self.path!r}, symbols={list(self.symbols)!r})"
+
 
 class RyonSymbolizer(Visitor):
-    def __init__(self, symbol_table: SymbolTable):
+    """
+    Collects the symbols of a module into a tree of scopes, `scope` is the module scope.
+
+    When a `SymbolTable` is given, it is filled with the same symbols as well.
+    """
+
+    def __init__(self, symbol_table: Optional[SymbolTable] = None):
         self._table = symbol_table
+        self.scope = Scope()
+        # Contexts are shared by all the nodes they enclose, so each of them resolves its scope once.
+        self._scopes: dict[Context, Scope] = {}
 
     def arg(self, node, function, context):
-        self._table[context + (node.name,)].type = node.type
+        scope = self._scope(context)
+        symbol = scope.define(node.name)
+        symbol.type = node.type
+        if self._table is not None:
+            self._table[scope.path + (node.name,)] = symbol
 
     # def var(self, node, parent_data, context):
     #     yield
     #     yield
 
-    def _transform_breadcrump(self, breadcrump: tuple[HLIRNode, ...]) -> Any:
-        return tuple(node.get_context_name() for node in breadcrump if isinstance(node, ContextNode))
+    def _scope(self, context: Optional[Context]) -> Scope:
+        if context is None:
+            return self.scope
+        scope = self._scopes.get(context)
+        if scope is None:
+            scope = self._scopes[context] = self._scope(context.parent).child(context.name)
+        return scope
+
+    def _transform_breadcrump(self, breadcrump: Breadcrumb) -> Any:
+        return breadcrump.context
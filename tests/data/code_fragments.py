@@ -285,8 +285,10 @@ class NumberCodeFragment:
     def llvm_ir(number_type: str) -> str:
         _CONV_TABLE = {"F16": "half", "F32": "float", "F64": "double"}
 
+        add = "add"
         if number_type in _CONV_TABLE:
             ntype = _CONV_TABLE[number_type]
+            add = "fadd"
         else:
             ntype = number_type.lower()
             if ntype[0] == "u":
@@ -296,7 +298,7 @@ class NumberCodeFragment:
             define {ntype} @"add"({ntype} %"a", {ntype} %"b")
             {{
             entry:
-              %"result" = add {ntype} %"a", %"b"
+              %"result" = {add} {ntype} %"a", %"b"
               ret {ntype} %"result"
             }}
         """
@@ -18,3 +18,11 @@ def test_yaml(hlir_transformer, fragment):
     actual_hlir = yaml_to_hlir(actual_hlir_yaml)
 
     assert actual_hlir == expected_hlir
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_parse_hlir(parser, hlir_transformer, fragment):
+    actual_hlir = parser.parse_hlir(fragment.code)
+
+    assert actual_hlir == hlir_transformer.transform(parser.parse(fragment.code))
+    assert hlir_to_yaml(actual_hlir) == fragment.hlir
@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.programs import ProgramGenerator
+from ryon.compiler import RyonJIT
+
+configurations = (
+    {"functions": 1, "arity": 0, "sum_width": 1},
+    {"functions": 5, "arity": 0, "sum_width": 3},
+    {"functions": 5, "arity": 1, "sum_width": 1},
+    {"functions": 10, "arity": 4, "sum_width": 8},
+    {"functions": 10, "arity": 2, "sum_width": 4, "types": ("I32", "I64", "F32", "F64")},
+)
+
+
+@pytest.mark.parametrize("configuration", configurations)
+def test_program_generator(parser, configuration):
+    generator = ProgramGenerator(**configuration)
+    hlir = parser.parse_hlir(generator.module())
+
+    assert [fn.name for fn in hlir.module_statements] == [f"function_{i}" for i in range(configuration["functions"])]
+    functions = RyonJIT().compile(hlir)
+    assert set(functions) == {fn.name for fn in hlir.module_statements}
+
+
+@pytest.mark.parametrize("configuration", configurations)
+def test_program_generator_deterministic(configuration):
+    generator = ProgramGenerator(**configuration)
+
+    assert generator.module() == generator.module()
+    assert ProgramGenerator(**configuration).module() == ProgramGenerator(**configuration).module()
+
+
+def test_program_generator_seed():
+    assert ProgramGenerator(functions=10, seed=1).module() != ProgramGenerator(functions=10, seed=2).module()
+
+
+@pytest.mark.parametrize(
+    "configuration",
+    (
+        {"sum_width": 0},
+        {"arity": 0, "types": ("I64",)},
+    ),
+)
+def test_program_generator_invalid(configuration):
+    with pytest.raises(ValueError):
+        ProgramGenerator(**configuration)
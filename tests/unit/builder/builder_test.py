@@ -0,0 +1,48 @@
+import io
+
+import pytest
+
+from ryon.builder import RyonBuilder
+from ryon.builder.builder import discover_sources
+from ryon.compiler import OptimizationLevel
+from tests.data.code_fragments import fragments
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    (tmp_path / "package").mkdir()
+    (tmp_path / "hello.ry").write_text(fragments[0].code)
+    (tmp_path / "package" / "add.ry").write_text(fragments[1].code)
+    (tmp_path / "notes.txt").write_text("not a source")
+    return tmp_path
+
+
+def test_discover_sources(project_dir):
+    assert discover_sources(project_dir) == [project_dir / "hello.ry", project_dir / "package" / "add.ry"]
+    assert discover_sources(project_dir / "hello.ry") == [project_dir / "hello.ry"]
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_build(project_dir, max_workers):
+    module = RyonBuilder(max_workers=max_workers).build([project_dir], name="project")
+
+    assert module.name == "project"
+    assert sorted(function.name for function in module.functions) == ["add", "hello_world"]
+
+
+def test_build_duplicate_function(tmp_path):
+    (tmp_path / "one.ry").write_text(fragments[1].code)
+    (tmp_path / "two.ry").write_text(fragments[1].code)
+
+    with pytest.raises(RuntimeError):
+        RyonBuilder(max_workers=1).build([tmp_path])
+
+
+def test_build_optimized(project_dir):
+    dump = io.StringIO()
+
+    module = RyonBuilder(max_workers=1, opt_level=OptimizationLevel.O2, dump_ir=dump).build([project_dir])
+
+    assert sorted(function.name for function in module.functions) == ["add", "hello_world"]
+    assert "before optimization (O2)" in dump.getvalue()
+    assert "after optimization (O2)" in dump.getvalue()
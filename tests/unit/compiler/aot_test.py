@@ -0,0 +1,61 @@
+import ctypes
+import shutil
+import subprocess
+
+import llvmlite.binding as llvm
+import pytest
+
+from ryon.compiler import CodegenTarget, OptimizationLevel, RyonAOTCompiler
+from ryon.runtime.signatures import SIGNATURES_SYMBOL
+from tests.data.code_fragments import fragments
+
+SOURCE = fragments[1].code + "\nfn wide(a: I128, b: I128) -> I128:\n    return a + b\n"
+
+requires_cc = pytest.mark.skipif(shutil.which("cc") is None, reason="no C compiler")
+
+
+@pytest.fixture
+def aot_compiler():
+    return RyonAOTCompiler(CodegenTarget.host(opt_level=OptimizationLevel.O2))
+
+
+def test_emit_object(parser, aot_compiler, tmp_path):
+    path = aot_compiler.emit_object(parser.parse_hlir(SOURCE), tmp_path / "add.o")
+
+    engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), CodegenTarget.host().create_target_machine())
+    engine.add_object_file(llvm.ObjectFileRef.from_path(str(path)))
+    engine.finalize_object()
+
+    add = ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_int32, ctypes.c_int32)(engine.get_function_address("add"))
+    assert add(3, 4) == 12
+    assert engine.get_function_address(SIGNATURES_SYMBOL)
+    assert not engine.get_function_address("RYON_MAP_add")
+
+
+def test_emit_header(parser, tmp_path):
+    path = RyonAOTCompiler.emit_header(parser.parse_hlir(SOURCE), tmp_path / "libadd.h", map_wrappers=True)
+
+    header = path.read_text()
+    assert "#ifndef LIBADD_H" in header
+    assert f"const char *{SIGNATURES_SYMBOL}(void);" in header
+    assert "int32_t add(int32_t a, int32_t b);" in header
+    assert "__int128 wide(__int128 a, __int128 b);" in header
+    assert (
+        "void RYON_MAP_add(int64_t length, char *out, int64_t out_stride, "
+        "const char *a, int64_t a_stride, const char *b, int64_t b_stride);" in header
+    )
+
+
+@requires_cc
+def test_emit_shared_library(parser, aot_compiler, tmp_path):
+    library = aot_compiler.emit_shared_library(parser.parse_hlir(SOURCE), tmp_path / "libadd.so")
+    (tmp_path / "main.c").write_text(
+        '#include <stdio.h>\n#include "libadd.h"\nint main(void) { printf("%d", add(3, 4)); return 0; }\n'
+    )
+
+    subprocess.run(
+        ["cc", "-o", str(tmp_path / "main"), str(tmp_path / "main.c"), str(library), f"-Wl,-rpath,{tmp_path}"],
+        check=True,
+    )
+
+    assert subprocess.run([str(tmp_path / "main")], capture_output=True, text=True, check=True).stdout == "12"
@@ -0,0 +1,85 @@
+import ctypes
+import os
+
+import llvmlite.binding as llvm
+import pytest
+
+from ryon.compiler import CodegenTarget, ObjectCache, OptimizationLevel, RyonCompiler
+from ryon.compiler.cache import fn_fingerprint
+from ryon.compiler.compiler import INTEGER
+
+SOURCE = """fn add(a: I32, b: I32) -> I32:
+    return a + b
+
+fn add_one(a: I32, b: I32) -> I32:
+    return a + b + 1
+"""
+
+
+@pytest.fixture
+def target():
+    return CodegenTarget.host()
+
+
+def run(cache, hlir, target):
+    engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), target.create_target_machine())
+    cache.attach(engine)
+    cache.add_functions(engine, hlir, target)
+    engine.finalize_object()
+
+    functype = ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_int32, ctypes.c_int32)
+    return {fn.name: functype(engine.get_function_address(fn.name))(2, 3) for fn in hlir.module_statements}, engine
+
+
+def test_fn_fingerprint(parser):
+    first, second = parser.parse_hlir(SOURCE).module_statements
+
+    assert fn_fingerprint(first) == fn_fingerprint(parser.parse_hlir(SOURCE).module_statements[0])
+    assert fn_fingerprint(first) != fn_fingerprint(second)
+
+
+def test_cache_key(parser, target, tmp_path):
+    fn = parser.parse_hlir(SOURCE).module_statements[0]
+    cache = ObjectCache(tmp_path)
+
+    assert cache.key(fn, target) == cache.key(fn, CodegenTarget.host())
+    assert cache.key(fn, target) != cache.key(fn, CodegenTarget.host(opt_level=OptimizationLevel.O2))
+    assert cache.key(fn, target) != cache.key(fn, CodegenTarget(target.triple))
+    assert cache.key(fn, target, RyonCompiler().options) != cache.key(
+        fn, target, RyonCompiler(balanced_sums=(INTEGER,)).options
+    )
+
+
+def test_warm_rebuild(parser, target, tmp_path):
+    hlir = parser.parse_hlir(SOURCE)
+
+    cold = ObjectCache(tmp_path)
+    assert run(cold, hlir, target)[0] == {"add": 5, "add_one": 6}
+    assert (cold.hits, cold.misses) == (0, 2)
+
+    warm = ObjectCache(tmp_path)
+    assert run(warm, hlir, target)[0] == {"add": 5, "add_one": 6}
+    assert (warm.hits, warm.misses) == (2, 0)
+
+    changed = parser.parse_hlir(SOURCE.replace("+ 1", "+ 2"))
+    partial = ObjectCache(tmp_path)
+    assert run(partial, changed, target)[0] == {"add": 5, "add_one": 7}
+    assert (partial.hits, partial.misses) == (1, 1)
+
+
+def test_lru_eviction(tmp_path):
+    cache = ObjectCache(tmp_path, max_size=250)
+    for i, key in enumerate(("aa", "bb", "cc")):
+        cache.put(key, bytes(100))
+        os.utime(cache.path(key), ns=(i * 10**9, i * 10**9))
+
+    assert "aa" not in cache
+    assert cache.size == 200
+
+    assert cache.get("bb") is not None
+    cache.put("dd", bytes(100))
+
+    assert "bb" in cache
+    assert "cc" not in cache
+    assert "dd" in cache
+    assert cache.size == 200
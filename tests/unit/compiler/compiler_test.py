@@ -1,7 +1,10 @@
+import textwrap
+
 import pytest
 from ryon.hlir.yaml_loader import yaml_to_hlir
 
-from ryon.compiler import RyonCompiler
+from ryon.compiler import RyonCompiler, RyonJIT
+from ryon.compiler.compiler import FLOAT, INTEGER, UndefinedVariableError
 from tests.data.code_fragments import fragments, NumberCodeFragment
 
 
@@ -30,3 +33,96 @@ def test_hlir_basic_numbers(compiler, number_type):
     llvm_ir = compiler.visit(hlir)
     actual = llvm_ir[llvm_ir.find('target datalayout = ""') + 22 :].strip()
     assert actual == fragment.llvm_ir(number_type)
+
+
+WIDE_SUM = "fn wide(a: {0}, b: {0}, c: {0}, d: {0}) -> {0}:\n    return a + b + c + d + a\n"
+
+
+def test_compiler_balanced_sums(parser):
+    hlir = parser.parse_hlir(WIDE_SUM.format("I32"))
+
+    llvm_ir = RyonCompiler(balanced_sums=(INTEGER,)).visit(hlir)
+
+    actual = llvm_ir[llvm_ir.find('target datalayout = ""') + 22 :].strip()
+    assert (
+        actual
+        == textwrap.dedent("""
+        define i32 @"wide"(i32 %"a", i32 %"b", i32 %"c", i32 %"d")
+        {
+        entry:
+          %"result" = add i32 %"a", %"b"
+          %"result.1" = add i32 %"c", %"d"
+          %"result.2" = add i32 %"result", %"result.1"
+          %"result.3" = add i32 %"result.2", %"a"
+          ret i32 %"result.3"
+        }
+    """).strip()
+    )
+
+
+def test_compiler_balanced_sums_per_type_class(parser):
+    integers = parser.parse_hlir(WIDE_SUM.format("I64"))
+    floats = parser.parse_hlir(WIDE_SUM.format("F64"))
+
+    assert RyonCompiler(balanced_sums=(INTEGER,)).visit(floats) == RyonCompiler().visit(floats)
+    assert RyonCompiler(balanced_sums=(FLOAT,), reassociate_floats=True).visit(integers) == RyonCompiler().visit(
+        integers
+    )
+    assert '%"result.1" = fadd reassoc double %"c", %"d"' in RyonCompiler(
+        balanced_sums=(FLOAT,), reassociate_floats=True
+    ).visit(floats)
+
+
+@pytest.mark.parametrize(
+    "compiler",
+    (
+        RyonCompiler(),
+        RyonCompiler(reassociate_floats=True),
+        RyonCompiler(balanced_sums=(FLOAT,), reassociate_floats=True),
+    ),
+)
+@pytest.mark.parametrize("type_name", ("F32", "F64"))
+def test_compiler_float_sums_jit(parser, compiler, type_name):
+    functions = RyonJIT(compiler=compiler).compile(parser.parse_hlir(WIDE_SUM.format(type_name)))
+
+    assert functions["wide"](0.5, 1.25, 2.0, 4.0) == 8.25
+
+
+def test_compiler_float_sums_not_reassociated(parser):
+    llvm_ir = RyonCompiler().visit(parser.parse_hlir(WIDE_SUM.format("F64")))
+
+    assert '%"result.3" = fadd double %"result.2", %"a"' in llvm_ir
+    assert "reassoc" not in llvm_ir
+
+
+def test_compiler_balanced_float_sums_require_reassociation():
+    with pytest.raises(ValueError):
+        RyonCompiler(balanced_sums=(FLOAT,))
+    with pytest.raises(ValueError):
+        RyonCompiler(balanced_sums=("complex",))
+
+
+@pytest.mark.parametrize("balanced_sums", ((), (INTEGER,)))
+def test_compiler_balanced_sums_jit(parser, balanced_sums):
+    source = "fn wide(a: I32, b: I32, c: I32, d: I32) -> I32:\n    return a + b + c + d + a + b + c\n"
+
+    functions = RyonJIT(compiler=RyonCompiler(balanced_sums=balanced_sums)).compile(parser.parse_hlir(source))
+
+    assert functions["wide"](1, 2, 3, 4) == 16
+
+
+def test_compiler_undefined_variable(parser):
+    hlir = parser.parse_hlir("fn add(a: I32, b: I32) -> I32:\n    return a + c\n")
+
+    with pytest.raises(UndefinedVariableError, match="Undefined variable 'c' in function 'add'"):
+        RyonCompiler().visit(hlir)
+
+
+def test_compiler_many_variables(parser):
+    args = [f"arg_{i}" for i in range(200)]
+    source = f"fn wide({', '.join(f'{arg}: I64' for arg in args)}) -> I64:\n    return {' + '.join(args * 5)}\n"
+
+    llvm_ir = RyonCompiler().visit(parser.parse_hlir(source))
+
+    assert '%"result" = add i64 %"arg_0", %"arg_1"' in llvm_ir
+    assert f'add i64 %"result.{len(args) * 5 - 3}", %"arg_199"' in llvm_ir
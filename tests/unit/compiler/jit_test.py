@@ -0,0 +1,164 @@
+import array
+import ctypes
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ryon.compiler import ObjectCache, RyonJIT
+from ryon.compiler.jit import LazyFunction, fn_prototype
+from tests.data.code_fragments import NumberCodeFragment, fragments
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_jit(parser, fragment):
+    functions = RyonJIT().compile(parser.parse_hlir(fragment.code))
+
+    for name, _, args, expected_return in fragment.functions:
+        assert functions[name](*args) == expected_return
+
+
+@pytest.mark.parametrize(
+    "number_type, expected_type",
+    (
+        ("I8", ctypes.c_int8),
+        ("I64", ctypes.c_int64),
+        ("U16", ctypes.c_uint16),
+        ("U64", ctypes.c_uint64),
+    ),
+)
+def test_fn_prototype(parser, number_type, expected_type):
+    fn = parser.parse_hlir(NumberCodeFragment.code(number_type)).module_statements[0]
+
+    prototype = fn_prototype(fn)
+
+    assert prototype._restype_ is expected_type
+    assert prototype._argtypes_ == (expected_type, expected_type)
+
+
+@pytest.mark.parametrize("number_type", ("I128", "U128", "F16"))
+def test_fn_prototype_unsupported(parser, number_type):
+    fn = parser.parse_hlir(NumberCodeFragment.code(number_type)).module_statements[0]
+
+    with pytest.raises(TypeError, match=number_type):
+        fn_prototype(fn)
+
+
+def test_jit_types(parser):
+    jit = RyonJIT()
+
+    functions = jit.compile(parser.parse_hlir(NumberCodeFragment.code("U8")))
+
+    assert functions["add"](200, 100) == 44
+    assert jit["add"] is functions["add"]
+    assert "add" in jit
+
+
+def test_jit_single_argument(parser):
+    functions = RyonJIT().compile(parser.parse_hlir("fn increment(a: I32) -> I32:\n    return a + 1\n"))
+
+    assert functions["increment"](41) == 42
+
+
+def test_jit_multiple_modules(parser):
+    jit = RyonJIT()
+
+    jit.compile(parser.parse_hlir(fragments[0].code))
+    jit.compile(parser.parse_hlir(fragments[1].code))
+
+    assert jit["hello_world"]() == 10
+    assert jit["add"](3, 4) == 12
+    with pytest.raises(ValueError):
+        jit.compile(parser.parse_hlir(fragments[1].code))
+
+
+def test_jit_cache(parser, tmp_path):
+    hlir = parser.parse_hlir(fragments[1].code)
+
+    RyonJIT(cache=ObjectCache(tmp_path)).compile(hlir)
+    cache = ObjectCache(tmp_path)
+    functions = RyonJIT(cache=cache).compile(hlir)
+
+    assert functions["add"](3, 4) == 12
+    assert cache.hits == 1
+
+
+LAZY_SOURCE = "fn add(a: I32, b: I32) -> I32:\n    return a + b\n\nfn increment(a: I32) -> I32:\n    return a + 1\n"
+
+
+def test_jit_lazy(parser):
+    jit = RyonJIT()
+
+    functions = jit.compile(parser.parse_hlir(LAZY_SOURCE), lazy=True)
+
+    assert isinstance(functions["add"], LazyFunction)
+    assert not functions["add"].compiled
+    assert jit.engine.get_function_address("add") == 0
+    assert functions["add"](3, 4) == 7
+    assert functions["add"].compiled
+    assert not functions["increment"].compiled
+    assert jit.engine.get_function_address("increment") == 0
+    assert not isinstance(jit["add"], LazyFunction)
+    assert jit["add"](3, 4) == 7
+    assert isinstance(jit["increment"], LazyFunction)
+
+
+def test_jit_lazy_map(parser):
+    increment = RyonJIT().compile(parser.parse_hlir(LAZY_SOURCE), lazy=True)["increment"]
+
+    assert increment.map(array.array("i", [1, 2])) == array.array("i", [2, 3])
+
+
+def test_jit_lazy_checks_upfront(parser):
+    jit = RyonJIT()
+    jit.compile(parser.parse_hlir(LAZY_SOURCE), lazy=True)
+
+    with pytest.raises(ValueError):
+        jit.compile(parser.parse_hlir(LAZY_SOURCE), lazy=True)
+    with pytest.raises(TypeError):
+        jit.compile(parser.parse_hlir(NumberCodeFragment.code("I128")), lazy=True)
+
+
+@pytest.mark.parametrize("lazy", (False, True))
+def test_jit_duplicated_function(parser, lazy):
+    jit = RyonJIT()
+    source = LAZY_SOURCE + "\nfn add(a: I32, b: I32) -> I32:\n    return a + b + 1\n"
+
+    with pytest.raises(ValueError, match="'add' is defined more than once"):
+        jit.compile(parser.parse_hlir(source), lazy=lazy)
+    assert "add" not in jit and "increment" not in jit
+
+
+def test_jit_eager_and_lazy_threads(parser):
+    jit = RyonJIT()
+    increment = jit.compile(parser.parse_hlir(LAZY_SOURCE), lazy=True)["increment"]
+    sources = [f"fn eager_{i}(a: I32) -> I32:\n    return a + {i}\n" for i in range(16)]
+
+    def compile_eager(source):
+        (function,) = jit.compile(parser.parse_hlir(source)).values()
+        return function(1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        eager = executor.map(compile_eager, sources)
+        lazy = executor.map(increment, range(16))
+        assert list(eager) == list(range(1, 17))
+        assert list(lazy) == list(range(1, 17))
+
+
+def test_jit_lazy_cache(parser, tmp_path):
+    hlir = parser.parse_hlir(LAZY_SOURCE)
+    RyonJIT(cache=ObjectCache(tmp_path)).compile(hlir)
+    cache = ObjectCache(tmp_path)
+
+    functions = RyonJIT(cache=cache).compile(hlir, lazy=True)
+
+    assert functions["increment"](1) == 2
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_jit_lazy_threads(parser):
+    increment = RyonJIT().compile(parser.parse_hlir(LAZY_SOURCE), lazy=True)["increment"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(increment, range(64)))
+
+    assert results == list(range(1, 65))
@@ -0,0 +1,126 @@
+import array
+
+import llvmlite.binding as llvm
+import pytest
+
+from ryon.compiler import CodegenTarget, ObjectCache, OptimizationLevel, RyonJIT
+from ryon.compiler.jit import LazyMapFunction
+from ryon.compiler.map_wrappers import map_wrappers_module
+from ryon.runtime.signatures import map_symbol
+from tests.data.code_fragments import NumberCodeFragment
+
+SOURCE = "fn add(a: I32, b: I32) -> I32:\n    return a + b\n"
+
+
+@pytest.fixture
+def add(parser):
+    return RyonJIT(CodegenTarget.host(OptimizationLevel.O2)).compile(parser.parse_hlir(SOURCE))["add"]
+
+
+def test_map_wrappers_module():
+    llvm_module = llvm.parse_assembly(map_wrappers_module([("add", "I32", ("I32", "I32"))]))
+
+    llvm_module.verify()
+    assert not llvm_module.get_function(map_symbol("add")).is_declaration
+    assert llvm_module.get_function("add").is_declaration
+
+
+def test_map(add):
+    a = array.array("i", range(10))
+    b = array.array("i", range(10, 20))
+
+    assert add.map(a, b) == array.array("i", [x + y for x, y in zip(a, b)])
+
+
+def test_map_out(add):
+    a = array.array("i", range(10))
+    out = array.array("i", bytes(4 * len(a)))
+
+    assert add.map(a, a, out=out) is out
+    assert out == array.array("i", range(0, 20, 2))
+
+
+def test_map_in_place(add):
+    a = array.array("i", range(10))
+
+    add.map(a, 1, out=a)
+
+    assert a == array.array("i", range(1, 11))
+
+
+def test_map_strided_and_scalar(add):
+    a = array.array("i", range(10))
+
+    assert add.map(memoryview(a)[::3], 100) == array.array("i", [100, 103, 106, 109])
+
+
+def test_map_contiguous_multidimensional(add):
+    a = memoryview(array.array("i", range(6))).cast("B").cast("i", (2, 3))
+
+    assert add.map(a, 1) == array.array("i", range(1, 7))
+
+
+def test_map_zero_copy(add):
+    a = array.array("i", range(4))
+    view = memoryview(a)
+
+    add.map(view, 1, out=view)
+
+    assert a == array.array("i", range(1, 5))
+
+
+@pytest.mark.parametrize(
+    "number_type, typecode",
+    (("I8", "b"), ("I16", "h"), ("U16", "H"), ("U32", "I"), ("I64", "q"), ("U64", "Q"), ("F32", "f"), ("F64", "d")),
+)
+def test_map_types(parser, number_type, typecode):
+    add = RyonJIT().compile(parser.parse_hlir(NumberCodeFragment.code(number_type)))["add"]
+    a = array.array(typecode, range(5))
+
+    assert add.map(a, a).typecode == typecode
+    assert list(add.map(a, a)) == [add(x, x) for x in a]
+
+
+def test_map_errors(add):
+    a = array.array("i", range(4))
+
+    with pytest.raises(TypeError, match="format 'd'"):
+        add.map(array.array("d", [1.0] * 4), a)
+    with pytest.raises(TypeError, match="takes 2 arguments"):
+        add.map(a)
+    with pytest.raises(ValueError, match="different lengths"):
+        add.map(a, array.array("i", [1]))
+    with pytest.raises(ValueError, match="at least one buffer"):
+        add.map(1, 2)
+    with pytest.raises(ValueError, match="I32"):
+        add.map(a, 2**40)
+    with pytest.raises(BufferError):
+        add.map(a, a, out=bytes(16))
+
+
+def test_jit_without_map_wrappers(parser):
+    add = RyonJIT(map_wrappers=False).compile(parser.parse_hlir(SOURCE))["add"]
+
+    assert add(1, 2) == 3
+    assert not hasattr(add, "map")
+
+
+def test_map_compiled_on_first_call(parser):
+    jit = RyonJIT()
+    add = jit.compile(parser.parse_hlir(SOURCE))["add"]
+
+    assert isinstance(add.map, LazyMapFunction)
+    assert jit.engine.get_function_address(map_symbol("add")) == 0
+    assert add.map(array.array("i", [1]), 2) == array.array("i", [3])
+    assert jit.engine.get_function_address(map_symbol("add")) != 0
+
+
+def test_map_cached_function(parser, tmp_path):
+    hlir = parser.parse_hlir(SOURCE)
+    RyonJIT(cache=ObjectCache(tmp_path)).compile(hlir)
+    cache = ObjectCache(tmp_path)
+
+    add = RyonJIT(cache=cache).compile(hlir)["add"]
+
+    assert cache.hits == 1
+    assert add.map(array.array("i", [1, 2]), 2) == array.array("i", [3, 4])
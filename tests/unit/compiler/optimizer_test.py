@@ -0,0 +1,65 @@
+import io
+
+import llvmlite.binding as llvm
+import pytest
+
+from ryon.compiler import CodegenTarget, OptimizationLevel, RyonCompiler, RyonJIT
+from ryon.compiler.optimizer import optimize
+from ryon.compiler.target import initialize_native
+from tests.data.code_fragments import fragments
+
+SOURCE = """fn add_constants(a: I32, b: I32) -> I32:
+    return a + 1 + b + 2
+"""
+
+
+def lower(parser, source):
+    llvm_module = llvm.parse_assembly(RyonCompiler().visit(parser.parse_hlir(source)))
+    llvm_module.verify()
+    return llvm_module
+
+
+def test_optimize_o0(parser):
+    initialize_native()
+    llvm_module = lower(parser, fragments[1].code)
+    llvm_ir = str(llvm_module)
+
+    optimize(llvm_module, OptimizationLevel.O0)
+
+    assert str(llvm_module) == llvm_ir
+
+
+@pytest.mark.parametrize("level", list(OptimizationLevel))
+def test_optimize(parser, level):
+    target = CodegenTarget.host(opt_level=level)
+    llvm_module = lower(parser, SOURCE)
+
+    optimize(llvm_module, level, target.create_target_machine())
+
+    llvm_module.verify()
+    adds = str(llvm_module.get_function("add_constants")).count(" add ")
+    assert adds == (3 if level is OptimizationLevel.O0 else 2)
+
+
+def test_optimize_dump(parser):
+    initialize_native()
+    dump = io.StringIO()
+
+    optimize(lower(parser, SOURCE), OptimizationLevel.O2, dump=dump)
+
+    before, after = dump.getvalue().split("; ---- <string>: after optimization (O2) ----\n")
+    assert before.startswith("; ---- <string>: before optimization (O2) ----\n")
+    assert before.count(" add ") == 3
+    assert after.count(" add ") == 2
+
+
+@pytest.mark.parametrize("level", (OptimizationLevel.O3, OptimizationLevel.Oz))
+def test_jit_optimized(parser, level):
+    dump = io.StringIO()
+    jit = RyonJIT(CodegenTarget.host(opt_level=level), dump_ir=dump)
+
+    functions = jit.compile(parser.parse_hlir(SOURCE + "\n" + fragments[1].code))
+
+    assert functions["add_constants"](3, 4) == 10
+    assert functions["add"](3, 4) == 12
+    assert f"after optimization ({level.name})" in dump.getvalue()
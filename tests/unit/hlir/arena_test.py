@@ -0,0 +1,103 @@
+import pickle
+
+import pytest
+
+from ryon.compiler import RyonCompiler, RyonJIT
+from ryon.hlir.arena import HLIRArena
+from ryon.hlir.interner import HLIRInterner
+from ryon.hlir.nodes import ContextNode, DecimalNumber, Fn, Summation, Var
+from ryon.hlir.simplifier import simplify
+from ryon.hlir.yaml_dumper import hlir_to_yaml
+from ryon.hlir.yaml_loader import yaml_to_hlir
+from ryon.symbols.symbols import RyonSymbolizer, SymbolTable
+from tests.data.code_fragments import fragments
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_arena_round_trip(fragment):
+    hlir = yaml_to_hlir(fragment.hlir)
+
+    arena = HLIRArena.from_tree(hlir)
+
+    assert arena.to_tree() == hlir
+    assert arena.root == hlir
+    assert hlir == arena.root
+    assert hash(arena.root) == hash(hlir)
+    assert hlir_to_yaml(arena.root) == fragment.hlir
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_arena_views(fragment):
+    hlir = yaml_to_hlir(fragment.hlir)
+    root = HLIRArena.from_tree(hlir).root
+    fn = root.module_statements[0]
+
+    assert isinstance(fn, Fn)
+    assert isinstance(fn, ContextNode)
+    assert fn.get_context_name() == hlir.module_statements[0].name
+    assert fn.args == hlir.module_statements[0].args
+    assert pickle.loads(pickle.dumps(fn)) == fn
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_arena_visitors(fragment, symbol_table):
+    hlir = yaml_to_hlir(fragment.hlir)
+    root = HLIRArena.from_tree(hlir).root
+
+    RyonSymbolizer(symbol_table).visit(root)
+
+    assert RyonCompiler().visit(root) == RyonCompiler().visit(hlir)
+    assert symbol_table == fragment.symbol_table == SymbolTable(symbol_table)
+
+
+def test_arena_shares_equal_subtrees():
+    hlir = yaml_to_hlir(fragments[1].hlir)
+
+    arena = HLIRArena.from_tree(hlir)
+    fn = arena.root.module_statements[0]
+
+    # Module, Fn, SimpleType, two Args, Suite, Return, Summation, two Vars and DecimalNumber
+    assert len(arena) == 11
+    assert fn.type == fn.args[0].type
+    tree_fn = arena.to_tree().module_statements[0]
+    assert tree_fn.type is tree_fn.args[1].type
+
+
+def test_arena_deep_tree():
+    node = Var(name="a", type=None)
+    for value in range(5000):
+        node = Summation(addends=(node, DecimalNumber(value=value)))
+
+    arena = HLIRArena.from_tree(node)
+
+    assert len(arena) == 10001
+    assert arena.root.addends[1] == DecimalNumber(value=4999)
+    assert arena.to_tree().addends[0].addends[1] == DecimalNumber(value=4998)
+    assert arena.root.addends[0].addends[0].addends[1].value == 4997
+
+
+SOURCE = "fn add(a: I32, b: I32) -> I32:\n    return a + b + 1 + 2\n\nfn ten() -> I32:\n    return 10\n"
+
+
+def test_arena_views_identity(parser):
+    arena = HLIRArena.from_tree(parser.parse_hlir(SOURCE))
+    fn = arena.root.module_statements[0]
+
+    assert arena.root is arena.root
+    assert fn is arena.root.module_statements[0]
+    assert fn.body is fn.body
+    assert type(fn)(name="f", type=fn.type, args=(), body=fn.body).__class__ is Fn
+
+
+def test_arena_passes(parser):
+    hlir = parser.parse_hlir(SOURCE)
+    root = HLIRArena.from_tree(hlir).root
+
+    simplified = simplify(root)
+    assert simplified == simplify(hlir)
+    assert simplified.module_statements[1] is root.module_statements[1]
+    assert HLIRInterner().intern_tree(root) == hlir
+
+    functions = RyonJIT().compile(root)
+    assert functions["add"](3, 4) == 10
+    assert functions["ten"]() == 10
@@ -0,0 +1,56 @@
+import pytest
+
+from benchmarks.programs import ProgramGenerator
+from ryon.hlir.binary import BinaryHLIRReader, binary_to_hlir, hlir_to_binary
+from ryon.hlir.nodes import DecimalNumber, Fn, Module, Return, Suite, Summation, Var
+from ryon.hlir.yaml_loader import yaml_to_hlir
+from tests.data.code_fragments import fragments
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_binary_round_trip(fragment):
+    hlir = yaml_to_hlir(fragment.hlir)
+
+    assert binary_to_hlir(hlir_to_binary(hlir)) == hlir
+
+
+def test_binary_lazy_loading(parser, tmp_path):
+    hlir = parser.parse_hlir(ProgramGenerator(functions=20).module())
+    path = tmp_path / "module.hlir"
+    path.write_bytes(hlir_to_binary(hlir))
+
+    with BinaryHLIRReader.open(path) as reader:
+        assert len(reader) == 20
+        assert reader.function_names == [fn.name for fn in hlir.module_statements]
+        fn = reader.load_fn("function_7")
+        assert isinstance(fn, Fn)
+        assert fn == next(fn for fn in hlir.module_statements if fn.name == "function_7")
+        assert reader.load_module() == hlir
+
+        with pytest.raises(KeyError):
+            reader.load_fn("missing")
+
+
+def test_binary_deep_tree():
+    value = DecimalNumber(value=0)
+    for _ in range(10000):
+        value = Summation(addends=(value, Var(name="x", type=None)))
+    hlir = Module(module_statements=(Fn(name="f", type=None, args=(), body=Suite(statements=(Return(value),))),))
+
+    value = binary_to_hlir(hlir_to_binary(hlir)).module_statements[0].body.statements[0].expression
+    depth = 0
+    while isinstance(value, Summation):
+        value, var = value.addends
+        assert var == Var(name="x", type=None)
+        depth += 1
+    assert depth == 10000
+    assert value == DecimalNumber(value=0)
+
+
+def test_binary_invalid():
+    data = hlir_to_binary(Module(module_statements=()))
+
+    with pytest.raises(ValueError):
+        BinaryHLIRReader(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        BinaryHLIRReader(data[:4] + b"\xff\xff" + data[6:])
@@ -0,0 +1,84 @@
+import pytest
+
+from ryon.hlir.breadcrumb import EMPTY_BREADCRUMB
+from ryon.hlir.nodes import Arg, DecimalNumber, Fn, Return, SimpleType, Suite
+from ryon.hlir.visitor import Visitor
+
+
+def _fn(name):
+    return Fn(
+        name=name,
+        args=(Arg(name="a", type=SimpleType(name="I32")),),
+        type=SimpleType(name="I32"),
+        body=Suite(statements=(Return(expression=DecimalNumber(value=1)),)),
+    )
+
+
+def test_breadcrumb_push_shares_prefix():
+    fn = _fn("add")
+    suite = fn.body
+
+    parent = EMPTY_BREADCRUMB.push(fn)
+    child = parent.push(suite)
+    sibling = parent.push(fn.type)
+
+    assert len(EMPTY_BREADCRUMB) == 0
+    assert len(parent) == 1
+    assert child == (fn, suite)
+    assert sibling == (fn, fn.type)
+    assert child.parent is sibling.parent is parent
+    assert child[-1] is suite
+    assert child[0] is fn
+    assert list(reversed(child)) == [suite, fn]
+
+
+def test_breadcrumb_indexing():
+    fn = _fn("add")
+    nodes = (fn, fn.body, fn.body.statements[0], fn.body.statements[0].expression)
+    breadcrumb = EMPTY_BREADCRUMB
+    for node in nodes:
+        breadcrumb = breadcrumb.push(node)
+
+    assert [breadcrumb[index] for index in range(-4, 4)] == list(nodes * 2)
+    assert breadcrumb[1:3] == nodes[1:3]
+    assert tuple(breadcrumb) == nodes
+    with pytest.raises(IndexError):
+        breadcrumb[4]
+    with pytest.raises(IndexError):
+        breadcrumb[-5]
+    with pytest.raises(IndexError):
+        EMPTY_BREADCRUMB[-1]
+
+
+def test_breadcrumb_context():
+    outer = _fn("outer")
+    inner = _fn("inner")
+
+    breadcrumb = EMPTY_BREADCRUMB.push(outer).push(outer.body).push(inner).push(inner.body)
+
+    assert EMPTY_BREADCRUMB.context is None
+    assert breadcrumb.context.path == ("outer", "inner")
+    assert breadcrumb.context is breadcrumb.parent.context
+    assert breadcrumb.context.parent.path == ("outer",)
+
+
+def test_visit_deep_breadcrumb():
+    depth = 5000
+    root = node = Suite(statements=())
+    for _ in range(depth):
+        node = Suite(statements=(node,))
+    root = node
+
+    class DepthVisitor(Visitor):
+        def __init__(self):
+            self.max_depth = 0
+
+        def __default__(self, node, parent_data, breadcrump):
+            self.max_depth = max(self.max_depth, len(breadcrump))
+            yield
+            yield None
+
+    visitor = DepthVisitor()
+    visitor.visit(root, iterative=True)
+
+    assert visitor.max_depth == depth
@@ -1,5 +1,6 @@
 import pytest
 
+from ryon.hlir.nodes import Arg, SimpleType
 from ryon.hlir.yaml_dumper import hlir_to_yaml
 from ryon.parser.yaml_loader import yaml_to_ast
 
@@ -23,3 +24,9 @@ def test_hlir_basic_numbers(hlir_transformer, number_type):
     actual_hlir = hlir_transformer.transform(ast)
     actual_hlir_yaml = hlir_to_yaml(actual_hlir)
     assert actual_hlir_yaml == fragment.hlir(number_type)
+
+
+def test_hlir_single_argument(parser, hlir_transformer):
+    hlir = hlir_transformer.transform(parser.parse("fn identity(a: I32) -> I32:\n    return a\n"))
+
+    assert hlir.module_statements[0].args == (Arg(name="a", type=SimpleType(name="I32")),)
@@ -0,0 +1,148 @@
+import pytest
+
+from ryon.hlir.index import HLIRIndex
+from ryon.hlir.interner import HLIRInterner
+from ryon.hlir.hlir import HLIRTransformer
+from ryon.hlir.nodes import (
+    Arg,
+    ContextNode,
+    DecimalNumber,
+    ExpressionNode,
+    Fn,
+    HLIRNode,
+    Module,
+    Return,
+    SimpleType,
+    Suite,
+    Summation,
+    Var,
+)
+from ryon.instrumentation.instrumentation import count_nodes
+
+SOURCE = (
+    "fn add(a: I32, b: I32) -> I32:\n    return a + b + 5\n"
+    "\n"
+    "fn first(a: I32, b: I32) -> I32:\n    return a\n"
+    "\n"
+    "fn twice(a: I32) -> I32:\n    return a + a\n"
+)
+
+
+@pytest.fixture
+def hlir(parser):
+    return parser.parse_hlir(SOURCE)
+
+
+def test_preorder(hlir):
+    index = HLIRIndex(hlir)
+
+    assert len(index) == count_nodes(hlir)
+    assert index[0] is hlir
+    assert index[1] is hlir.module_statements[0]
+    assert index.position(hlir.module_statements[0]) == 1
+    assert index.descendants(hlir)[0] is hlir.module_statements[0]
+    assert len(index.descendants(hlir)) == len(index) - 1
+
+
+def test_of_type(hlir):
+    index = HLIRIndex(hlir)
+
+    assert [fn.name for fn in index.of_type(Fn)] == ["add", "first", "twice"]
+    assert len(index.of_type(Var)) == 5
+    assert index.of_type(ContextNode) == index.of_type(Fn)
+    assert index.of_type(HLIRNode) == index.nodes
+    assert index.of_type(ExpressionNode) == index.of_type(Summation)
+
+
+def test_of_type_within(hlir):
+    index = HLIRIndex(hlir)
+
+    add = index.fn("add")
+    assert index.of_type(Summation, within=add) == [add.body.statements[0].expression]
+    assert index.of_type(Summation, within=index.fn("first")) == []
+    assert [var.name for var in index.of_type(Var, within=index.fn("twice"))] == ["a", "a"]
+    assert index.of_type(Fn, within=add) == [add]
+    with pytest.raises(KeyError):
+        index.fn("missing")
+
+
+def test_parent_and_context(hlir):
+    index = HLIRIndex(hlir)
+    add = index.fn("add")
+    statement = add.body.statements[0]
+    number = index.of_type(DecimalNumber, within=add)[0]
+
+    assert index.parent(hlir) is None
+    assert index.parent(add) is hlir
+    assert index.parent(statement) is add.body
+    assert index.context(number) is add
+    assert index.context(add) is None
+    assert index.ancestors(number) == [statement.expression, statement, add.body, add, hlir]
+
+
+def test_shared_subtrees(parser):
+    hlir = HLIRTransformer(HLIRInterner()).transform(parser.parse(SOURCE))
+    index = HLIRIndex(hlir)
+    i32 = index.of_type(SimpleType)[0]
+
+    positions = index.positions(i32)
+
+    assert len(positions) == len(index.of_type(SimpleType)) == 8
+    assert {index.context(position).name for position in positions} == {"add", "first", "twice"}
+    assert index.position(i32) == positions[0]
+
+
+def test_not_in_tree(hlir):
+    with pytest.raises(KeyError):
+        HLIRIndex(hlir).position(Var(name="a", type=None))
+
+
+def test_lazy(hlir):
+    index = HLIRIndex(hlir)
+
+    assert index._nodes is None
+    assert isinstance(index.parent(1), Module)
+    assert index._nodes is not None
+
+
+def test_deep_tree():
+    depth = 20000
+    expression = DecimalNumber(value=1)
+    for _ in range(depth):
+        expression = Summation(addends=(expression, DecimalNumber(value=1)))
+    fn = Fn(
+        name="deep",
+        type=SimpleType(name="I32"),
+        args=(Arg(name="a", type=SimpleType(name="I32")),),
+        body=Suite(statements=(Return(expression=expression),)),
+    )
+    index = HLIRIndex(Module(module_statements=(fn,)))
+
+    assert len(index.of_type(Summation, within=fn)) == depth
+    assert index.context(index.of_type(DecimalNumber)[-1]) is fn
+
+
+def test_shared_subtree_positions(parser):
+    source = "fn add(a: I32, b: I32) -> I32:\n    return a + b\n\nfn add2(a: I32, b: I32) -> I32:\n    return a + b\n"
+    hlir = HLIRTransformer(HLIRInterner()).transform(parser.parse(source))
+    index = HLIRIndex(hlir)
+    var_positions = index.type_positions(Var)
+
+    assert len(var_positions) == 4
+    assert index.of_type(Var)[-1] is index.of_type(Var)[1]
+    assert index.context(index.of_type(Var)[-1]).name == "add"
+    assert [index.context(position).name for position in var_positions] == ["add", "add", "add2", "add2"]
+    assert [index[position] for position in var_positions] == index.of_type(Var)
+    add2 = index.type_positions(Fn)[1]
+    assert index.type_positions(Var, within=add2) == var_positions[2:]
+    assert index.ancestors(var_positions[-1])[-2] is index[add2]
+
+
+@pytest.mark.parametrize("position", (-1, 1000))
+def test_invalid_position(hlir, position):
+    index = HLIRIndex(hlir)
+
+    with pytest.raises(IndexError):
+        index.parent(position)
+    with pytest.raises(IndexError):
+        index.of_type(Var, within=position)
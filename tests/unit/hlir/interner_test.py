@@ -0,0 +1,41 @@
+from ryon.hlir.hlir import HLIRTransformer
+from ryon.hlir.interner import HLIRInterner
+from ryon.hlir.nodes import DecimalNumber, SimpleType
+from ryon.hlir.yaml_loader import yaml_to_hlir
+from ryon.parser.yaml_loader import yaml_to_ast
+from tests.data.code_fragments import fragments
+
+
+def test_interner():
+    interner = HLIRInterner()
+
+    i32 = interner(SimpleType(name="I32"))
+
+    assert interner(SimpleType(name="I32")) is i32
+    assert interner(SimpleType(name="I64")) is not i32
+    assert interner(DecimalNumber(value=5)) == DecimalNumber(value=5)
+    assert len(interner) == 3
+
+
+def test_intern_tree():
+    hlir = yaml_to_hlir(fragments[1].hlir)
+    interner = HLIRInterner()
+
+    interned = interner.intern_tree(hlir)
+    fn = interned.module_statements[0]
+
+    assert interned == hlir
+    assert interner.intern_tree(yaml_to_hlir(fragments[1].hlir)) is interned
+    assert fn.type is fn.args[0].type is fn.args[1].type
+
+
+def test_transformer_interner():
+    interner = HLIRInterner()
+    transformer = HLIRTransformer(interner=interner)
+    ast = yaml_to_ast(fragments[1].ast)
+
+    hlir = transformer.transform(ast)
+
+    assert hlir == HLIRTransformer().transform(ast)
+    assert transformer.transform(ast) is hlir
+    assert interner.intern_tree(hlir) is hlir
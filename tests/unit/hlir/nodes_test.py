@@ -0,0 +1,72 @@
+import copy
+import pickle
+
+import pytest
+
+from ryon.hlir.nodes import (
+    NODE,
+    NODE_TUPLE,
+    SCALAR,
+    Arg,
+    DecimalNumber,
+    Fn,
+    Module,
+    Return,
+    SimpleType,
+    Suite,
+    Summation,
+    Var,
+)
+
+
+@pytest.mark.parametrize(
+    "node_class, fields",
+    (
+        (Module, (("module_statements", NODE_TUPLE),)),
+        (Fn, (("name", SCALAR), ("type", NODE), ("args", NODE_TUPLE), ("body", NODE))),
+        (Arg, (("name", SCALAR), ("type", NODE))),
+        (Var, (("name", SCALAR), ("type", NODE))),
+        (Return, (("expression", NODE),)),
+        (Summation, (("addends", NODE_TUPLE),)),
+        (DecimalNumber, (("value", SCALAR),)),
+    ),
+)
+def test_schema(node_class, fields):
+    schema = node_class.schema()
+
+    assert schema.fields == fields
+    assert schema.nodes == tuple(name for name, kind in fields if kind == NODE)
+    assert schema.node_tuples == tuple(name for name, kind in fields if kind == NODE_TUPLE)
+    assert schema.scalars == tuple(name for name, kind in fields if kind == SCALAR)
+    assert node_class.schema() is schema
+
+
+def test_node_slots():
+    node = Arg(name="a", type=SimpleType(name="I32"))
+
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.name = "b"
+
+
+def test_node_equality():
+    first = Return(expression=Summation(addends=(Var(name="a", type=None), DecimalNumber(value=1))))
+    second = Return(expression=Summation(addends=(Var(name="a", type=None), DecimalNumber(value=1))))
+    third = Return(expression=Summation(addends=(Var(name="a", type=None), DecimalNumber(value=2))))
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != third
+    assert DecimalNumber(value=1) != Var(name="a", type=None)
+    assert SimpleType(name="I32") != "I32"
+
+
+def test_node_pickle():
+    node = Fn(name="f", type=SimpleType(name="I32"), args=(), body=Suite(statements=()))
+    hash(node)
+
+    unpickled = pickle.loads(pickle.dumps(node))
+
+    assert unpickled == node
+    assert hash(unpickled) == hash(node)
+    assert copy.deepcopy(node) == node
@@ -0,0 +1,91 @@
+import pytest
+
+from ryon.compiler import RyonCompiler
+from ryon.hlir.nodes import Arg, DecimalNumber, Fn, Return, SimpleType, Suite, Summation, Var
+from ryon.hlir.simplifier import simplify
+from ryon.hlir.yaml_loader import yaml_to_hlir
+from tests.data.code_fragments import fragments
+
+A = Var(name="a", type=None)
+B = Var(name="b", type=None)
+
+
+def number(value):
+    return DecimalNumber(value=value)
+
+
+def simplify_returned(expression, type_name="I32"):
+    """Simplifies an expression returned by a function of two arguments of a type, returns the simplified expression."""
+    type_ = SimpleType(name=type_name)
+    fn = Fn(
+        name="f",
+        type=type_,
+        args=(Arg(name="a", type=type_), Arg(name="b", type=type_)),
+        body=Suite(statements=(Return(expression=expression),)),
+    )
+    return simplify(fn).body.statements[0].expression
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_simplify_unchanged(fragment):
+    hlir = yaml_to_hlir(fragment.hlir)
+
+    assert simplify(hlir) is hlir
+
+
+@pytest.mark.parametrize(
+    "summation, expected",
+    (
+        (Summation(addends=(number(1), number(2), number(3))), number(6)),
+        (Summation(addends=(A, number(1), B, number(2))), Summation(addends=(A, B, number(3)))),
+        (Summation(addends=(number(2), A)), Summation(addends=(A, number(2)))),
+        (Summation(addends=(A, number(0))), A),
+        (Summation(addends=(number(0), number(0))), number(0)),
+        (
+            Summation(addends=(Summation(addends=(A, number(1))), Summation(addends=(B, number(2))), number(3))),
+            Summation(addends=(A, B, number(6))),
+        ),
+        (Summation(addends=(Summation(addends=(number(1), number(2))), A)), Summation(addends=(A, number(3)))),
+    ),
+)
+def test_simplify_summation(summation, expected):
+    assert simplify_returned(summation) == expected
+
+
+@pytest.mark.parametrize("type_name", ("F32", "F64"))
+def test_simplify_float_summation_unchanged(type_name):
+    summation = Summation(addends=(Summation(addends=(A, number(1))), B, number(2)))
+
+    assert simplify_returned(summation, type_name) is summation
+
+
+def test_simplify_summation_outside_fn_unchanged():
+    summation = Summation(addends=(A, number(1), number(2)))
+
+    assert simplify(summation) is summation
+
+
+def test_simplify_summation_constant_overflow():
+    summation = Summation(addends=(A, number(2**31 - 1), number(1)))
+
+    assert simplify_returned(summation) is summation
+    assert simplify_returned(Summation(addends=(number(2**31 - 1), number(-1), A))) == Summation(
+        addends=(A, number(2**31 - 2))
+    )
+
+
+def test_simplify_deep():
+    summation = A
+    for _ in range(5000):
+        summation = Summation(addends=(summation, number(1)))
+
+    assert simplify_returned(summation) == Summation(addends=(A, number(5000)))
+
+
+def test_simplify_codegen(parser):
+    hlir = parser.parse_hlir("fn six(a: I32, b: I32) -> I32:\n    return 1 + 2 + 3\n")
+
+    llvm_ir = RyonCompiler().visit(simplify(hlir))
+
+    assert "ret i32 6" in llvm_ir
+    assert " add " not in llvm_ir
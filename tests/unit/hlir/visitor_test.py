@@ -132,3 +132,113 @@ def test_visit_complex_node(fragment, call_count, calls, children_data):
     assert visitor.children_data == children_data
 
     assert result == "This is module - final"
+
+
+def test_dispatch_table_per_visitor_class():
+    hlir = yaml_to_hlir(fragments[0].hlir)
+
+    class FirstVisitor(Visitor):
+        def decimal_number(self, node, parent_data, breadcrump):
+            return "first"
+
+        def __default__(self, node, parent_data, breadcrump):
+            return parent_data
+
+    class SecondVisitor(FirstVisitor):
+        def decimal_number(self, node, parent_data, breadcrump):
+            return "second"
+
+    FirstVisitor().visit(hlir)
+    SecondVisitor().visit(hlir)
+
+    assert FirstVisitor._dispatch_table[DecimalNumber] is FirstVisitor.decimal_number
+    assert SecondVisitor._dispatch_table[DecimalNumber] is SecondVisitor.decimal_number
+    assert SecondVisitor._dispatch_table[Fn] is FirstVisitor.__default__
+    assert Visitor._dispatch_table == {}
+
+
+@pytest.mark.parametrize("iterative", (False, True))
+def test_visit_method_kinds(iterative):
+    hlir = yaml_to_hlir(fragments[0].hlir)
+
+    class KindsVisitor(Visitor):
+        @staticmethod
+        def decimal_number(node, parent_data, breadcrump):
+            return f"static {node.value}"
+
+        @classmethod
+        def return_(cls, node, parent_data, breadcrump):
+            children_data = yield
+            yield f"{cls.__name__} {children_data['expression']}"
+
+        def __default__(self, node, parent_data, breadcrump):
+            children_data = yield
+            yield children_data
+
+    visitor = KindsVisitor()
+    result = visitor.visit(hlir, iterative=iterative)
+    statement = result["module_statements"][0]["body"]["statements"][0]
+    assert statement == "KindsVisitor static 10"
+
+    visitor.decimal_number = lambda node, parent_data, breadcrump: "instance"
+    result = visitor.visit(hlir, iterative=iterative)
+    assert result["module_statements"][0]["body"]["statements"][0] == "KindsVisitor instance"
+
+
+@pytest.mark.parametrize("iterative", (False, True))
+def test_visit_instance_default(iterative):
+    hlir = yaml_to_hlir(fragments[0].hlir)
+    visitor = Visitor()
+    visitor.__default__ = lambda node, parent_data, breadcrump: node.__class__.__name__
+
+    assert visitor.visit(hlir, iterative=iterative) == "Module"
+
+
+class EventVisitor(Visitor):
+    def __init__(self):
+        self.events = []
+
+    def summation(self, node, parent_data, breadcrump):
+        self.events.append(("enter", "Summation", parent_data, len(breadcrump)))
+        children_data = yield "summation"
+        self.events.append(("exit", "Summation", children_data))
+        yield sum(addend for addend in children_data["addends"])
+
+    def fn(self, node, parent_data, breadcrump):
+        self.events.append(("enter", "Fn", parent_data, len(breadcrump)))
+        children_data = yield node.name
+        self.events.append(("exit", "Fn", children_data))
+
+    def var(self, node, parent_data, breadcrump):
+        self.events.append(("enter", "Var", parent_data, len(breadcrump)))
+        return 1
+
+    def decimal_number(self, node, parent_data, breadcrump):
+        self.events.append(("enter", "DecimalNumber", parent_data, len(breadcrump)))
+        return node.value
+
+    def __default__(self, node, parent_data, breadcrump):
+        self.events.append(("enter", node.__class__.__name__, parent_data, len(breadcrump)))
+        return node.__class__.__name__
+
+
+@pytest.mark.parametrize("fragment", fragments)
+def test_visit_iterative(fragment):
+    hlir = yaml_to_hlir(fragment.hlir)
+    recursive, iterative = EventVisitor(), EventVisitor()
+
+    assert iterative.visit(hlir, iterative=True) == recursive.visit(hlir)
+    assert iterative.events == recursive.events
+
+
+def test_visit_iterative_deep_tree():
+    depth = 5000
+    node = Var(name="a", type=None)
+    for _ in range(depth):
+        node = Summation(addends=(node, DecimalNumber(value=1)))
+
+    visitor = EventVisitor()
+    visitor.visit(node, iterative=True)
+
+    assert len(visitor.events) == 3 * depth + 1
+    assert visitor.events[-1] == ("exit", "Summation", {"addends": (depth, 1)})
@@ -1,11 +1,15 @@
 import textwrap
 
-from ryon.hlir.yaml_dumper import hlir_to_yaml
+import pytest
+
+from ryon.hlir.yaml_dumper import CYAMLHLIRDumper, YAMLHLIRDumper, hlir_to_yaml, hlir_to_yaml_stream
+from ryon.hlir.yaml_loader import yaml_stream_to_hlir
 
 from ryon.hlir.nodes import Module, Fn, SimpleType, Return, Suite, DecimalNumber
 
 
-def test_hlir_to_yaml():
+@pytest.mark.parametrize("dumper", [YAMLHLIRDumper, CYAMLHLIRDumper])
+def test_hlir_to_yaml(dumper):
     hlir = Module(
         module_statements=(
             Fn(
@@ -17,7 +21,7 @@ def test_hlir_to_yaml():
         )
     )
 
-    output = hlir_to_yaml(hlir)
+    output = hlir_to_yaml(hlir, dumper)
 
     expected_output = textwrap.dedent("""
         !node.Module
@@ -35,3 +39,21 @@ def test_hlir_to_yaml():
     """).strip()
 
     assert output.strip() == expected_output, "YAML output does not match expected"
+
+
+@pytest.mark.parametrize("dumper", [YAMLHLIRDumper, CYAMLHLIRDumper])
+def test_hlir_to_yaml_stream(dumper, tmp_path):
+    fns = tuple(
+        Fn(name=name, type=SimpleType("I32"), args=(), body=Suite(statements=(Return(expression=DecimalNumber(5)),)))
+        for name in ("first", "second")
+    )
+    hlir = Module(module_statements=fns)
+
+    path = tmp_path / "module.yaml"
+    with path.open("w") as stream:
+        hlir_to_yaml_stream(hlir, stream, dumper)
+
+    assert hlir_to_yaml_stream(hlir, dumper=dumper) == path.read_text()
+    assert path.read_text().count("--- !node.Fn\n") == 2
+    with path.open() as stream:
+        assert tuple(yaml_stream_to_hlir(stream)) == fns
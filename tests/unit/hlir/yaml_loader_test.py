@@ -1,11 +1,16 @@
+import textwrap
+
+import pytest
+
 from ryon.hlir.nodes import HLIRNode
 
-from ryon.hlir.yaml_loader import yaml_to_hlir
+from ryon.hlir.yaml_loader import CYAMLHLIRLoader, YAMLHLIRLoader, yaml_stream_to_hlir, yaml_to_hlir
 
 from ryon.hlir.nodes import Module, Fn, SimpleType, Return, Suite, DecimalNumber
 
 
-def test_yaml_to_hlir():
+@pytest.mark.parametrize("loader", [YAMLHLIRLoader, CYAMLHLIRLoader])
+def test_yaml_to_hlir(loader):
     yaml_data = """
         !node.Module
         module_statements:
@@ -20,7 +25,7 @@ def test_yaml_to_hlir():
                     expression: !node.DecimalNumber
                         value: 5
     """
-    actual = yaml_to_hlir(yaml_data)
+    actual = yaml_to_hlir(yaml_data, loader)
     assert isinstance(actual, HLIRNode)
     expected = Module(
         module_statements=(
@@ -34,3 +39,27 @@ def test_yaml_to_hlir():
     )
 
     assert actual == expected
+
+
+@pytest.mark.parametrize("loader", [YAMLHLIRLoader, CYAMLHLIRLoader])
+def test_yaml_stream_to_hlir(loader):
+    yaml_data = """
+        --- !node.Fn
+        name: first
+        type: !node.SimpleType
+            name: I32
+        args: []
+        body: !node.Suite
+            statements: []
+        --- !node.Fn
+        name: second
+        type: !node.SimpleType
+            name: I32
+        args: []
+        body: !node.Suite
+            statements: []
+    """
+    actual = yaml_stream_to_hlir(textwrap.dedent(yaml_data), loader)
+
+    assert next(actual) == Fn(name="first", type=SimpleType("I32"), args=(), body=Suite(statements=()))
+    assert [fn.name for fn in actual] == ["second"]
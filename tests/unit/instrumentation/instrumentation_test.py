@@ -0,0 +1,130 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from ryon.compiler import RyonJIT
+from ryon.instrumentation import Instrumentation, phase
+from ryon.instrumentation.instrumentation import FN, LLVM, PARSER, VISITOR, count_nodes
+from tests.data.code_fragments import fragments
+
+SOURCE = fragments[1].code + "\nfn increment(a: I32) -> I32:\n    return a + 1\n"
+
+
+def test_disabled():
+    first = phase("parse", PARSER)
+    second = phase("optimize", LLVM)
+
+    assert first is second
+    with first as span:
+        span.nodes(None)
+
+
+def test_phases(parser):
+    with Instrumentation(count_nodes=True) as instrumentation:
+        hlir = parser.parse_hlir(SOURCE)
+        RyonJIT().compile(hlir)
+
+    categories = {(event.category, event.name) for event in instrumentation.events}
+    assert {
+        (PARSER, "parse_hlir"),
+        (VISITOR, "HLIRSimplifier"),
+        (VISITOR, "RyonCompiler"),
+        (LLVM, "verify"),
+        (LLVM, "codegen"),
+    } <= categories
+    assert not any(event.category == FN for event in instrumentation.events)
+    parse_event = next(event for event in instrumentation.events if event.name == "parse_hlir")
+    assert parse_event.args["nodes"] == count_nodes(hlir)
+    assert all(event.duration >= 0 for event in instrumentation.events)
+
+
+def test_disabled_after_exit(parser):
+    with Instrumentation() as instrumentation:
+        parser.parse_hlir(SOURCE)
+    recorded = len(instrumentation.events)
+
+    parser.parse_hlir(SOURCE)
+
+    assert len(instrumentation.events) == recorded == 1
+
+
+def test_per_fn(parser):
+    with Instrumentation(per_fn=True) as instrumentation:
+        RyonJIT().compile(parser.parse_hlir(SOURCE))
+
+    assert [event.name for event in instrumentation.events if event.category == FN] == ["add", "increment"]
+
+
+def test_nested_instrumentations(parser):
+    with Instrumentation() as outer:
+        with Instrumentation() as inner:
+            parser.parse_hlir(SOURCE)
+        parser.parse(SOURCE)
+
+    assert [event.name for event in inner.events] == ["parse_hlir"]
+    assert [event.name for event in outer.events] == ["parse"]
+
+
+def test_trace_memory(parser):
+    with Instrumentation(trace_memory=True) as instrumentation:
+        with phase("outer", PARSER):
+            data = [bytearray(2**20)]
+            with phase("inner", PARSER):
+                data.append(bytearray(2**20))
+
+    peaks = {event.name: event.args["memory_peak"] for event in instrumentation.events}
+    assert peaks["inner"] >= 2**20
+    assert peaks["outer"] >= 2 * 2**20
+
+
+def test_trace_memory_threads():
+    def run(index):
+        for _ in range(50):
+            with phase(f"thread_{index}", PARSER):
+                data = bytearray(2**16)
+                with phase("inner", PARSER):
+                    data += bytearray(2**16)
+
+    with Instrumentation(trace_memory=True) as instrumentation:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(run, range(8)))
+
+    assert len(instrumentation.events) == 8 * 50 * 2
+    assert instrumentation._memory_stack == []
+    assert all(event.args["memory_peak"] >= 2**16 for event in instrumentation.events)
+
+
+def test_instrumentation_threads():
+    instrumentations = [Instrumentation() for _ in range(8)]
+
+    def run(instrumentation):
+        for _ in range(20):
+            with instrumentation:
+                pass
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(run, instrumentations))
+
+    assert phase("parse", PARSER) is phase("optimize", LLVM)
+
+
+def test_chrome_trace(parser, tmp_path):
+    with Instrumentation(per_fn=True, count_nodes=True) as instrumentation:
+        RyonJIT().compile(parser.parse_hlir(SOURCE))
+
+    trace = json.loads(instrumentation.write_chrome_trace(tmp_path / "trace.json").read_text())
+
+    assert len(trace["traceEvents"]) == len(instrumentation.events)
+    for event in trace["traceEvents"]:
+        assert event["ph"] == "X"
+        assert {"name", "cat", "ts", "dur", "pid", "tid", "args"} <= event.keys()
+
+
+def test_summary(parser):
+    with Instrumentation(per_fn=True, count_nodes=True) as instrumentation:
+        RyonJIT().compile(parser.parse_hlir(SOURCE))
+
+    lines = instrumentation.summary().splitlines()
+
+    assert lines[0].split()[:3] == ["category", "name", "calls"]
+    assert any(line.split()[:3] == [FN, "add", "1"] for line in lines[1:])
+    assert len(instrumentation.summary(limit=2).splitlines()) == 3
@@ -0,0 +1,70 @@
+import pytest
+
+from ryon.parser.incremental import TextEdit
+
+SOURCE = """fn one(a: I32) -> I32:
+    return a + 1
+
+fn two(a: I32) -> I32:
+    return a + 2
+
+# comment
+fn three(a: I32) -> I32:
+    return a + 3
+"""
+
+
+def _edit(source, old, new):
+    start = source.index(old)
+    return TextEdit(start=start, end=start + len(old), text=new)
+
+
+def test_parse_incremental(parser):
+    parsed = parser.parse_incremental(SOURCE)
+
+    assert parsed.hlir == parser.parse_hlir(SOURCE)
+    assert parsed.starts == (0, SOURCE.index("fn two"), SOURCE.index("fn three"))
+
+
+def test_reparse_function_body(parser):
+    parsed = parser.parse_incremental(SOURCE)
+    one, two, three = parsed.hlir.module_statements
+
+    edited = parser.reparse(parsed, _edit(SOURCE, "a + 2", "a + 20 + 2"))
+
+    assert edited.source == SOURCE.replace("a + 2", "a + 20 + 2")
+    assert edited.hlir == parser.parse_hlir(edited.source)
+    assert edited.hlir.module_statements[0] is one
+    assert edited.hlir.module_statements[1] is not two
+    assert edited.hlir.module_statements[2] is three
+    assert edited.starts[2] == edited.source.index("fn three")
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    (
+        ("fn two", "fn four(b: I32) -> I32:\n    return b\n\nfn two"),
+        ("fn two(a: I32) -> I32:\n    return a + 2\n\n", ""),
+        ("\n\n# comment\n", "\n"),
+        ("fn one", "fn zero() -> I32:\n    return 0\nfn one"),
+        ("return a + 3\n", "return a + 3\nfn four() -> I32:\n    return 4\n"),
+    ),
+)
+def test_reparse_structural_edit(parser, old, new):
+    parsed = parser.parse_incremental(SOURCE)
+
+    edited = parser.reparse(parsed, _edit(SOURCE, old, new))
+
+    assert edited.hlir == parser.parse_hlir(edited.source)
+    assert edited == parser.parse_incremental(edited.source)
+
+
+def test_reparse_sequence(parser):
+    parsed = parser.parse_incremental(SOURCE)
+
+    for old, new in (("a + 1", "a"), ("three", "third"), ("a + 3", "a + 1 + 2")):
+        parsed = parser.reparse(parsed, _edit(parsed.source, old, new))
+
+    assert parsed.hlir == parser.parse_hlir(
+        SOURCE.replace("a + 1", "a").replace("three", "third").replace("a + 3", "a + 1 + 2")
+    )
@@ -1,6 +1,11 @@
+import pickle
+
 import pytest
+from lark import Lark
 
 from ryon.parser import RyonParser
+from ryon.parser import parser as parser_module
+from ryon.parser.parser import PREBUILT_TABLES_PATH, build_parser_tables, grammar_fingerprint
 from ryon.parser.yaml_dumper import ast_to_yaml
 from tests.data.code_fragments import fragments, NumberCodeFragment
 
@@ -26,3 +31,91 @@ def test_parser_basic_numbers(parser, number_type):
     actual = ast_to_yaml(ast)
 
     assert actual == fragment.ast(number_type), f"Failed parsing {number_type}: {fragment.code}"
+
+
+def test_parser_cache(tmp_path):
+    fragment = fragments[1]
+    cache_path = tmp_path / "tables.lark-cache"
+
+    cold = RyonParser(cache=cache_path)
+    assert cache_path.exists()
+    warm = RyonParser(cache=cache_path)
+
+    assert warm.parse(fragment.code) == cold.parse(fragment.code) == RyonParser(cache=False).parse(fragment.code)
+
+
+def test_parser_default_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("RYON_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(parser_module, "PREBUILT_TABLES_PATH", tmp_path / "missing.tables")
+
+    RyonParser()
+
+    assert (tmp_path / f"main-{grammar_fingerprint()}.lark-cache").exists()
+
+
+def test_build_parser_tables(tmp_path, monkeypatch):
+    fragment = fragments[1]
+    tables_path = build_parser_tables(tmp_path / "main.lark.tables")
+    monkeypatch.setattr(parser_module, "PREBUILT_TABLES_PATH", tables_path)
+    monkeypatch.setenv("RYON_CACHE_DIR", str(tmp_path / "cache"))
+
+    parser = RyonParser()
+
+    assert ast_to_yaml(parser.parse(fragment.code)) == fragment.ast
+    assert parser.parse_hlir(fragment.code) == RyonParser(cache=False).parse_hlir(fragment.code)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_parser_tables_relocated(tmp_path):
+    fragment = fragments[1]
+    tables = build_parser_tables(tmp_path / "a.tables").read_bytes()
+    relocated_path = tmp_path / "b.tables"
+    relocated_path.write_bytes(tables)
+
+    parser = RyonParser(cache=relocated_path)
+
+    assert relocated_path.read_bytes() == tables
+    assert ast_to_yaml(parser.parse(fragment.code)) == fragment.ast
+
+
+def test_parser_stale_prebuilt_tables(tmp_path, monkeypatch):
+    fragment = fragments[1]
+    stale_path = tmp_path / "main.lark.tables"
+    stale_path.write_bytes(b"0" * 64 + b"\n")
+    monkeypatch.setattr(parser_module, "PREBUILT_TABLES_PATH", stale_path)
+    monkeypatch.setenv("RYON_CACHE_DIR", str(tmp_path / "cache"))
+
+    parser = RyonParser()
+
+    assert stale_path.read_bytes() == b"0" * 64 + b"\n"
+    assert (tmp_path / "cache" / f"main-{grammar_fingerprint()}.lark-cache").exists()
+    assert ast_to_yaml(parser.parse(fragment.code)) == fragment.ast
+
+
+def test_prebuilt_tables_match_grammar():
+    # Regenerate with `python -c "from ryon.parser.parser import build_parser_tables; build_parser_tables()"`.
+    assert PREBUILT_TABLES_PATH.read_bytes().split(b"\n", 1)[0] == grammar_fingerprint().encode("ascii")
+
+
+@pytest.mark.parametrize("payload", (b"not a pickle", pickle.dumps({"data": {}, "memo": {}}), pickle.dumps(None)))
+def test_parser_malformed_tables(tmp_path, payload):
+    fragment = fragments[1]
+    cache_path = tmp_path / "tables.lark-cache"
+    cache_path.write_bytes(grammar_fingerprint().encode("ascii") + b"\n" + payload)
+
+    parser = RyonParser(cache=cache_path)
+
+    assert ast_to_yaml(parser.parse(fragment.code)) == fragment.ast
+    assert RyonParser(cache=cache_path).parse(fragment.code) == parser.parse(fragment.code)
+
+
+def test_save_tables_failure_removes_partial_file(tmp_path, monkeypatch):
+    def failing_save(self, f, exclude_options=()):
+        f.write(b"partial")
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(Lark, "save", failing_save)
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        build_parser_tables(tmp_path / "main.lark.tables")
+    assert list(tmp_path.iterdir()) == []
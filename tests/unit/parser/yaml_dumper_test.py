@@ -1,14 +1,16 @@
+import pytest
 from lark import Tree, Token
 
 # Import the functions from your module
-from ryon.parser.yaml_dumper import ast_to_yaml
+from ryon.parser.yaml_dumper import CYAMLASTDumper, YAMLASTDumper, ast_to_yaml
 
 
-def test_tree_to_yaml():
+@pytest.mark.parametrize("dumper", [YAMLASTDumper, CYAMLASTDumper])
+def test_tree_to_yaml(dumper):
     token = Token("STRING", "hello")
     tree = Tree("greeting", [token])
 
-    output = ast_to_yaml(tree)
+    output = ast_to_yaml(tree, dumper)
 
     expected_output = "!Tree\n" "node: greeting\n" "subtree:\n" "- !Token 'STRING hello'\n"
 
@@ -1,16 +1,18 @@
+import pytest
 from lark import Tree, Token
 
-from ryon.parser.yaml_loader import yaml_to_ast
+from ryon.parser.yaml_loader import CYAMLASTLoader, YAMLASTLoader, yaml_to_ast
 
 
-def test_yaml_to_tree():
+@pytest.mark.parametrize("loader", [YAMLASTLoader, CYAMLASTLoader])
+def test_yaml_to_tree(loader):
     yaml_data = """
     !Tree
     subtree:
       - !Token "STRING hello"
     node: greeting
     """
-    result = yaml_to_ast(yaml_data)
+    result = yaml_to_ast(yaml_data, loader)
     assert isinstance(result, Tree)
     assert result.data == "greeting"
     assert isinstance(result.children[0], Token)
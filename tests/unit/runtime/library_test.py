@@ -0,0 +1,60 @@
+import array
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from ryon.compiler import RyonAOTCompiler
+from ryon.runtime import RyonLibrary
+from ryon.runtime.signatures import format_signatures, parse_signatures
+from tests.data.code_fragments import fragments
+
+pytestmark = pytest.mark.skipif(shutil.which("cc") is None, reason="no C compiler")
+
+SOURCE = "\n".join(fragment.code for fragment in fragments) + "\nfn wide(a: U128, b: U128) -> U128:\n    return a + b\n"
+
+
+@pytest.fixture
+def library_path(parser, tmp_path):
+    return RyonAOTCompiler().emit_shared_library(parser.parse_hlir(SOURCE), tmp_path / "libfragments.so")
+
+
+def test_signatures():
+    signatures = [("add", "I32", ("I32", "I32")), ("hello_world", "I32", ())]
+
+    assert parse_signatures(format_signatures(signatures)) == signatures
+    with pytest.raises(ValueError):
+        parse_signatures("something else\n")
+
+
+def test_library(library_path):
+    library = RyonLibrary(library_path)
+
+    assert library.signatures["wide"] == ("wide", "U128", ("U128", "U128"))
+    assert sorted(library) == ["add", "hello_world"]
+    assert not hasattr(library["add"], "map")
+    for fragment in fragments:
+        for name, _, args, expected_return in fragment.functions:
+            assert library[name](*args) == expected_return
+
+
+def test_library_map(parser, tmp_path):
+    library_path = RyonAOTCompiler(map_wrappers=True).emit_shared_library(
+        parser.parse_hlir(SOURCE), tmp_path / "libfragments.so"
+    )
+    library = RyonLibrary(library_path)
+    a = array.array("i", range(5))
+
+    assert library["add"].map(a, 1) == array.array("i", [library["add"](x, 1) for x in a])
+
+
+def test_library_without_llvm(library_path):
+    code = (
+        "import sys\n"
+        "from ryon.runtime import RyonLibrary\n"
+        f"assert RyonLibrary({str(library_path)!r})['add'](3, 4) == 12\n"
+        "assert 'llvmlite' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,6 +1,8 @@
 import pytest
 
+from ryon.hlir.nodes import SimpleType
 from ryon.hlir.yaml_loader import yaml_to_hlir
+from ryon.symbols.symbols import RyonSymbolizer, Scope, Symbol, SymbolTable
 from tests.data.code_fragments import fragments
 
 
@@ -11,3 +13,40 @@ def test_symbolizer(symbolizer, symbol_table, fragment):
     symbolizer.visit(hlir)
 
     assert symbol_table == fragment.symbol_table
+
+
+def test_symbolizer_scopes():
+    fragment_with_args = fragments[1]
+    symbolizer = RyonSymbolizer()
+
+    symbolizer.visit(yaml_to_hlir(fragment_with_args.hlir))
+
+    function = symbolizer.scope.children["add"]
+    assert function.path == ("add",)
+    assert set(function.symbols) == {"a", "b"}
+    assert function.lookup("a") is function.symbols["a"]
+    assert function.lookup("missing") is None
+    assert SymbolTable.from_scope(symbolizer.scope) == fragment_with_args.symbol_table
+
+
+def test_scope_lookup_walks_enclosing_scopes():
+    module = Scope()
+    outer = module.child("outer")
+    inner = outer.child("inner")
+    outer.define("a").type = SimpleType(name="I32")
+    inner.define("a").type = SimpleType(name="I64")
+    outer.define("b").type = SimpleType(name="F64")
+
+    assert inner.lookup("a").type == SimpleType(name="I64")
+    assert inner.lookup("b") is outer.symbols["b"]
+    assert outer.lookup("a").type == SimpleType(name="I32")
+    assert module.find(("outer", "inner")) is inner
+    assert module.find(("inner",)) is None
+    assert [scope.path for scope in module.walk()] == [(), ("outer",), ("outer", "inner")]
+    assert SymbolTable.from_scope(module) == SymbolTable(
+        {
+            ("outer", "a"): Symbol(type=SimpleType(name="I32")),
+            ("outer", "b"): Symbol(type=SimpleType(name="F64")),
+            ("outer", "inner", "a"): Symbol(type=SimpleType(name="I64")),
+        }
+    )